@@ -0,0 +1,49 @@
+# _*_ coding: utf-8 _*_
+"""Cache round trip of parsed resources (i.e. stored in Redis), ``json()`` ->
+``parse_raw`` (orjson), pickle and schema aware binary format
+(``to_bytes()`` -> ``from_bytes()``), size and speed."""
+
+import pickle
+import sys
+
+import common
+
+from fhir.resources.bundle import Bundle
+from fhir.resources.explanationofbenefit import ExplanationOfBenefit
+from fhir.resources.observation import Observation
+from fhir.resources.patient import Patient
+
+
+def main():
+    """ """
+    # local stand-in for a key/value cache
+    cache = dict()
+    for klass, data, number in (
+        (Patient, common.load_fixture("Patient-with-ext.json"), 100),
+        (Observation, common.load_fixture("Observation.json"), 100),
+        (ExplanationOfBenefit, common.load_fixture("ExplanationOfBenefit.json"), 100),
+        (Bundle, common.make_bundle(100), 2),
+    ):
+        model = klass.parse_obj(data)
+        formats = (
+            ("json (orjson)", lambda: model.json(return_bytes=True), klass.parse_raw),
+            ("pickle", lambda: pickle.dumps(model, protocol=5), pickle.loads),
+            ("to_bytes", model.to_bytes, klass.from_bytes),
+        )
+        title = f"{klass.__name__} store/load"
+        sys.stdout.write(f"\n{title}\n{'-' * len(title)}\n")
+        for label, dumps, loads in formats:
+            cache[label] = dumps()
+            assert loads(cache[label]) == model
+            store = common.measure(
+                lambda: cache.__setitem__(label, dumps()), number=number
+            )
+            load = common.measure(lambda: loads(cache[label]), number=number)
+            sys.stdout.write(
+                f"{label:<16} {len(cache[label]):>9} bytes  "
+                f"store {store * 1000:>8.3f} ms  load {load * 1000:>8.3f} ms\n"
+            )
+
+
+if __name__ == "__main__":
+    main()
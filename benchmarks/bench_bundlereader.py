@@ -0,0 +1,102 @@
+# _*_ coding: utf-8 _*_
+"""Whole document parsing versus streaming Bundle reader (``iter_entries``),
+also for a Bundle with a single large (several MB) entry."""
+
+import base64
+import io
+import json
+import tempfile
+
+import common
+from lxml import etree
+
+from fhir.resources.bundle import Bundle, iter_entries
+from fhir.resources.core.utils.xml import Node
+
+
+def main(size: int = 1000):
+    """ """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        json_file = common.pathlib.Path(tmpdir) / "bundle.json"
+        xml_file = common.pathlib.Path(tmpdir) / "bundle.xml"
+        bundle = Bundle.parse_obj(common.make_bundle(size))
+        json_file.write_bytes(bundle.json(return_bytes=True))
+        xml_file.write_text(bundle.xml())
+        del bundle
+
+        def parse_json():
+            return len(Bundle.parse_file(json_file).entry)
+
+        def stream_json():
+            return sum(1 for _ in iter_entries(json_file))
+
+        def parse_xml_tree():
+            root = etree.fromstring(xml_file.read_bytes())
+            return len(Node.from_element(root).to_fhir(Bundle).entry)
+
+        def parse_xml():
+            return len(Bundle.parse_file(xml_file, content_type="text/xml").entry)
+
+        def stream_xml():
+            return sum(1 for _ in iter_entries(xml_file))
+
+        assert parse_json() == stream_json() == parse_xml_tree() == size
+        assert parse_xml() == stream_xml() == size
+        title = f"Bundle ({size} entries) reading"
+        rows = [
+            ("Bundle.parse_file (json)", parse_json),
+            ("iter_entries (json)", stream_json),
+            ("whole document Node tree (xml)", parse_xml_tree),
+            ("Bundle.parse_file (xml, iterparse)", parse_xml),
+            ("iter_entries (xml)", stream_xml),
+        ]
+        common.report(
+            title, [(label, common.measure(f, repeat=3)) for label, f in rows]
+        )
+        common.report_memory(rows)
+
+
+def main_large_entry(sizes=(2, 8, 16)):
+    """Scan time of streaming reader must grow linearly with entry size."""
+    rows = list()
+    for size in sizes:
+        data = base64.b64encode(b"\x00" * (size * 1024 * 1024 * 3 // 4)).decode()
+        raw = json.dumps(
+            {
+                "resourceType": "Bundle",
+                "type": "collection",
+                "entry": [
+                    {
+                        "resource": {
+                            "resourceType": "Binary",
+                            "contentType": "application/octet-stream",
+                            "data": data,
+                        }
+                    }
+                ],
+            }
+        ).encode()
+        rows.append(
+            (
+                f"iter_entries ({size} MB entry)",
+                common.measure(
+                    lambda raw=raw: sum(1 for _ in iter_entries(io.BytesIO(raw))),
+                    number=1,
+                    repeat=3,
+                ),
+            )
+        )
+        rows.append(
+            (
+                f"Bundle.parse_raw ({size} MB entry)",
+                common.measure(
+                    lambda raw=raw: Bundle.parse_raw(raw), number=1, repeat=3
+                ),
+            )
+        )
+    common.report("Bundle with single large entry", rows)
+
+
+if __name__ == "__main__":
+    main()
+    main_large_entry()
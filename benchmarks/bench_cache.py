@@ -0,0 +1,81 @@
+# _*_ coding: utf-8 _*_
+"""Repeated payloads (retries, polling clients), plain ``parse_raw`` versus
+``ValidationCache`` hits (shared frozen model and mutable clone), followed by
+a mixed workload where only some payloads repeat."""
+
+import random
+import sys
+
+import common
+import orjson
+
+from fhir.resources.core.utils.cache import ValidationCache
+from fhir.resources.explanationofbenefit import ExplanationOfBenefit
+from fhir.resources.patient import Patient
+
+
+def main():
+    """ """
+    for klass, fixture in (
+        (Patient, "Patient-with-ext.json"),
+        (ExplanationOfBenefit, "ExplanationOfBenefit.json"),
+    ):
+        raw = orjson.dumps(common.load_fixture(fixture))
+        cache = ValidationCache()
+        common.report(
+            klass.__name__,
+            [
+                (
+                    "parse_raw()",
+                    common.measure(lambda: klass.parse_raw(raw), number=100),
+                ),
+                (
+                    "parse_raw(cache=...) frozen hit",
+                    common.measure(
+                        lambda: klass.parse_raw(raw, cache=cache, frozen=True),
+                        number=100,
+                    ),
+                ),
+                (
+                    "parse_raw(cache=...) clone hit",
+                    common.measure(
+                        lambda: klass.parse_raw(raw, cache=cache), number=100
+                    ),
+                ),
+            ],
+        )
+
+    # 1000 requests over 200 distinct payloads, cache keeps 100 of them
+    data = common.load_fixture("Patient-with-ext.json")
+    payloads = list()
+    for index in range(200):
+        data["id"] = f"p{index}"
+        payloads.append(orjson.dumps(data))
+    rnd = random.Random(7)
+    requests = [payloads[int(rnd.expovariate(1 / 60)) % 200] for _ in range(1000)]
+    cache = ValidationCache(maxsize=100)
+
+    def run_cached():
+        for raw in requests:
+            Patient.parse_raw(raw, cache=cache, frozen=True)
+
+    def run_plain():
+        for raw in requests:
+            Patient.parse_raw(raw)
+
+    common.report(
+        "Patient mixed workload (1000 requests)",
+        [
+            ("parse_raw()", common.measure(run_plain, repeat=3)),
+            (
+                "parse_raw(cache=ValidationCache(100))",
+                common.measure(run_cached, repeat=3),
+            ),
+        ],
+        unit="s",
+    )
+    sys.stdout.write(f"{cache.stats()}\n")
+
+
+if __name__ == "__main__":
+    main()
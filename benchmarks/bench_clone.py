@@ -0,0 +1,51 @@
+# _*_ coding: utf-8 _*_
+"""Cloning a template resource, ``copy(deep=True)`` and ``dict()`` -> ``parse_obj``
+round trip versus structural ``clone()``."""
+
+import common
+
+from fhir.resources.explanationofbenefit import ExplanationOfBenefit
+from fhir.resources.observation import Observation
+
+
+def main():
+    """ """
+    for klass, fixture, update in (
+        (
+            Observation,
+            "Observation.json",
+            {"status": "amended", "valueQuantity.value": "7.2"},
+        ),
+        (ExplanationOfBenefit, "ExplanationOfBenefit.json", {"status": "cancelled"}),
+    ):
+        template = klass.parse_obj(common.load_fixture(fixture))
+        common.report(
+            klass.__name__,
+            [
+                (
+                    "parse_obj(template.dict())",
+                    common.measure(
+                        lambda: klass.parse_obj(template.dict()), number=100
+                    ),
+                ),
+                (
+                    "copy(deep=True)",
+                    common.measure(lambda: template.copy(deep=True), number=100),
+                ),
+                ("clone()", common.measure(lambda: template.clone(), number=100)),
+                (
+                    "clone(update=...)",
+                    common.measure(lambda: template.clone(update=update), number=100),
+                ),
+                (
+                    "clone(deep=False, update=...)",
+                    common.measure(
+                        lambda: template.clone(deep=False, update=update), number=100
+                    ),
+                ),
+            ],
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+# _*_ coding: utf-8 _*_
+"""Retained memory (``tracemalloc``) of many instances per resource type,
+full ``__dict__`` layout versus compact storage."""
+
+import gc
+import sys
+import tracemalloc
+
+import common
+
+from fhir.resources.core.fhirabstractmodel import FHIRAbstractModel
+from fhir.resources.explanationofbenefit import ExplanationOfBenefit
+from fhir.resources.observation import Observation
+from fhir.resources.patient import Patient
+
+FIXTURES = (
+    (Patient, "Patient-with-ext.json"),
+    (Observation, "Observation.json"),
+    (ExplanationOfBenefit, "ExplanationOfBenefit.json"),
+)
+
+
+def retained_memory(klass, data, size):
+    """Bytes kept alive by ``size`` instances, parse time (seconds)."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        models = [klass.parse_obj(data) for _ in range(size)]
+        retained = tracemalloc.get_traced_memory()[0] - start
+    finally:
+        tracemalloc.stop()
+    del models
+    seconds = common.measure(lambda: klass.parse_obj(data), repeat=3, number=50)
+    return retained, seconds
+
+
+def main(size: int = 1000):
+    """ """
+    title = f"Retained memory of {size} instances (tracemalloc)"
+    sys.stdout.write(f"\n{title}\n{'-' * len(title)}\n")
+    for klass, fixture in FIXTURES:
+        data = common.load_fixture(fixture)
+        FHIRAbstractModel.configure_compact_storage(False)
+        full, full_seconds = retained_memory(klass, data, size)
+        FHIRAbstractModel.configure_compact_storage(True)
+        compact, compact_seconds = retained_memory(klass, data, size)
+        FHIRAbstractModel.configure_compact_storage(False)
+        sys.stdout.write(
+            f"{klass.__name__:<22} full {full / 1024 / 1024:>7.2f} MiB  "
+            f"compact {compact / 1024 / 1024:>7.2f} MiB  "
+            f"x{full / compact:>5.2f}  parse {full_seconds * 1000:.3f} ms -> "
+            f"{compact_seconds * 1000:.3f} ms\n"
+        )
+
+
+if __name__ == "__main__":
+    main()
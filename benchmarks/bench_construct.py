@@ -0,0 +1,42 @@
+# _*_ coding: utf-8 _*_
+"""Validated construction versus trusted construction (``validate=False``)."""
+import common
+
+from fhir.resources import construct_fhir_element
+
+
+def main():
+    """ """
+    bundle = common.make_bundle(200)
+    eob = common.load_fixture("ExplanationOfBenefit.json")
+
+    for title, element_type, data in (
+        ("Bundle (200 entries)", "Bundle", bundle),
+        ("ExplanationOfBenefit", "ExplanationOfBenefit", eob),
+    ):
+        number = 1 if element_type == "Bundle" else 50
+        common.report(
+            title,
+            [
+                (
+                    "construct_fhir_element",
+                    common.measure(
+                        lambda: construct_fhir_element(element_type, data),
+                        number=number,
+                    ),
+                ),
+                (
+                    "construct_fhir_element(validate=False)",
+                    common.measure(
+                        lambda: construct_fhir_element(
+                            element_type, data, validate=False
+                        ),
+                        number=number,
+                    ),
+                ),
+            ],
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# _*_ coding: utf-8 _*_
+"""Cold start, ``python -X importtime`` of a single model module per release.
+Each import runs in a fresh interpreter, best of ``repeat`` runs is reported
+(in milliseconds, cumulative for the model module, self time for the others)."""
+
+import os
+import subprocess
+import sys
+import typing
+
+import common
+
+MODULES = {
+    "R4": "fhir.resources.patient",
+    "STU3": "fhir.resources.STU3.patient",
+    "DSTU2": "fhir.resources.DSTU2.patient",
+}
+
+
+def import_times(module: str) -> typing.Dict[str, typing.Tuple[int, int]]:
+    """module name -> (self, cumulative) import time in microseconds."""
+    env = dict(os.environ)
+    # bytecode cache is used (as in any installed package), after the first run.
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=str(common.ROOT_PATH),
+        env=env,
+        stderr=subprocess.PIPE,
+        check=True,
+    )
+    timings = dict()
+    for line in process.stderr.decode().splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        if not self_us.strip().isdigit():
+            continue
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+def main(repeat: int = 7):
+    """ """
+    title = "python -X importtime (best of %d)" % repeat
+    sys.stdout.write(f"\n{title}\n{'-' * len(title)}\n")
+    for release, module in MODULES.items():
+        package = module.rsplit(".", 1)[0]
+        runs = [import_times(module) for _ in range(repeat + 1)][1:]
+        total = min(run[module][1] for run in runs)
+        types = min(run[package + ".fhirtypes"][0] for run in runs)
+        validators = min(run[package + ".fhirtypesvalidators"][0] for run in runs)
+        sys.stdout.write(
+            f"{release:<6} {module:<32} {total / 1000:>8.2f} ms  "
+            f"fhirtypes {types / 1000:>6.2f} ms  "
+            f"fhirtypesvalidators {validators / 1000:>6.2f} ms\n"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# _*_ coding: utf-8 _*_
+"""Retained memory (``tracemalloc``) of a bulk export like batch of resources,
+parsed as usual versus parsed with a shared ``InternPool``, including the
+deduplication report of the pool."""
+
+import gc
+import sys
+import tracemalloc
+
+import common
+
+from fhir.resources.core.utils.intern import InternPool
+from fhir.resources.explanationofbenefit import ExplanationOfBenefit
+from fhir.resources.observation import Observation
+
+FIXTURES = (
+    (Observation, "Observation.json"),
+    (ExplanationOfBenefit, "ExplanationOfBenefit.json"),
+)
+
+
+def make_batch(fixture, size):
+    """``size`` copies of the fixture with unique ids (as in ndjson export)."""
+    batch = list()
+    for idx in range(size):
+        data = common.load_fixture(fixture)
+        data["id"] = f"{data['resourceType'].lower()}-{idx}"
+        batch.append(data)
+    return batch
+
+
+def parse_batch(klass, batch, pool):
+    """ """
+    return [klass.parse_obj(data, intern=pool) for data in batch]
+
+
+def retained_memory(klass, batch, pool):
+    """Bytes kept alive by the parsed models (and the pool)."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        models = parse_batch(klass, batch, pool)
+        retained = tracemalloc.get_traced_memory()[0] - start
+    finally:
+        tracemalloc.stop()
+    del models
+    return retained
+
+
+def main(size: int = 1000):
+    """ """
+    title = f"Retained memory of {size} parsed resources (tracemalloc)"
+    sys.stdout.write(f"\n{title}\n{'-' * len(title)}\n")
+    for klass, fixture in FIXTURES:
+        batch = make_batch(fixture, size)
+        plain = retained_memory(klass, batch, None)
+        pool = InternPool()
+        interned = retained_memory(klass, batch, pool)
+        plain_seconds = common.measure(
+            lambda: parse_batch(klass, batch, None), repeat=3
+        )
+        interned_seconds = common.measure(
+            lambda: parse_batch(klass, batch, InternPool()), repeat=3
+        )
+        sys.stdout.write(
+            f"{klass.__name__:<22} plain {plain / 1024 / 1024:>7.2f} MiB  "
+            f"interned {interned / 1024 / 1024:>7.2f} MiB  "
+            f"x{plain / interned:>5.2f}  parse {plain_seconds * 1000:.1f} ms -> "
+            f"{interned_seconds * 1000:.1f} ms\n"
+        )
+        sys.stdout.write(pool.report() + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+# _*_ coding: utf-8 _*_
+"""``dict()`` + orjson (previous ``json()``) versus single pass json writer."""
+
+import common
+import orjson
+
+from fhir.resources.bundle import Bundle
+from fhir.resources.core.utils import json_dumps_model
+
+
+def main():
+    """ """
+    bundle = Bundle.parse_obj(common.make_bundle(500))
+
+    def two_pass():
+        return orjson.dumps(bundle.dict(), default=bundle.__json_encoder__)
+
+    def single_pass():
+        return json_dumps_model(bundle)
+
+    assert two_pass() == single_pass()
+    common.report(
+        "Bundle (500 entries) json",
+        [
+            ("dict() + orjson.dumps", common.measure(two_pass)),
+            ("json_dumps_model", common.measure(single_pass)),
+        ],
+    )
+    common.report_memory(
+        [("dict() + orjson.dumps", two_pass), ("json_dumps_model", single_pass)]
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+# _*_ coding: utf-8 _*_
+"""Routing workload (envelope and entry metadata only), eager ``Bundle``
+versus ``LazyBundle`` (entry resources are kept raw)."""
+
+import common
+
+from fhir.resources.bundle import Bundle, LazyBundle
+
+
+def main(size: int = 500):
+    """ """
+    raw = Bundle.parse_obj(common.make_bundle(size)).json(return_bytes=True)
+
+    def route(klass):
+        bundle = klass.parse_raw(raw)
+        targets = [(bundle.type, entry.fullUrl) for entry in bundle.entry]
+        return targets, bundle.json(return_bytes=True)
+
+    assert route(Bundle) == route(LazyBundle)
+    common.report(
+        f"Bundle ({size} entries) parse, route and forward",
+        [
+            ("Bundle", common.measure(lambda: route(Bundle), repeat=3)),
+            ("LazyBundle", common.measure(lambda: route(LazyBundle), repeat=3)),
+        ],
+    )
+    common.report_memory(
+        [
+            ("Bundle", lambda: route(Bundle)),
+            ("LazyBundle", lambda: route(LazyBundle)),
+        ]
+    )
+
+
+if __name__ == "__main__":
+    main()
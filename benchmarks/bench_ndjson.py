@@ -0,0 +1,62 @@
+# _*_ coding: utf-8 _*_
+"""Line by line ``construct_fhir_element`` versus NDJSON (parallel) validator."""
+
+import os
+import tempfile
+
+import common
+
+from fhir.resources import construct_fhir_element
+from fhir.resources.bundle import Bundle
+from fhir.resources.core.utils.ndjson import (
+    iter_ndjson,
+    iter_ndjson_parallel,
+    write_ndjson,
+)
+
+
+def main(size: int = 2000):
+    """ """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        ndjson_file = common.pathlib.Path(tmpdir) / "export.ndjson"
+        bundle = Bundle.parse_obj(common.make_bundle(size))
+        write_ndjson((entry.resource for entry in bundle.entry), ndjson_file)
+        del bundle
+
+        def naive():
+            count = 0
+            with open(ndjson_file, "rb") as fp:
+                for line in fp:
+                    data = Bundle.__config__.json_loads(line)
+                    construct_fhir_element(data["resourceType"], data)
+                    count += 1
+            return count
+
+        def sequential():
+            return sum(1 for r in iter_ndjson(ndjson_file) if r.model)
+
+        def parallel():
+            return sum(1 for r in iter_ndjson_parallel(ndjson_file) if r.model)
+
+        def parallel_unordered():
+            return sum(
+                1 for r in iter_ndjson_parallel(ndjson_file, ordered=False) if r.model
+            )
+
+        assert naive() == sequential() == parallel() == size
+        common.report(
+            f"NDJSON ({size} lines) validation, {os.cpu_count()} CPU(s)",
+            [
+                ("construct_fhir_element per line", common.measure(naive, repeat=3)),
+                ("iter_ndjson", common.measure(sequential, repeat=3)),
+                ("iter_ndjson_parallel", common.measure(parallel, repeat=3)),
+                (
+                    "iter_ndjson_parallel (unordered)",
+                    common.measure(parallel_unordered, repeat=3),
+                ),
+            ],
+        )
+
+
+if __name__ == "__main__":
+    main()
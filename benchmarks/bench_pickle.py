@@ -0,0 +1,61 @@
+# _*_ coding: utf-8 _*_
+"""Pickle size and speed (i.e. for ``ProcessPoolExecutor`` fan-out), pydantic's
+default full state (``__dict__`` and ``__fields_set__`` of every element) versus
+sparse ``FHIRAbstractModel.__reduce__``."""
+
+import copyreg
+import io
+import pickle
+import sys
+
+import common
+from pydantic import BaseModel
+
+from fhir.resources.bundle import Bundle
+from fhir.resources.explanationofbenefit import ExplanationOfBenefit
+from fhir.resources.patient import Patient
+
+
+class FullStatePickler(pickle.Pickler):
+    """Pickles models the way pydantic does by default."""
+
+    def reducer_override(self, obj):
+        """ """
+        if isinstance(obj, BaseModel):
+            return copyreg.__newobj__, (obj.__class__,), obj.__getstate__()
+        return NotImplemented
+
+
+def full_state_dumps(model):
+    """ """
+    stream = io.BytesIO()
+    FullStatePickler(stream, protocol=pickle.HIGHEST_PROTOCOL).dump(model)
+    return stream.getvalue()
+
+
+def main():
+    """ """
+    for klass, data, number in (
+        (Patient, common.load_fixture("Patient-with-ext.json"), 100),
+        (ExplanationOfBenefit, common.load_fixture("ExplanationOfBenefit.json"), 100),
+        (Bundle, common.make_bundle(100), 2),
+    ):
+        model = klass.parse_obj(data)
+        title = f"{klass.__name__} pickle"
+        sys.stdout.write(f"\n{title}\n{'-' * len(title)}\n")
+        for label, dumps in (
+            ("full state", full_state_dumps),
+            ("sparse (__reduce__)", pickle.dumps),
+        ):
+            data = dumps(model)
+            assert pickle.loads(data) == model
+            store = common.measure(lambda: dumps(model), number=number)
+            load = common.measure(lambda: pickle.loads(data), number=number)
+            sys.stdout.write(
+                f"{label:<20} {len(data):>9} bytes  "
+                f"dumps {store * 1000:>8.3f} ms  loads {load * 1000:>8.3f} ms\n"
+            )
+
+
+if __name__ == "__main__":
+    main()
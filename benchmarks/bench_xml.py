@@ -0,0 +1,49 @@
+# _*_ coding: utf-8 _*_
+"""XML serialization, ``Node`` tree (``Node.from_fhir_obj(model).to_string()``)
+versus single pass ``xml_dumps`` (lxml elements straight from the model),
+time and peak (python) memory."""
+
+import sys
+
+import common
+
+from fhir.resources.bundle import Bundle
+from fhir.resources.core.utils.xml import Node, xml_dumps
+from fhir.resources.explanationofbenefit import ExplanationOfBenefit
+from fhir.resources.patient import Patient
+
+
+def node_dumps(model):
+    """ """
+    return Node.from_fhir_obj(model).to_string(pretty_print=False)
+
+
+def main():
+    """ """
+    for klass, data, number in (
+        (Patient, common.load_fixture("Patient-with-ext.json"), 100),
+        (ExplanationOfBenefit, common.load_fixture("ExplanationOfBenefit.json"), 100),
+        (Bundle, common.make_bundle(200), 2),
+    ):
+        model = klass.parse_obj(data)
+        assert node_dumps(model) == xml_dumps(model)
+        common.report(
+            f"{klass.__name__} xml",
+            [
+                (
+                    "Node tree",
+                    common.measure(lambda: node_dumps(model), number=number),
+                ),
+                (
+                    "xml_dumps (single pass)",
+                    common.measure(lambda: xml_dumps(model), number=number),
+                ),
+            ],
+        )
+        for label, func in (("Node tree", node_dumps), ("xml_dumps", xml_dumps)):
+            peak = common.peak_memory(lambda: func(model))
+            sys.stdout.write(f"{label + ' peak memory':<40} {peak / 1024:>12.1f} KiB\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# _*_ coding: utf-8 _*_
+"""XML parsing of deeply nested resources (``Questionnaire.item.item...`` and
+``QuestionnaireResponse.item.answer.item...``), time per element should not
+grow with nesting depth."""
+
+import sys
+
+import common
+from lxml import etree
+
+from fhir.resources.core.utils.xml import Node
+from fhir.resources.questionnaire import Questionnaire
+from fhir.resources.questionnaireresponse import QuestionnaireResponse
+
+
+def make_questionnaire(depth: int, width: int = 2):
+    """ """
+
+    def make_item(level, index):
+        item = {
+            "linkId": f"{level}.{index}",
+            "text": f"Question {level}.{index}",
+            "type": "group" if level < depth else "string",
+        }
+        if level < depth:
+            item["item"] = [make_item(level + 1, 0)] + [
+                {"linkId": f"{level}.{i}", "type": "boolean"} for i in range(1, width)
+            ]
+        return item
+
+    return {
+        "resourceType": "Questionnaire",
+        "id": f"deep-{depth}",
+        "status": "active",
+        "item": [make_item(1, 0)],
+    }
+
+
+def make_questionnaire_response(depth: int, width: int = 2):
+    """ """
+
+    def make_item(level, index):
+        item = {"linkId": f"{level}.{index}", "text": f"Question {level}.{index}"}
+        answer = {"valueString": f"answer {level}"}
+        if level < depth:
+            answer["item"] = [make_item(level + 1, 0)] + [
+                {"linkId": f"{level}.{i}", "answer": [{"valueBoolean": True}]}
+                for i in range(1, width)
+            ]
+        item["answer"] = [answer]
+        return item
+
+    return {
+        "resourceType": "QuestionnaireResponse",
+        "id": f"deep-{depth}",
+        "status": "completed",
+        "item": [make_item(1, 0)],
+    }
+
+
+def declare_namespaces(xml_bytes: bytes) -> bytes:
+    """Each nested ``item`` declares its own (unused) namespace, as some tools
+    are doing, so the set of namespaces in scope grows with depth."""
+    parts = xml_bytes.split(b"<item>")
+    return parts[0] + b"".join(
+        b'<item xmlns:l%d="urn:level:%d">' % (index, index) + part
+        for index, part in enumerate(parts[1:])
+    )
+
+
+def main():
+    """ """
+    for klass, make in (
+        (Questionnaire, make_questionnaire),
+        (QuestionnaireResponse, make_questionnaire_response),
+    ):
+        title = f"{klass.__name__} xml parsing by depth"
+        sys.stdout.write(f"\n{title}\n{'-' * len(title)}\n")
+        for depth, declare in (
+            (10, False),
+            (25, False),
+            (50, False),
+            (80, False),
+            (25, True),
+            (50, True),
+            (80, True),
+        ):
+            xml_bytes = klass.parse_obj(make(depth)).xml(return_bytes=True)
+            if declare:
+                xml_bytes = declare_namespaces(xml_bytes)
+            root = etree.fromstring(xml_bytes)
+            elements = sum(1 for _ in root.iter())
+            tree = common.measure(lambda: Node.from_element(root), number=3)
+            parse = common.measure(
+                lambda: klass.parse_raw(xml_bytes, content_type="text/xml"), number=3
+            )
+            sys.stdout.write(
+                f"depth {depth:>4}{declare and ' (xmlns)' or '        '} "
+                f"({elements:>5} elements)  "
+                f"Node.from_element {tree * 1000:>9.3f} ms "
+                f"({tree * 1e6 / elements:>6.2f} us/element)  "
+                f"parse_raw {parse * 1000:>9.3f} ms\n"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# _*_ coding: utf-8 _*_
+"""XML parsing, ``Node`` tree (``Node.from_element(root).to_fhir(klass)``,
+keyword arguments of every element are validated level by level) versus
+single pass ``xml_element_to_dict`` followed by one ``parse_obj`` and by
+trusted ``construct_tree``."""
+
+import common
+from lxml import etree
+
+from fhir.resources.core.utils.xml import Node, xml_element_to_dict, xml_loads
+from fhir.resources.explanationofbenefit import ExplanationOfBenefit
+from fhir.resources.patient import Patient
+from fhir.resources.questionnaire import Questionnaire
+
+
+def node_loads(klass, raw):
+    """ """
+    return Node.from_element(etree.fromstring(raw)).to_fhir(klass)
+
+
+def main():
+    """ """
+    questionnaire = {
+        "resourceType": "Questionnaire",
+        "status": "active",
+        "item": [
+            {
+                "linkId": str(index),
+                "text": f"Question {index}",
+                "type": "choice",
+                "answerOption": [
+                    {"valueCoding": {"system": "urn:s", "code": str(code)}}
+                    for code in range(5)
+                ],
+            }
+            for index in range(100)
+        ],
+    }
+    for klass, data, number in (
+        (Patient, common.load_fixture("Patient-with-ext.json"), 100),
+        (ExplanationOfBenefit, common.load_fixture("ExplanationOfBenefit.json"), 100),
+        (Questionnaire, questionnaire, 10),
+    ):
+        raw = klass.parse_obj(data).xml().encode()
+        root = etree.fromstring(raw)
+        # trusted construction keeps (already valid) date strings as they are
+        assert (
+            klass.parse_obj(xml_element_to_dict(klass, root)).json()
+            == xml_loads(klass, raw, validate=False).json()
+        )
+        common.report(
+            f"{klass.__name__} xml ({len(raw) / 1024:.1f} KiB)",
+            [
+                (
+                    "Node tree + to_fhir()",
+                    common.measure(lambda: node_loads(klass, raw), number=number),
+                ),
+                (
+                    "xml_element_to_dict() only",
+                    common.measure(
+                        lambda: xml_element_to_dict(klass, etree.fromstring(raw)),
+                        number=number,
+                    ),
+                ),
+                (
+                    "xml_loads() (single parse_obj)",
+                    common.measure(lambda: xml_loads(klass, raw), number=number),
+                ),
+                (
+                    "xml_loads(validate=False)",
+                    common.measure(
+                        lambda: xml_loads(klass, raw, validate=False), number=number
+                    ),
+                ),
+            ],
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+# _*_ coding: utf-8 _*_
+"""XML schema validation per message, compiling schema per call (as
+``Node.validate(..., xsd_file=...)`` used to) versus compiled schema registry
+(``parse_raw(..., validate_schema=True)``)."""
+
+import common
+from lxml import etree
+
+from fhir.resources.core.utils import xsd
+from fhir.resources.patient import Patient
+
+XSD_DIR = common.STATIC_PATH / "xsd" / "fhir"
+
+
+def main():
+    """ """
+    xsd.register_xsd_directory(XSD_DIR)
+    xml_bytes = (common.STATIC_PATH / "Patient-with-ext.xml").read_bytes()
+
+    def compile_per_call():
+        schema = etree.XMLSchema(file=str(XSD_DIR / "patient.xsd"))
+        etree.fromstring(xml_bytes, parser=etree.XMLParser(schema=schema))
+
+    def registry_parser():
+        etree.fromstring(xml_bytes, parser=xsd.get_parser("R4", "Patient"))
+
+    common.report(
+        "Patient xml schema validation",
+        [
+            ("XMLSchema compiled per call", common.measure(compile_per_call)),
+            ("registry parser", common.measure(registry_parser, number=100)),
+            (
+                "parse_raw (xml)",
+                common.measure(
+                    lambda: Patient.parse_raw(xml_bytes, content_type="text/xml"),
+                    number=100,
+                ),
+            ),
+            (
+                "parse_raw (xml, validate_schema=True)",
+                common.measure(
+                    lambda: Patient.parse_raw(
+                        xml_bytes, content_type="text/xml", validate_schema=True
+                    ),
+                    number=100,
+                ),
+            ),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
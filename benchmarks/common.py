@@ -0,0 +1,86 @@
+# _*_ coding: utf-8 _*_
+"""Shared helpers for the benchmark scripts, run them from anywhere i.e.
+``python benchmarks/bench_construct.py``."""
+
+import copy
+import pathlib
+import sys
+import time
+import tracemalloc
+import typing
+
+ROOT_PATH = pathlib.Path(__file__).resolve().parents[1]
+STATIC_PATH = ROOT_PATH / "tests" / "static"
+
+if str(ROOT_PATH) not in sys.path:
+    sys.path.insert(0, str(ROOT_PATH))
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+def load_fixture(name: str) -> typing.Dict[str, typing.Any]:
+    """ """
+    import orjson
+
+    return orjson.loads((STATIC_PATH / name).read_bytes())
+
+
+def make_bundle(
+    size: int, fixtures=("Patient-with-ext.json", "ExplanationOfBenefit.json")
+) -> typing.Dict[str, typing.Any]:
+    """Searchset Bundle (as dict) with ``size`` entries, made from static fixtures."""
+    resources = [load_fixture(name) for name in fixtures]
+    entries = list()
+    for idx in range(size):
+        resource = copy.deepcopy(resources[idx % len(resources)])
+        resource["id"] = f"{resource['resourceType'].lower()}-{idx}"
+        entries.append(
+            {
+                "fullUrl": f"http://example.org/fhir/{resource['resourceType']}/"
+                f"{resource['id']}",
+                "resource": resource,
+                "search": {"mode": "match"},
+            }
+        )
+    return {"resourceType": "Bundle", "type": "searchset", "entry": entries}
+
+
+def measure(func: typing.Callable, *, repeat: int = 5, number: int = 1) -> float:
+    """Best wall time (seconds) of ``repeat`` runs, each calling ``func`` ``number``
+    times."""
+    timings = list()
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        timings.append((time.perf_counter() - start) / number)
+    return min(timings)
+
+
+def report(title: str, rows: typing.List[typing.Tuple[str, float]], unit="ms"):
+    """ """
+    sys.stdout.write(f"\n{title}\n{'-' * len(title)}\n")
+    base = rows[0][1]
+    for label, seconds in rows:
+        value = seconds * 1000 if unit == "ms" else seconds
+        sys.stdout.write(
+            f"{label:<40} {value:>12.3f} {unit}  x{base / seconds:>7.2f}\n"
+        )
+
+
+def peak_memory(func: typing.Callable) -> int:
+    """Peak of traced (python) memory allocations in bytes, while calling ``func``."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def report_memory(rows: typing.List[typing.Tuple[str, typing.Callable]]):
+    """ """
+    for label, func in rows:
+        sys.stdout.write(
+            f"{label:<40} peak {peak_memory(func) / 1024 / 1024:.2f} MiB\n"
+        )
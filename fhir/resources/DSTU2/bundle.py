@@ -5,10 +5,16 @@ Release: DSTU2
 Version: 1.0.2
 Revision: 7202
 """
+
+from pathlib import Path
+from typing import IO, Iterator
 from typing import List as ListType
+from typing import Union
 
 from pydantic import Field
 
+from fhir.resources.core.utils.bundlereader import iter_bundle_entries
+
 from . import fhirtypes
 from .backboneelement import BackboneElement
 from .resource import Resource
@@ -251,3 +257,22 @@ class BundleLink(BackboneElement):
         title="Type `Uri` (represented as `dict` in JSON)",
         description="Reference details for the link",
     )
+
+
+def iter_entries(
+    source: Union[str, Path, IO],
+    *,
+    content_type: str = None,
+    validate: bool = True,
+) -> Iterator[BundleEntry]:
+    """Yields ``BundleEntry`` one by one from Bundle (JSON or XML) file path
+    or stream, without loading whole document into memory.
+    Use ``fhir.resources.core.utils.bundlereader.BundleReader`` directly,
+    to access Bundle envelope (all elements except entries) as well."""
+    return iter_bundle_entries(
+        Bundle,
+        BundleEntry,
+        source,
+        content_type=content_type,
+        validate=validate,
+    )
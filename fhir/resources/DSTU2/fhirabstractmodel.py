@@ -11,9 +11,22 @@ from pydantic import BaseModel, Extra, Field
 from pydantic.class_validators import ROOT_VALIDATOR_CONFIG_KEY, root_validator
 from pydantic.error_wrappers import ErrorWrapper, ValidationError
 from pydantic.errors import ConfigError, PydanticValueError
+from pydantic.parse import Protocol, load_str_bytes
 from pydantic.typing import AnyCallable
 from pydantic.utils import ROOT_KEY
 
+from fhir.resources.core.utils import (
+    batch,
+    binary,
+    cache,
+    clone,
+    compact,
+    frozen,
+    pickling,
+)
+from fhir.resources.core.utils.cache import dumps_key_bytes, raw_options
+from fhir.resources.core.utils.construct import construct_tree
+
 try:
     import orjson
 
@@ -42,7 +55,11 @@ except ImportError:
 
 if TYPE_CHECKING:
     from pydantic.typing import AbstractSetIntStr, MappingIntStrAny, DictStrAny
+    from pydantic.typing import ReprArgs, TupleGenerator
     from pydantic.main import Model
+    from pydantic.types import StrBytes
+    from fhir.resources.core.utils.cache import ValidationCache
+    from fhir.resources.core.utils.intern import InternPool
 
 __author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
 
@@ -98,6 +115,11 @@ class WrongResourceType(PydanticValueError):
 class FHIRAbstractModel(BaseModel, abc.ABC):
     """Abstract base model class for all FHIR elements."""
 
+    # ``batch_update`` state and frozen flag, not model fields.
+    __slots__ = (batch.BATCH_STATE_ATTR, frozen.FROZEN_ATTR)
+    # see ``configure_compact_storage``
+    __compact_storage__: typing.ClassVar[bool] = False
+
     resource_type: str = ...  # type: ignore
 
     fhir_comments: typing.Union[str, typing.List[str]] = Field(
@@ -136,6 +158,186 @@ class FHIRAbstractModel(BaseModel, abc.ABC):
             raise ValidationError(errors, __pydantic_self__.__class__)
 
         BaseModel.__init__(__pydantic_self__, **data)
+        if __pydantic_self__.__compact_storage__:
+            compact.compact(__pydantic_self__)
+
+    def __setattr__(self, name, value):
+        """Assignments are deferred while ``batch_update`` is active."""
+        if frozen.is_frozen(self):
+            frozen.raise_frozen_error(self)
+        state = batch.get_batch_state(self)
+        if state is not None and batch.can_defer_assignment(self, name):
+            return batch.defer_assignment(self, state, name, value)
+        return BaseModel.__setattr__(self, name, value)
+
+    def __eq__(self, other: typing.Any) -> bool:
+        """ """
+        if isinstance(other, BaseModel) and (
+            frozen.is_frozen(self) or frozen.is_frozen(other)
+        ):
+            return frozen.frozen_equals(self, other)
+        return BaseModel.__eq__(self, other)
+
+    def __hash__(self) -> int:
+        """Only frozen models are hashable, ``hash()`` of mutable model raises
+        ``TypeError``. Note: ``isinstance(model, collections.abc.Hashable)`` is
+        True for every model (it is a class level check)."""
+        return frozen.get_hash(self)
+
+    def __reduce__(self):
+        """Sparse state (``None`` values are left out), restored without validation."""
+        return pickling.restore_model, pickling.get_state(self)
+
+    def __deepcopy__(self: "Model", memo: typing.Dict[int, typing.Any]) -> "Model":
+        """Structural (mutable) copy, same as ``clone()``."""
+        return clone.clone_model(self, deep=True, memo=memo)
+
+    def __iter__(self) -> "TupleGenerator":
+        """ """
+        if compact.is_compact(self):
+            yield from compact.iter_values(self)
+        else:
+            yield from self.__dict__.items()
+
+    def __repr_args__(self) -> "ReprArgs":
+        """ """
+        if compact.is_compact(self):
+            return BaseModel.__repr_args__(compact.full_copy(self))
+        return BaseModel.__repr_args__(self)
+
+    def _iter(self, *args, **kwargs) -> "TupleGenerator":
+        """``None`` values are only materialised, if those are not excluded."""
+        if kwargs.get("exclude_none", False) is False and compact.is_compact(self):
+            return BaseModel._iter(compact.full_copy(self), *args, **kwargs)
+        return BaseModel._iter(self, *args, **kwargs)
+
+    @classmethod
+    def parse_obj(
+        cls: typing.Type["Model"],
+        obj: typing.Any,
+        *,
+        intern: "InternPool" = None,
+        frozen: bool = False,
+        cache: "ValidationCache" = None,
+    ) -> "Model":
+        """``intern`` pool (``fhir.resources.core.utils.intern.InternPool``) replaces
+        structurally identical elements (``Coding``, ``Reference``...) with shared
+        instances of the pool. ``frozen`` model is returned as ``model.freeze()``.
+        Validated models are looked up from and kept in ``cache``
+        (``fhir.resources.core.utils.cache.ValidationCache``)."""
+        if cache is not None and isinstance(obj, dict):
+            return cache.get_or_parse(
+                cls,
+                dumps_key_bytes(obj),
+                lambda: cls.parse_obj(obj, intern=intern),
+                frozen=frozen,
+                options=("obj", intern),
+            )
+        model = super().parse_obj(obj)
+        if intern is not None:
+            model = intern.intern_tree(model)
+        if frozen:
+            model.freeze()
+        return model
+
+    @classmethod
+    def parse_raw(
+        cls: typing.Type["Model"],
+        b: "StrBytes",
+        *,
+        content_type: str = None,
+        encoding: str = "utf8",
+        proto: Protocol = None,
+        allow_pickle: bool = False,
+        intern: "InternPool" = None,
+        frozen: bool = False,
+        cache: "ValidationCache" = None,
+    ) -> "Model":
+        """``intern``, ``frozen`` and ``cache`` are same as of ``parse_obj``."""
+        if cache is not None:
+            return cache.get_or_parse(
+                cls,
+                b,
+                lambda: cls.parse_raw(
+                    b,
+                    content_type=content_type,
+                    encoding=encoding,
+                    proto=proto,
+                    allow_pickle=allow_pickle,
+                    intern=intern,
+                ),
+                frozen=frozen,
+                options=raw_options(content_type, intern, encoding),
+            )
+        try:
+            obj = load_str_bytes(
+                b,
+                proto=proto,
+                content_type=content_type,
+                encoding=encoding,
+                allow_pickle=allow_pickle,
+                json_loads=cls.__config__.json_loads,
+            )
+        except (ValueError, TypeError, UnicodeDecodeError) as e:  # noqa: B014
+            raise ValidationError([ErrorWrapper(e, loc=ROOT_KEY)], cls)
+        return cls.parse_obj(obj, intern=intern, frozen=frozen)
+
+    def to_bytes(self) -> bytes:
+        """Compact binary (schema aware) representation, i.e. for caching.
+        Use ``Model.from_bytes()`` to load it back without validation."""
+        return binary.dumps(self)
+
+    @classmethod
+    def from_bytes(cls: typing.Type["Model"], data: bytes) -> "Model":
+        """Loads model from ``to_bytes()`` output (of the same fhir.resources
+        version), no validator is executed."""
+        return binary.loads(cls, data)
+
+    def clone(
+        self: "Model",
+        *,
+        deep: bool = True,
+        update: typing.Dict[str, typing.Any] = None,
+    ) -> "Model":
+        """Structural copy without running validators, immutable values are shared
+        (nested elements too, if not ``deep``). Only fields in ``update`` are
+        validated, keys could be dotted path of nested element. Shallow clone of
+        frozen model shares (still frozen) nested elements, except the updated path.
+
+        >>> reading = template.clone(
+        ...     update={"status": "final", "valueQuantity.value": 7.2}
+        ... )
+        """
+        return clone.clone(self, deep=deep, update=update)
+
+    def freeze(self: "Model") -> "Model":
+        """Makes whole tree immutable (in place), list values become tuples and
+        any assignment raises ``TypeError``. Frozen models are hashable and
+        serialized output (``json()``, ``xml()``...) is memoised, so they are safe
+        to share between threads and to cache. ``clone()`` gives mutable copy
+        (``copy()`` keeps tuples and frozen nested elements)."""
+        return frozen.freeze_tree(self)
+
+    @classmethod
+    def configure_compact_storage(cls, enabled: bool = True):
+        """Compact storage keeps only present values in instance ``__dict__``,
+        ``None`` fields (i.e. all empty ``__ext`` fields) are not stored, for the cost
+        of ``__getattr__`` fallback for empty fields. Applies to all subclasses
+        (if configured on base class) and instances those are created afterwards.
+        Disabling removes the ``__getattr__`` fallback again, compact instances
+        created meanwhile must not be used afterwards (empty fields are missing)."""
+        cls.__compact_storage__ = enabled
+        if enabled:
+            # installed on demand, so that full layout doesn't pay for
+            # ``__getattr__`` hook on every failed attribute lookup.
+            cls.__getattr__ = compact.get_missing_value  # type: ignore
+        elif cls.__dict__.get("__getattr__", None) is compact.get_missing_value:
+            del cls.__getattr__
+
+    def batch_update(self: "Model") -> typing.ContextManager["Model"]:
+        """Context manager, assignments inside it are validated once at exit.
+        On any error, none of the assignments are applied."""
+        return batch.batch_update(self)
 
     @classmethod
     def add_root_validator(
@@ -203,9 +405,10 @@ class FHIRAbstractModel(BaseModel, abc.ABC):
         # inject to class
         setattr(validator, "__manually_injected__", True)  # noqa:B010
         setattr(cls, func_name, validator)
+        cache.invalidate_validation_caches()
 
     @classmethod
-    @lru_cache(maxsize=1024, typed=True)
+    @lru_cache(maxsize=None, typed=True)
     def has_resource_base(cls) -> bool:
         """ """
         # xxx: calculate metrics, other than cache it!
@@ -220,6 +423,13 @@ class FHIRAbstractModel(BaseModel, abc.ABC):
         """ """
         return cls.__fields__["resource_type"].default
 
+    @classmethod
+    def construct_tree(cls: Type["Model"], data: typing.Dict[str, Any]) -> "Model":
+        """Trusted fast construction, builds whole tree (nested elements are
+        resolved through ``fhirtypes``) from ``data`` without running any validator.
+        Only use it for payloads, those are already validated once!"""
+        return typing.cast("Model", construct_tree(cls, data))
+
     @classmethod
     def get_json_encoder(cls) -> Callable[[Any], Any]:
         """ """
@@ -303,6 +513,7 @@ class FHIRAbstractModel(BaseModel, abc.ABC):
 
         return result
 
+    @frozen.memoized_output
     def json(  # type: ignore
         self,
         *,
@@ -2,7 +2,7 @@
 import datetime
 import re
 from email.utils import formataddr, parseaddr
-from typing import TYPE_CHECKING, Any, Dict, Optional, Pattern, Union
+from typing import TYPE_CHECKING, Any, Dict, Optional, Pattern, Type, Union
 from uuid import UUID
 
 from pydantic import AnyUrl
@@ -17,8 +17,10 @@ from pydantic.types import (
 )
 from pydantic.validators import bool_validator, parse_date, parse_datetime, parse_time
 
+from fhir.resources.core.utils.cache import invalidate_validation_caches
+
 from .fhirabstractmodel import FHIRAbstractModel
-from .fhirtypesvalidators import run_validator_for_fhir_type
+from .fhirtypesvalidators import MODEL_NAMES, run_validator_for_fhir_type
 
 if TYPE_CHECKING:
     from pydantic.types import CallableGenerator
@@ -170,6 +172,8 @@ class Id(ConstrainedStr, Primitive):
 
         if regex is not None:
             cls.regex = regex
+        # cached validation results are made with previous constraints.
+        invalidate_validation_caches()
 
 
 class Uuid(UUID, Primitive):
@@ -406,7 +410,10 @@ def get_fhir_type_class(model_name):
     try:
         return globals()[model_name + "Type"]
     except KeyError:
+        pass
+    if model_name not in MODEL_NAMES:
         raise LookupError(f"'{__name__}.{model_name}Type' doesnt found.")
+    return make_fhir_type_class(model_name)
 
 
 class AbstractType(dict):
@@ -464,9 +471,10 @@ class AbstractBaseType(dict):
     def validate(cls, v, values, config, field):
         """ """
         if isinstance(v, (bytes, str)):
-            input_data = load_str_bytes(v)
-            resource_type = input_data.get("resourceType", None)
-        elif isinstance(v, FHIRAbstractModel):
+            # decoded only once, the dict is passed on to the target validator.
+            v = load_str_bytes(v, json_loads=FHIRAbstractModel.__config__.json_loads)
+
+        if isinstance(v, FHIRAbstractModel):
             resource_type = v.resource_type
         else:
             resource_type = v.get("resourceType", None)
@@ -480,6 +488,13 @@ class AbstractBaseType(dict):
             return v
 
         type_class = get_fhir_type_class(resource_type)
+        if isinstance(v, dict):
+            # fast path, straight to the target model class.
+            from . import fhirtypesvalidators
+
+            klass, _ = fhirtypesvalidators.get_fhir_type_validators(type_class)
+            return klass.parse_obj(v)
+
         v = run_validator_for_fhir_type(type_class, v, values, config, field)
         return v
 
@@ -545,1375 +560,162 @@ class ResourceType(AbstractBaseType):
     __resource_type__ = "Resource"
 
 
-class DomainResourceType(AbstractType):
-    __resource_type__ = "DomainResource"
-
-
-class ExtensionType(AbstractType):
-    __resource_type__ = "Extension"
-
-
-class BackboneElementType(AbstractType):
-    __resource_type__ = "BackboneElement"
-
-
-class MetaType(AbstractType):
-    __resource_type__ = "Meta"
-
-
-class NarrativeType(AbstractType):
-    __resource_type__ = "Narrative"
-
-
-class AddressType(AbstractType):
-    __resource_type__ = "Address"
-
-
-class PeriodType(AbstractType):
-    __resource_type__ = "Period"
-
-
-class AttachmentType(AbstractType):
-    __resource_type__ = "Attachment"
-
-
-class CodeableConceptType(AbstractType):
-    __resource_type__ = "CodeableConcept"
-
-
-class CodingType(AbstractType):
-    __resource_type__ = "Coding"
-
-
-class ContactPointType(AbstractType):
-    __resource_type__ = "ContactPoint"
-
-
-class HumanNameType(AbstractType):
-    __resource_type__ = "HumanName"
-
-
-class IdentifierType(AbstractType):
-    __resource_type__ = "Identifier"
-
-
-class ReferenceType(AbstractType):
-    __resource_type__ = "Reference"
-
-
-class QuantityType(AbstractType):
-    __resource_type__ = "Quantity"
-
-
-class RangeType(AbstractType):
-    __resource_type__ = "Range"
-
-
-class RatioType(AbstractType):
-    __resource_type__ = "Ratio"
-
-
-class SignatureType(AbstractType):
-    __resource_type__ = "Signature"
-
-
-class TimingType(AbstractType):
-    __resource_type__ = "Timing"
-
-
-class TimingRepeatType(AbstractType):
-    __resource_type__ = "TimingRepeat"
-
-
-class DurationType(AbstractType):
-    __resource_type__ = "Duration"
-
-
-class AgeType(AbstractType):
-    __resource_type__ = "Age"
-
-
-class CountType(AbstractType):
-    __resource_type__ = "Count"
-
-
-class MoneyType(AbstractType):
-    __resource_type__ = "Money"
-
-
-class DistanceType(AbstractType):
-    __resource_type__ = "Distance"
-
-
-class SampledDataType(AbstractType):
-    __resource_type__ = "SampledData"
-
-
-class AnnotationType(AbstractType):
-    __resource_type__ = "Annotation"
-
-
-class MediaType(AbstractType):
-    __resource_type__ = "Media"
-
-
-class BasicType(AbstractType):
-    __resource_type__ = "Basic"
-
-
-class BinaryType(AbstractType):
-    __resource_type__ = "Binary"
-
-
-class BodySiteType(AbstractType):
-    __resource_type__ = "BodySite"
-
-
-class FlagType(AbstractType):
-    __resource_type__ = "Flag"
-
-
-class LocationType(AbstractType):
-    __resource_type__ = "Location"
-
-
-class LocationPositionType(AbstractType):
-    __resource_type__ = "LocationPosition"
-
-
-class SlotType(AbstractType):
-    __resource_type__ = "Slot"
-
-
-class ScheduleType(AbstractType):
-    __resource_type__ = "Schedule"
-
-
-class AccountType(AbstractType):
-    __resource_type__ = "Account"
-
-
-class AllergyIntoleranceType(AbstractType):
-    __resource_type__ = "AllergyIntolerance"
-
-
-class AllergyIntoleranceReactionType(AbstractType):
-    __resource_type__ = "AllergyIntoleranceReaction"
-
-
-class AppointmentType(AbstractType):
-    __resource_type__ = "Appointment"
-
-
-class AppointmentParticipantType(AbstractType):
-    __resource_type__ = "AppointmentParticipant"
-
-
-class AppointmentResponseType(AbstractType):
-    __resource_type__ = "AppointmentResponse"
-
-
-class AuditEventType(AbstractType):
-    __resource_type__ = "AuditEvent"
-
-
-class AuditEventEventType(AbstractType):
-    __resource_type__ = "AuditEventEvent"
-
-
-class AuditEventObjectType(AbstractType):
-    __resource_type__ = "AuditEventObject"
-
-
-class AuditEventObjectDetailType(AbstractType):
-    __resource_type__ = "AuditEventObjectDetail"
-
-
-class AuditEventParticipantType(AbstractType):
-    __resource_type__ = "AuditEventParticipant"
-
-
-class AuditEventParticipantNetworkType(AbstractType):
-    __resource_type__ = "AuditEventParticipantNetwork"
-
-
-class AuditEventSourceType(AbstractType):
-    __resource_type__ = "AuditEventSource"
-
-
-class BundleType(AbstractType):
-    __resource_type__ = "Bundle"
-
-
-class BundleEntryType(AbstractType):
-    __resource_type__ = "BundleEntry"
-
-
-class BundleEntryRequestType(AbstractType):
-    __resource_type__ = "BundleEntryRequest"
-
-
-class BundleEntryResponseType(AbstractType):
-    __resource_type__ = "BundleEntryResponse"
-
-
-class BundleEntrySearchType(AbstractType):
-    __resource_type__ = "BundleEntrySearch"
-
-
-class BundleLinkType(AbstractType):
-    __resource_type__ = "BundleLink"
-
-
-class CarePlanType(AbstractType):
-    __resource_type__ = "CarePlan"
-
-
-class CarePlanActivityType(AbstractType):
-    __resource_type__ = "CarePlanActivity"
-
-
-class CarePlanActivityDetailType(AbstractType):
-    __resource_type__ = "CarePlanActivityDetail"
-
-
-class CarePlanParticipantType(AbstractType):
-    __resource_type__ = "CarePlanParticipant"
-
-
-class CarePlanRelatedPlanType(AbstractType):
-    __resource_type__ = "CarePlanRelatedPlan"
-
-
-class ClaimType(AbstractType):
-    __resource_type__ = "Claim"
-
-
-class ClaimCoverageType(AbstractType):
-    __resource_type__ = "ClaimCoverage"
-
-
-class ClaimDiagnosisType(AbstractType):
-    __resource_type__ = "ClaimDiagnosis"
-
-
-class ClaimItemType(AbstractType):
-    __resource_type__ = "ClaimItem"
-
-
-class ClaimItemDetailType(AbstractType):
-    __resource_type__ = "ClaimItemDetail"
-
-
-class ClaimItemDetailSubDetailType(AbstractType):
-    __resource_type__ = "ClaimItemDetailSubDetail"
-
-
-class ClaimItemProsthesisType(AbstractType):
-    __resource_type__ = "ClaimItemProsthesis"
-
-
-class ClaimMissingTeethType(AbstractType):
-    __resource_type__ = "ClaimMissingTeeth"
-
-
-class ClaimPayeeType(AbstractType):
-    __resource_type__ = "ClaimPayee"
-
-
-class ClaimResponseType(AbstractType):
-    __resource_type__ = "ClaimResponse"
-
-
-class ClaimResponseAddItemType(AbstractType):
-    __resource_type__ = "ClaimResponseAddItem"
-
-
-class ClaimResponseAddItemAdjudicationType(AbstractType):
-    __resource_type__ = "ClaimResponseAddItemAdjudication"
-
-
-class ClaimResponseAddItemDetailType(AbstractType):
-    __resource_type__ = "ClaimResponseAddItemDetail"
-
-
-class ClaimResponseAddItemDetailAdjudicationType(AbstractType):
-    __resource_type__ = "ClaimResponseAddItemDetailAdjudication"
-
-
-class ClaimResponseCoverageType(AbstractType):
-    __resource_type__ = "ClaimResponseCoverage"
-
-
 class ClaimResponseErrorType(AbstractType):
     __resource_type__ = "ClaimResponseError"
 
 
-class ClaimResponseItemType(AbstractType):
-    __resource_type__ = "ClaimResponseItem"
-
-
-class ClaimResponseItemAdjudicationType(AbstractType):
-    __resource_type__ = "ClaimResponseItemAdjudication"
-
-
-class ClaimResponseItemDetailType(AbstractType):
-    __resource_type__ = "ClaimResponseItemDetail"
-
-
-class ClaimResponseItemDetailAdjudicationType(AbstractType):
-    __resource_type__ = "ClaimResponseItemDetailAdjudication"
-
-
-class ClaimResponseItemDetailSubDetailType(AbstractType):
-    __resource_type__ = "ClaimResponseItemDetailSubDetail"
-
-
-class ClaimResponseItemDetailSubDetailAdjudicationType(AbstractType):
-    __resource_type__ = "ClaimResponseItemDetailSubDetailAdjudication"
-
-
-class ClaimResponseNoteType(AbstractType):
-    __resource_type__ = "ClaimResponseNote"
-
-
-class ClinicalImpressionType(AbstractType):
-    __resource_type__ = "ClinicalImpression"
-
-
-class ClinicalImpressionFindingType(AbstractType):
-    __resource_type__ = "ClinicalImpressionFinding"
-
-
-class ClinicalImpressionInvestigationsType(AbstractType):
-    __resource_type__ = "ClinicalImpressionInvestigations"
-
-
-class ClinicalImpressionRuledOutType(AbstractType):
-    __resource_type__ = "ClinicalImpressionRuledOut"
-
-
-class CommunicationType(AbstractType):
-    __resource_type__ = "Communication"
-
-
-class CommunicationPayloadType(AbstractType):
-    __resource_type__ = "CommunicationPayload"
-
-
-class CommunicationRequestType(AbstractType):
-    __resource_type__ = "CommunicationRequest"
-
-
-class CommunicationRequestPayloadType(AbstractType):
-    __resource_type__ = "CommunicationRequestPayload"
-
-
-class CompositionType(AbstractType):
-    __resource_type__ = "Composition"
-
-
-class CompositionAttesterType(AbstractType):
-    __resource_type__ = "CompositionAttester"
-
-
-class CompositionEventType(AbstractType):
-    __resource_type__ = "CompositionEvent"
-
+class GroupType(AbstractType):
+    __resource_type__ = "Group"
 
-class CompositionSectionType(AbstractType):
-    __resource_type__ = "CompositionSection"
 
+class ElementDefinitionSlicingDiscriminatorType(AbstractType):
+    __resource_type__ = "ElementDefinitionSlicingDiscriminator"
 
-class ConceptMapType(AbstractType):
-    __resource_type__ = "ConceptMap"
 
+class ElementDefinitionExampleType(AbstractType):
+    __resource_type__ = "ElementDefinitionExample"
 
-class ConceptMapContactType(AbstractType):
-    __resource_type__ = "ConceptMapContact"
 
+class ElementDefinitionBindingValueSetType(AbstractType):
+    __resource_type__ = "ElementDefinitionBindingValueSet"
 
-class ConceptMapElementType(AbstractType):
-    __resource_type__ = "ConceptMapElement"
 
+class RelatedPersonType(AbstractType):
+    __resource_type__ = "RelatedPerson"
 
-class ConceptMapElementTargetType(AbstractType):
-    __resource_type__ = "ConceptMapElementTarget"
 
+class ImagingStudyType(AbstractType):
+    __resource_type__ = "ImagingStudy"
 
-class ConceptMapElementTargetDependsOnType(AbstractType):
-    __resource_type__ = "ConceptMapElementTargetDependsOn"
 
+class ImagingStudySeriesType(AbstractType):
+    __resource_type__ = "ImagingStudySeries"
 
-class ConditionType(AbstractType):
-    __resource_type__ = "Condition"
 
+class ImagingStudySeriesInstanceType(AbstractType):
+    __resource_type__ = "ImagingStudySeriesInstance"
 
-class ConditionEvidenceType(AbstractType):
-    __resource_type__ = "ConditionEvidence"
 
+class ImmunizationRecommendationType(AbstractType):
+    __resource_type__ = "ImmunizationRecommendation"
 
-class ConditionStageType(AbstractType):
-    __resource_type__ = "ConditionStage"
 
+class ImmunizationRecommendationRecommendationType(AbstractType):
+    __resource_type__ = "ImmunizationRecommendationRecommendation"
 
-class ConformanceType(AbstractType):
-    __resource_type__ = "Conformance"
 
+class ImmunizationRecommendationRecommendationDateCriterionType(AbstractType):
+    __resource_type__ = "ImmunizationRecommendationRecommendationDateCriterion"
 
-class ConformanceContactType(AbstractType):
-    __resource_type__ = "ConformanceContact"
 
+class ImmunizationRecommendationRecommendationProtocolType(AbstractType):
+    __resource_type__ = "ImmunizationRecommendationRecommendationProtocol"
 
-class ConformanceDocumentType(AbstractType):
-    __resource_type__ = "ConformanceDocument"
 
+class ImplementationGuideType(AbstractType):
+    __resource_type__ = "ImplementationGuide"
 
-class ConformanceImplementationType(AbstractType):
-    __resource_type__ = "ConformanceImplementation"
 
+class ImplementationGuideContactType(AbstractType):
+    __resource_type__ = "ImplementationGuideContact"
 
-class ConformanceMessagingType(AbstractType):
-    __resource_type__ = "ConformanceMessaging"
 
+class ImplementationGuideDependencyType(AbstractType):
+    __resource_type__ = "ImplementationGuideDependency"
 
-class ConformanceMessagingEndpointType(AbstractType):
-    __resource_type__ = "ConformanceMessagingEndpoint"
 
+class ImplementationGuideGlobalType(AbstractType):
+    __resource_type__ = "ImplementationGuideGlobal"
 
-class ConformanceMessagingEventType(AbstractType):
-    __resource_type__ = "ConformanceMessagingEvent"
 
+class ImplementationGuidePackageType(AbstractType):
+    __resource_type__ = "ImplementationGuidePackage"
 
-class ConformanceRestType(AbstractType):
-    __resource_type__ = "ConformanceRest"
 
+class ImplementationGuidePackageResourceType(AbstractType):
+    __resource_type__ = "ImplementationGuidePackageResource"
 
-class ConformanceRestInteractionType(AbstractType):
-    __resource_type__ = "ConformanceRestInteraction"
 
+class ImplementationGuidePageType(AbstractType):
+    __resource_type__ = "ImplementationGuidePage"
 
-class ConformanceRestOperationType(AbstractType):
-    __resource_type__ = "ConformanceRestOperation"
 
+class MedicationDispenseType(AbstractType):
+    __resource_type__ = "MedicationDispense"
 
-class ConformanceRestResourceType(AbstractType):
-    __resource_type__ = "ConformanceRestResource"
 
+class MedicationDispenseDosageInstructionType(AbstractType):
+    __resource_type__ = "MedicationDispenseDosageInstruction"
 
-class ConformanceRestResourceInteractionType(AbstractType):
-    __resource_type__ = "ConformanceRestResourceInteraction"
 
+class MedicationDispenseSubstitutionType(AbstractType):
+    __resource_type__ = "MedicationDispenseSubstitution"
 
-class ConformanceRestSecurityType(AbstractType):
-    __resource_type__ = "ConformanceRestSecurity"
 
+class MessageHeaderType(AbstractType):
+    __resource_type__ = "MessageHeader"
 
-class ConformanceRestSecurityCertificateType(AbstractType):
-    __resource_type__ = "ConformanceRestSecurityCertificate"
 
+class MessageHeaderDestinationType(AbstractType):
+    __resource_type__ = "MessageHeaderDestination"
 
-class ConformanceSoftwareType(AbstractType):
-    __resource_type__ = "ConformanceSoftware"
 
+class MessageHeaderResponseType(AbstractType):
+    __resource_type__ = "MessageHeaderResponse"
 
-class ConformanceRestResourceSearchParamType(AbstractType):
-    __resource_type__ = "ConformanceRestResourceSearchParam"
 
+class MessageHeaderSourceType(AbstractType):
+    __resource_type__ = "MessageHeaderSource"
 
-class PatientType(AbstractType):
-    __resource_type__ = "Patient"
 
+class NamingSystemType(AbstractType):
+    __resource_type__ = "NamingSystem"
 
-class PatientAnimalType(AbstractType):
-    __resource_type__ = "PatientAnimal"
 
+class NamingSystemContactType(AbstractType):
+    __resource_type__ = "NamingSystemContact"
 
-class PatientCommunicationType(AbstractType):
-    __resource_type__ = "PatientCommunication"
 
+class NamingSystemUniqueIdType(AbstractType):
+    __resource_type__ = "NamingSystemUniqueId"
 
-class PatientContactType(AbstractType):
-    __resource_type__ = "PatientContact"
 
+class ListType(AbstractType):
+    __resource_type__ = "List"
 
-class PatientLinkType(AbstractType):
-    __resource_type__ = "PatientLink"
 
+class ListEntryType(AbstractType):
+    __resource_type__ = "ListEntry"
 
-class OrderType(AbstractType):
-    __resource_type__ = "Order"
 
+class ParametersType(AbstractType):
+    __resource_type__ = "Parameters"
 
-class OrderWhenType(AbstractType):
-    __resource_type__ = "OrderWhen"
 
+def make_fhir_type_class(model_name: str) -> Type[AbstractType]:
+    """``<model name>Type`` classes are created on first access (see ``__getattr__``),
+    so that only types those are actually referenced by imported models are made."""
+    name = model_name + "Type"
+    klass = type(
+        name, (AbstractType,), {"__resource_type__": model_name, "__module__": __name__}
+    )
+    # in case of concurrent access, first one wins.
+    return globals().setdefault(name, klass)
 
-class OrderResponseType(AbstractType):
-    __resource_type__ = "OrderResponse"
 
+def __getattr__(name: str) -> Any:
+    """ """
+    if name.endswith("Type") and name[:-4] in MODEL_NAMES:
+        return make_fhir_type_class(name[:-4])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-class OrganizationType(AbstractType):
-    __resource_type__ = "Organization"
 
-
-class OrganizationContactType(AbstractType):
-    __resource_type__ = "OrganizationContact"
-
-
-class PersonType(AbstractType):
-    __resource_type__ = "Person"
-
-
-class PersonLinkType(AbstractType):
-    __resource_type__ = "PersonLink"
-
-
-class PractitionerType(AbstractType):
-    __resource_type__ = "Practitioner"
-
-
-class PractitionerPractitionerRoleType(AbstractType):
-    __resource_type__ = "PractitionerPractitionerRole"
-
-
-class PractitionerQualificationType(AbstractType):
-    __resource_type__ = "PractitionerQualification"
-
-
-class ValueSetType(AbstractType):
-    __resource_type__ = "ValueSet"
-
-
-class ValueSetCodeSystemType(AbstractType):
-    __resource_type__ = "ValueSetCodeSystem"
-
-
-class ValueSetCodeSystemConceptType(AbstractType):
-    __resource_type__ = "ValueSetCodeSystemConcept"
-
-
-class ValueSetCodeSystemConceptDesignationType(AbstractType):
-    __resource_type__ = "ValueSetCodeSystemConceptDesignation"
-
-
-class ValueSetComposeType(AbstractType):
-    __resource_type__ = "ValueSetCompose"
-
-
-class ValueSetComposeIncludeType(AbstractType):
-    __resource_type__ = "ValueSetComposeInclude"
-
-
-class ValueSetComposeIncludeConceptType(AbstractType):
-    __resource_type__ = "ValueSetComposeIncludeConcept"
-
-
-class ValueSetComposeIncludeFilterType(AbstractType):
-    __resource_type__ = "ValueSetComposeIncludeFilter"
-
-
-class ValueSetContactType(AbstractType):
-    __resource_type__ = "ValueSetContact"
-
-
-class ValueSetExpansionType(AbstractType):
-    __resource_type__ = "ValueSetExpansion"
-
-
-class ValueSetExpansionContainsType(AbstractType):
-    __resource_type__ = "ValueSetExpansionContains"
-
-
-class ValueSetExpansionParameterType(AbstractType):
-    __resource_type__ = "ValueSetExpansionParameter"
-
-
-class ProcedureType(AbstractType):
-    __resource_type__ = "Procedure"
-
-
-class ProcedureFocalDeviceType(AbstractType):
-    __resource_type__ = "ProcedureFocalDevice"
-
-
-class ProcedurePerformerType(AbstractType):
-    __resource_type__ = "ProcedurePerformer"
-
-
-class ProcedureRequestType(AbstractType):
-    __resource_type__ = "ProcedureRequest"
-
-
-class DiagnosticReportType(AbstractType):
-    __resource_type__ = "DiagnosticReport"
-
-
-class DiagnosticReportImageType(AbstractType):
-    __resource_type__ = "DiagnosticReportImage"
-
-
-class DocumentReferenceType(AbstractType):
-    __resource_type__ = "DocumentReference"
-
-
-class DocumentReferenceContentType(AbstractType):
-    __resource_type__ = "DocumentReferenceContent"
-
-
-class DocumentReferenceContextType(AbstractType):
-    __resource_type__ = "DocumentReferenceContext"
-
-
-class DocumentReferenceContextRelatedType(AbstractType):
-    __resource_type__ = "DocumentReferenceContextRelated"
-
-
-class DocumentReferenceRelatesToType(AbstractType):
-    __resource_type__ = "DocumentReferenceRelatesTo"
-
-
-class DocumentManifestType(AbstractType):
-    __resource_type__ = "DocumentManifest"
-
-
-class DocumentManifestContentType(AbstractType):
-    __resource_type__ = "DocumentManifestContent"
-
-
-class DocumentManifestRelatedType(AbstractType):
-    __resource_type__ = "DocumentManifestRelated"
-
-
-class GoalType(AbstractType):
-    __resource_type__ = "Goal"
-
-
-class GoalOutcomeType(AbstractType):
-    __resource_type__ = "GoalOutcome"
-
-
-class GroupType(AbstractType):
-    __resource_type__ = "Group"
-
-
-class GroupCharacteristicType(AbstractType):
-    __resource_type__ = "GroupCharacteristic"
-
-
-class GroupMemberType(AbstractType):
-    __resource_type__ = "GroupMember"
-
-
-class ElementDefinitionType(AbstractType):
-    __resource_type__ = "ElementDefinition"
-
-
-class ElementDefinitionSlicingType(AbstractType):
-    __resource_type__ = "ElementDefinitionSlicing"
-
-
-class ElementDefinitionSlicingDiscriminatorType(AbstractType):
-    __resource_type__ = "ElementDefinitionSlicingDiscriminator"
-
-
-class ElementDefinitionTypeType(AbstractType):
-    __resource_type__ = "ElementDefinitionType"
-
-
-class ElementDefinitionMappingType(AbstractType):
-    __resource_type__ = "ElementDefinitionMapping"
-
-
-class ElementDefinitionExampleType(AbstractType):
-    __resource_type__ = "ElementDefinitionExample"
-
-
-class ElementDefinitionConstraintType(AbstractType):
-    __resource_type__ = "ElementDefinitionConstraint"
-
-
-class ElementDefinitionBaseType(AbstractType):
-    __resource_type__ = "ElementDefinitionBase"
-
-
-class ElementDefinitionBindingType(AbstractType):
-    __resource_type__ = "ElementDefinitionBinding"
-
-
-class ElementDefinitionBindingValueSetType(AbstractType):
-    __resource_type__ = "ElementDefinitionBindingValueSet"
-
-
-class EligibilityRequestType(AbstractType):
-    __resource_type__ = "EligibilityRequest"
-
-
-class EligibilityResponseType(AbstractType):
-    __resource_type__ = "EligibilityResponse"
-
-
-class EncounterType(AbstractType):
-    __resource_type__ = "Encounter"
-
-
-class EncounterHospitalizationType(AbstractType):
-    __resource_type__ = "EncounterHospitalization"
-
-
-class EncounterLocationType(AbstractType):
-    __resource_type__ = "EncounterLocation"
-
-
-class EncounterParticipantType(AbstractType):
-    __resource_type__ = "EncounterParticipant"
-
-
-class EncounterStatusHistoryType(AbstractType):
-    __resource_type__ = "EncounterStatusHistory"
-
-
-class EnrollmentRequestType(AbstractType):
-    __resource_type__ = "EnrollmentRequest"
-
-
-class EnrollmentResponseType(AbstractType):
-    __resource_type__ = "EnrollmentResponse"
-
-
-class ImmunizationType(AbstractType):
-    __resource_type__ = "Immunization"
-
-
-class ImmunizationExplanationType(AbstractType):
-    __resource_type__ = "ImmunizationExplanation"
-
-
-class ImmunizationReactionType(AbstractType):
-    __resource_type__ = "ImmunizationReaction"
-
-
-class ImmunizationVaccinationProtocolType(AbstractType):
-    __resource_type__ = "ImmunizationVaccinationProtocol"
-
-
-class MedicationAdministrationType(AbstractType):
-    __resource_type__ = "MedicationAdministration"
-
-
-class MedicationAdministrationDosageType(AbstractType):
-    __resource_type__ = "MedicationAdministrationDosage"
-
-
-class MedicationStatementType(AbstractType):
-    __resource_type__ = "MedicationStatement"
-
-
-class MedicationStatementDosageType(AbstractType):
-    __resource_type__ = "MedicationStatementDosage"
-
-
-class ObservationType(AbstractType):
-    __resource_type__ = "Observation"
-
-
-class ObservationComponentType(AbstractType):
-    __resource_type__ = "ObservationComponent"
-
-
-class ObservationReferenceRangeType(AbstractType):
-    __resource_type__ = "ObservationReferenceRange"
-
-
-class ObservationRelatedType(AbstractType):
-    __resource_type__ = "ObservationRelated"
-
-
-class OperationOutcomeType(AbstractType):
-    __resource_type__ = "OperationOutcome"
-
-
-class OperationOutcomeIssueType(AbstractType):
-    __resource_type__ = "OperationOutcomeIssue"
-
-
-class MedicationType(AbstractType):
-    __resource_type__ = "Medication"
-
-
-class MedicationPackageType(AbstractType):
-    __resource_type__ = "MedicationPackage"
-
-
-class MedicationPackageContentType(AbstractType):
-    __resource_type__ = "MedicationPackageContent"
-
-
-class MedicationProductType(AbstractType):
-    __resource_type__ = "MedicationProduct"
-
-
-class MedicationProductBatchType(AbstractType):
-    __resource_type__ = "MedicationProductBatch"
-
-
-class MedicationProductIngredientType(AbstractType):
-    __resource_type__ = "MedicationProductIngredient"
-
-
-class ContractType(AbstractType):
-    __resource_type__ = "Contract"
-
-
-class ContractActorType(AbstractType):
-    __resource_type__ = "ContractActor"
-
-
-class ContractFriendlyType(AbstractType):
-    __resource_type__ = "ContractFriendly"
-
-
-class ContractLegalType(AbstractType):
-    __resource_type__ = "ContractLegal"
-
-
-class ContractRuleType(AbstractType):
-    __resource_type__ = "ContractRule"
-
-
-class ContractSignerType(AbstractType):
-    __resource_type__ = "ContractSigner"
-
-
-class ContractTermType(AbstractType):
-    __resource_type__ = "ContractTerm"
-
-
-class ContractTermActorType(AbstractType):
-    __resource_type__ = "ContractTermActor"
-
-
-class ContractTermValuedItemType(AbstractType):
-    __resource_type__ = "ContractTermValuedItem"
-
-
-class ContractValuedItemType(AbstractType):
-    __resource_type__ = "ContractValuedItem"
-
-
-class DeviceType(AbstractType):
-    __resource_type__ = "Device"
-
-
-class RelatedPersonType(AbstractType):
-    __resource_type__ = "RelatedPerson"
-
-
-class DetectedIssueType(AbstractType):
-    __resource_type__ = "DetectedIssue"
-
-
-class DetectedIssueMitigationType(AbstractType):
-    __resource_type__ = "DetectedIssueMitigation"
-
-
-class DataElementType(AbstractType):
-    __resource_type__ = "DataElement"
-
-
-class DataElementContactType(AbstractType):
-    __resource_type__ = "DataElementContact"
-
-
-class DataElementMappingType(AbstractType):
-    __resource_type__ = "DataElementMapping"
-
-
-class DeviceComponentType(AbstractType):
-    __resource_type__ = "DeviceComponent"
-
-
-class DeviceComponentProductionSpecificationType(AbstractType):
-    __resource_type__ = "DeviceComponentProductionSpecification"
-
-
-class DeviceMetricType(AbstractType):
-    __resource_type__ = "DeviceMetric"
-
-
-class DeviceMetricCalibrationType(AbstractType):
-    __resource_type__ = "DeviceMetricCalibration"
-
-
-class DeviceUseRequestType(AbstractType):
-    __resource_type__ = "DeviceUseRequest"
-
-
-class DeviceUseStatementType(AbstractType):
-    __resource_type__ = "DeviceUseStatement"
-
-
-class DiagnosticOrderType(AbstractType):
-    __resource_type__ = "DiagnosticOrder"
-
-
-class DiagnosticOrderEventType(AbstractType):
-    __resource_type__ = "DiagnosticOrderEvent"
-
-
-class DiagnosticOrderItemType(AbstractType):
-    __resource_type__ = "DiagnosticOrderItem"
-
-
-class EpisodeOfCareType(AbstractType):
-    __resource_type__ = "EpisodeOfCare"
-
-
-class EpisodeOfCareCareTeamType(AbstractType):
-    __resource_type__ = "EpisodeOfCareCareTeam"
-
-
-class EpisodeOfCareStatusHistoryType(AbstractType):
-    __resource_type__ = "EpisodeOfCareStatusHistory"
-
-
-class FamilyMemberHistoryType(AbstractType):
-    __resource_type__ = "FamilyMemberHistory"
-
-
-class FamilyMemberHistoryConditionType(AbstractType):
-    __resource_type__ = "FamilyMemberHistoryCondition"
-
-
-class ExplanationOfBenefitType(AbstractType):
-    __resource_type__ = "ExplanationOfBenefit"
-
-
-class HealthcareServiceType(AbstractType):
-    __resource_type__ = "HealthcareService"
-
-
-class HealthcareServiceAvailableTimeType(AbstractType):
-    __resource_type__ = "HealthcareServiceAvailableTime"
-
-
-class HealthcareServiceNotAvailableType(AbstractType):
-    __resource_type__ = "HealthcareServiceNotAvailable"
-
-
-class HealthcareServiceServiceTypeType(AbstractType):
-    __resource_type__ = "HealthcareServiceServiceType"
-
-
-class ImagingObjectSelectionType(AbstractType):
-    __resource_type__ = "ImagingObjectSelection"
-
-
-class ImagingObjectSelectionStudyType(AbstractType):
-    __resource_type__ = "ImagingObjectSelectionStudy"
-
-
-class ImagingObjectSelectionStudySeriesType(AbstractType):
-    __resource_type__ = "ImagingObjectSelectionStudySeries"
-
-
-class ImagingObjectSelectionStudySeriesInstanceType(AbstractType):
-    __resource_type__ = "ImagingObjectSelectionStudySeriesInstance"
-
-
-class ImagingObjectSelectionStudySeriesInstanceFramesType(AbstractType):
-    __resource_type__ = "ImagingObjectSelectionStudySeriesInstanceFrames"
-
-
-class ImagingStudyType(AbstractType):
-    __resource_type__ = "ImagingStudy"
-
-
-class ImagingStudySeriesType(AbstractType):
-    __resource_type__ = "ImagingStudySeries"
-
-
-class ImagingStudySeriesInstanceType(AbstractType):
-    __resource_type__ = "ImagingStudySeriesInstance"
-
-
-class ImmunizationRecommendationType(AbstractType):
-    __resource_type__ = "ImmunizationRecommendation"
-
-
-class ImmunizationRecommendationRecommendationType(AbstractType):
-    __resource_type__ = "ImmunizationRecommendationRecommendation"
-
-
-class ImmunizationRecommendationRecommendationDateCriterionType(AbstractType):
-    __resource_type__ = "ImmunizationRecommendationRecommendationDateCriterion"
-
-
-class ImmunizationRecommendationRecommendationProtocolType(AbstractType):
-    __resource_type__ = "ImmunizationRecommendationRecommendationProtocol"
-
-
-class ImplementationGuideType(AbstractType):
-    __resource_type__ = "ImplementationGuide"
-
-
-class ImplementationGuideContactType(AbstractType):
-    __resource_type__ = "ImplementationGuideContact"
-
-
-class ImplementationGuideDependencyType(AbstractType):
-    __resource_type__ = "ImplementationGuideDependency"
-
-
-class ImplementationGuideGlobalType(AbstractType):
-    __resource_type__ = "ImplementationGuideGlobal"
-
-
-class ImplementationGuidePackageType(AbstractType):
-    __resource_type__ = "ImplementationGuidePackage"
-
-
-class ImplementationGuidePackageResourceType(AbstractType):
-    __resource_type__ = "ImplementationGuidePackageResource"
-
-
-class ImplementationGuidePageType(AbstractType):
-    __resource_type__ = "ImplementationGuidePage"
-
-
-class MedicationDispenseType(AbstractType):
-    __resource_type__ = "MedicationDispense"
-
-
-class MedicationDispenseDosageInstructionType(AbstractType):
-    __resource_type__ = "MedicationDispenseDosageInstruction"
-
-
-class MedicationDispenseSubstitutionType(AbstractType):
-    __resource_type__ = "MedicationDispenseSubstitution"
-
-
-class MedicationOrderType(AbstractType):
-    __resource_type__ = "MedicationOrder"
-
-
-class MedicationOrderDispenseRequestType(AbstractType):
-    __resource_type__ = "MedicationOrderDispenseRequest"
-
-
-class MedicationOrderDosageInstructionType(AbstractType):
-    __resource_type__ = "MedicationOrderDosageInstruction"
-
-
-class MedicationOrderSubstitutionType(AbstractType):
-    __resource_type__ = "MedicationOrderSubstitution"
-
-
-class MessageHeaderType(AbstractType):
-    __resource_type__ = "MessageHeader"
-
-
-class MessageHeaderDestinationType(AbstractType):
-    __resource_type__ = "MessageHeaderDestination"
-
-
-class MessageHeaderResponseType(AbstractType):
-    __resource_type__ = "MessageHeaderResponse"
-
-
-class MessageHeaderSourceType(AbstractType):
-    __resource_type__ = "MessageHeaderSource"
-
-
-class NamingSystemType(AbstractType):
-    __resource_type__ = "NamingSystem"
-
-
-class NamingSystemContactType(AbstractType):
-    __resource_type__ = "NamingSystemContact"
-
-
-class NamingSystemUniqueIdType(AbstractType):
-    __resource_type__ = "NamingSystemUniqueId"
-
-
-class ListType(AbstractType):
-    __resource_type__ = "List"
-
-
-class ListEntryType(AbstractType):
-    __resource_type__ = "ListEntry"
-
-
-class NutritionOrderType(AbstractType):
-    __resource_type__ = "NutritionOrder"
-
-
-class NutritionOrderOralDietType(AbstractType):
-    __resource_type__ = "NutritionOrderOralDiet"
-
-
-class NutritionOrderSupplementType(AbstractType):
-    __resource_type__ = "NutritionOrderSupplement"
-
-
-class NutritionOrderEnteralFormulaType(AbstractType):
-    __resource_type__ = "NutritionOrderEnteralFormula"
-
-
-class NutritionOrderOralDietNutrientType(AbstractType):
-    __resource_type__ = "NutritionOrderOralDietNutrient"
-
-
-class NutritionOrderOralDietTextureType(AbstractType):
-    __resource_type__ = "NutritionOrderOralDietTexture"
-
-
-class NutritionOrderEnteralFormulaAdministrationType(AbstractType):
-    __resource_type__ = "NutritionOrderEnteralFormulaAdministration"
-
-
-class OperationDefinitionType(AbstractType):
-    __resource_type__ = "OperationDefinition"
-
-
-class OperationDefinitionContactType(AbstractType):
-    __resource_type__ = "OperationDefinitionContact"
-
-
-class OperationDefinitionParameterType(AbstractType):
-    __resource_type__ = "OperationDefinitionParameter"
-
-
-class OperationDefinitionParameterBindingType(AbstractType):
-    __resource_type__ = "OperationDefinitionParameterBinding"
-
-
-class ParametersType(AbstractType):
-    __resource_type__ = "Parameters"
-
-
-class ParametersParameterType(AbstractType):
-    __resource_type__ = "ParametersParameter"
-
-
-class ProcessResponseType(AbstractType):
-    __resource_type__ = "ProcessResponse"
-
-
-class ProcessResponseNotesType(AbstractType):
-    __resource_type__ = "ProcessResponseNotes"
-
-
-class ProcessRequestType(AbstractType):
-    __resource_type__ = "ProcessRequest"
-
-
-class ProcessRequestItemType(AbstractType):
-    __resource_type__ = "ProcessRequestItem"
-
-
-class PaymentReconciliationType(AbstractType):
-    __resource_type__ = "PaymentReconciliation"
-
-
-class PaymentReconciliationDetailType(AbstractType):
-    __resource_type__ = "PaymentReconciliationDetail"
-
-
-class PaymentReconciliationNoteType(AbstractType):
-    __resource_type__ = "PaymentReconciliationNote"
-
-
-class PaymentNoticeType(AbstractType):
-    __resource_type__ = "PaymentNotice"
-
-
-class ProvenanceType(AbstractType):
-    __resource_type__ = "Provenance"
-
-
-class ProvenanceAgentType(AbstractType):
-    __resource_type__ = "ProvenanceAgent"
-
-
-class ProvenanceAgentRelatedAgentType(AbstractType):
-    __resource_type__ = "ProvenanceAgentRelatedAgent"
-
-
-class ProvenanceEntityType(AbstractType):
-    __resource_type__ = "ProvenanceEntity"
-
-
-class QuestionnaireResponseType(AbstractType):
-    __resource_type__ = "QuestionnaireResponse"
-
-
-class QuestionnaireResponseGroupType(AbstractType):
-    __resource_type__ = "QuestionnaireResponseGroup"
-
-
-class QuestionnaireResponseGroupQuestionType(AbstractType):
-    __resource_type__ = "QuestionnaireResponseGroupQuestion"
-
-
-class QuestionnaireResponseGroupQuestionAnswerType(AbstractType):
-    __resource_type__ = "QuestionnaireResponseGroupQuestionAnswer"
-
-
-class QuestionnaireType(AbstractType):
-    __resource_type__ = "Questionnaire"
-
-
-class QuestionnaireGroupType(AbstractType):
-    __resource_type__ = "QuestionnaireGroup"
-
-
-class QuestionnaireGroupQuestionType(AbstractType):
-    __resource_type__ = "QuestionnaireGroupQuestion"
-
-
-class ReferralRequestType(AbstractType):
-    __resource_type__ = "ReferralRequest"
-
-
-class RiskAssessmentType(AbstractType):
-    __resource_type__ = "RiskAssessment"
-
-
-class RiskAssessmentPredictionType(AbstractType):
-    __resource_type__ = "RiskAssessmentPrediction"
-
-
-class SearchParameterType(AbstractType):
-    __resource_type__ = "SearchParameter"
-
-
-class SearchParameterContactType(AbstractType):
-    __resource_type__ = "SearchParameterContact"
-
-
-class SubscriptionType(AbstractType):
-    __resource_type__ = "Subscription"
-
-
-class SubscriptionChannelType(AbstractType):
-    __resource_type__ = "SubscriptionChannel"
-
-
-class SubstanceType(AbstractType):
-    __resource_type__ = "Substance"
-
-
-class SubstanceInstanceType(AbstractType):
-    __resource_type__ = "SubstanceInstance"
-
-
-class SubstanceIngredientType(AbstractType):
-    __resource_type__ = "SubstanceIngredient"
-
-
-class SupplyDeliveryType(AbstractType):
-    __resource_type__ = "SupplyDelivery"
-
-
-class SupplyRequestType(AbstractType):
-    __resource_type__ = "SupplyRequest"
-
-
-class SupplyRequestWhenType(AbstractType):
-    __resource_type__ = "SupplyRequestWhen"
-
-
-class TestScriptType(AbstractType):
-    __resource_type__ = "TestScript"
-
-
-class TestScriptContactType(AbstractType):
-    __resource_type__ = "TestScriptContact"
-
-
-class TestScriptMetadataType(AbstractType):
-    __resource_type__ = "TestScriptMetadata"
-
-
-class TestScriptFixtureType(AbstractType):
-    __resource_type__ = "TestScriptFixture"
-
-
-class TestScriptVariableType(AbstractType):
-    __resource_type__ = "TestScriptVariable"
-
-
-class TestScriptSetupType(AbstractType):
-    __resource_type__ = "TestScriptSetup"
-
-
-class TestScriptTestType(AbstractType):
-    __resource_type__ = "TestScriptTest"
-
-
-class TestScriptTeardownType(AbstractType):
-    __resource_type__ = "TestScriptTeardown"
-
-
-class TestScriptMetadataLinkType(AbstractType):
-    __resource_type__ = "TestScriptMetadataLink"
-
-
-class TestScriptMetadataCapabilityType(AbstractType):
-    __resource_type__ = "TestScriptMetadataCapability"
-
-
-class TestScriptSetupActionType(AbstractType):
-    __resource_type__ = "TestScriptSetupAction"
-
-
-class TestScriptTestActionType(AbstractType):
-    __resource_type__ = "TestScriptTestAction"
-
-
-class TestScriptTeardownActionType(AbstractType):
-    __resource_type__ = "TestScriptTeardownAction"
-
-
-class TestScriptSetupActionOperationType(AbstractType):
-    __resource_type__ = "TestScriptSetupActionOperation"
-
-
-class TestScriptSetupActionAssertType(AbstractType):
-    __resource_type__ = "TestScriptSetupActionAssert"
-
-
-class TestScriptSetupActionOperationRequestHeaderType(AbstractType):
-    __resource_type__ = "TestScriptSetupActionOperationRequestHeader"
-
-
-class VisionPrescriptionType(AbstractType):
-    __resource_type__ = "VisionPrescription"
-
-
-class VisionPrescriptionDispenseType(AbstractType):
-    __resource_type__ = "VisionPrescriptionDispense"
-
-
-class SpecimenType(AbstractType):
-    __resource_type__ = "Specimen"
-
-
-class SpecimenCollectionType(AbstractType):
-    __resource_type__ = "SpecimenCollection"
-
-
-class SpecimenTreatmentType(AbstractType):
-    __resource_type__ = "SpecimenTreatment"
-
-
-class SpecimenContainerType(AbstractType):
-    __resource_type__ = "SpecimenContainer"
+def __dir__():
+    """ """
+    return sorted(set(globals()) | set(__all__))
 
 
-__all__ = [
+__all__ = [  # noqa: F822
     "ElementType",
     "ResourceType",
     "DomainResourceType",
@@ -1,8 +1,11 @@
 # _*_ coding: utf-8 _*_
 """Validators for ``pydantic`` Custom DataType"""
 import importlib
+import threading
 import typing
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Union
 
 from pydantic.class_validators import make_generic_validator
@@ -336,24 +339,66 @@ MODEL_CLASSES = {
     "TestScriptSetupActionOperationRequestHeader": (None, ".testscript"),
 }
 
+# Registry is immutable (read without any lock), it is replaced as a whole
+# (copy on write, see ``get_fhir_model_class``) whenever a module is resolved.
+MODEL_CLASSES = MappingProxyType(MODEL_CLASSES)
+MODEL_CLASSES_LOCK = threading.Lock()
+MODEL_NAMES = frozenset(MODEL_CLASSES)
+
+# resourceType -> (model class, prepared validators), see ``get_fhir_type_validators``
+FHIR_TYPE_VALIDATORS: typing.Dict[
+    str,
+    typing.Tuple[typing.Type[FHIRAbstractModel], typing.Tuple[typing.Callable, ...]],
+] = dict()
+
+
+@lru_cache(maxsize=None)
+def get_module_model_names(module_name: str) -> typing.Tuple[str, ...]:
+    """All model names (of ``MODEL_CLASSES``) those are defined in module."""
+    return tuple(name for name, (_, mod) in MODEL_CLASSES.items() if mod == module_name)
+
 
 def get_fhir_model_class(model_name: str) -> typing.Type[FHIRAbstractModel]:
-    """"""
+    """Lookup is lock free, while resolving all models of the module are
+    registered together and the registry is swapped as a whole."""
     global MODEL_CLASSES
     klass, module_name = MODEL_CLASSES[model_name]
     if klass is not None:
         return klass
+    # import machinery has own per module lock, a module is executed only once.
     module = importlib.import_module(module_name, package=__package__)
     klass = getattr(module, model_name)
-    MODEL_CLASSES[model_name] = (klass, module_name)
+    with MODEL_CLASSES_LOCK:
+        if MODEL_CLASSES[model_name][0] is None:
+            registry = dict(MODEL_CLASSES)
+            for name in get_module_model_names(module_name):
+                registry[name] = (getattr(module, name, None), module_name)
+            MODEL_CLASSES = MappingProxyType(registry)
     return klass
 
 
+def get_fhir_type_validators(
+    model_type_cls,
+) -> typing.Tuple[typing.Type[FHIRAbstractModel], typing.Tuple[typing.Callable, ...]]:
+    """Model class and prepared (generic) validators of ``*Type`` class,
+    signature inspection happens only once per type."""
+    try:
+        return FHIR_TYPE_VALIDATORS[model_type_cls.__resource_type__]
+    except KeyError:
+        pass
+    cls = get_fhir_model_class(model_type_cls.__resource_type__)
+    validators = tuple(
+        make_generic_validator(validator)
+        for validator in model_type_cls.__get_validators__()
+    )
+    FHIR_TYPE_VALIDATORS[model_type_cls.__resource_type__] = (cls, validators)
+    return cls, validators
+
+
 def run_validator_for_fhir_type(model_type_cls, v, values, config, field):
     """ """
-    cls = get_fhir_model_class(model_type_cls.__resource_type__)
-    for validator in model_type_cls.__get_validators__():
-        func = make_generic_validator(validator)
+    cls, validators = get_fhir_type_validators(model_type_cls)
+    for func in validators:
         v = func(cls, v, values, config, field)
     return v
 
@@ -463,1587 +508,190 @@ def fhir_model_validator(
     return v
 
 
-def fhirprimitiveextension_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-
-    return fhir_model_validator("FHIRPrimitiveExtension", v)
-
-
-def element_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-
-    return fhir_model_validator("Element", v)
-
-
-def resource_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-
-    return fhir_model_validator("Resource", v)
-
-
-def domainresource_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-
-    return fhir_model_validator("DomainResource", v)
-
-
-def backboneelement_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("BackboneElement", v)
-
-
-def extension_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Extension", v)
-
-
-def meta_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Meta", v)
-
-
-def narrative_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Narrative", v)
-
-
-def address_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Address", v)
-
-
-def period_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Period", v)
-
-
-def attachment_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Attachment", v)
-
-
-def codeableconcept_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("CodeableConcept", v)
-
-
-def coding_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Coding", v)
-
-
-def contactpoint_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ContactPoint", v)
-
-
-def humanname_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("HumanName", v)
-
-
-def identifier_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Identifier", v)
-
-
-def reference_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Reference", v)
-
-
-def quantity_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Quantity", v)
-
-
-def range_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Range", v)
-
-
-def ratio_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Ratio", v)
-
-
-def signature_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Signature", v)
-
-
-def timing_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Timing", v)
-
-
-def timingrepeat_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("TimingRepeat", v)
-
-
-def duration_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Duration", v)
-
-
-def age_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Age", v)
-
-
-def count_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Count", v)
-
-
-def money_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Money", v)
-
-
-def distance_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Distance", v)
-
-
-def sampleddata_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("SampledData", v)
-
-
-def annotation_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Annotation", v)
-
-
-def media_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Media", v)
-
-
-def basic_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Basic", v)
-
-
-def binary_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Binary", v)
-
-
-def bodysite_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("BodySite", v)
-
-
-def flag_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Flag", v)
-
-
-def location_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Location", v)
-
-
-def locationposition_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("LocationPosition", v)
-
-
-def slot_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Slot", v)
-
-
 def schedule_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
     return fhir_model_validator("Slot", v)
 
 
-def account_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Account", v)
-
-
-def allergyintolerance_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("AllergyIntolerance", v)
-
-
-def allergyintolerancereaction_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("AllergyIntoleranceReaction", v)
-
-
-def appointment_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Appointment", v)
-
-
-def appointmentparticipant_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("AppointmentParticipant", v)
-
-
-def appointmentresponse_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("AppointmentResponse", v)
-
-
-def auditevent_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("AuditEvent", v)
-
-
-def auditeventevent_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("AuditEventEvent", v)
-
-
-def auditeventobject_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("AuditEventObject", v)
-
-
-def auditeventobjectdetail_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("AuditEventObjectDetail", v)
-
-
-def auditeventparticipant_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("AuditEventParticipant", v)
-
-
-def auditeventparticipantnetwork_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("AuditEventParticipantNetwork", v)
-
-
-def auditeventsource_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("AuditEventSource", v)
-
-
-def bundle_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Bundle", v)
-
-
-def bundleentry_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("BundleEntry", v)
-
-
-def bundleentryrequest_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("BundleEntryRequest", v)
-
-
-def bundleentryresponse_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("BundleEntryResponse", v)
-
-
-def bundleentrysearch_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("BundleEntrySearch", v)
-
-
-def bundlelink_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("BundleLink", v)
-
-
-def careplan_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("CarePlan", v)
-
-
-def careplanactivity_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("CarePlanActivity", v)
-
-
-def careplanactivitydetail_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("CarePlanActivityDetail", v)
-
-
-def careplanparticipant_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("CarePlanParticipant", v)
-
-
-def careplanrelatedplan_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("CarePlanRelatedPlan", v)
-
-
-def claim_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Claim", v)
-
-
-def claimcoverage_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ClaimCoverage", v)
+def claimresponseerror_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
+    return fhir_model_validator("ClaimResponseError", v)
 
 
-def claimdiagnosis_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ClaimDiagnosis", v)
+def group_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
+    return fhir_model_validator("Group", v)
 
 
-def claimitem_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ClaimItem", v)
+def imagingstudy_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
+    return fhir_model_validator("ImagingStudy", v)
 
 
-def claimitemdetail_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ClaimItemDetail", v)
+def imagingstudyseries_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
+    return fhir_model_validator("ImagingStudySeries", v)
 
 
-def claimitemdetailsubdetail_validator(
+def imagingstudyseriesinstance_validator(
     v: Union[StrBytes, dict, Path, FHIRAbstractModel]
 ):
-    return fhir_model_validator("ClaimItemDetailSubDetail", v)
-
-
-def claimitemprosthesis_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ClaimItemProsthesis", v)
-
-
-def claimmissingteeth_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ClaimMissingTeeth", v)
-
-
-def claimpayee_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ClaimPayee", v)
-
-
-def claimresponse_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ClaimResponse", v)
-
-
-def claimresponseadditem_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ClaimResponseAddItem", v)
+    return fhir_model_validator("ImagingStudySeriesInstance", v)
 
 
-def claimresponseadditemadjudication_validator(
+def immunizationrecommendation_validator(
     v: Union[StrBytes, dict, Path, FHIRAbstractModel]
 ):
-    return fhir_model_validator("ClaimResponseAddItemAdjudication", v)
+    return fhir_model_validator("ImmunizationRecommendation", v)
 
 
-def claimresponseadditemdetail_validator(
+def immunizationrecommendationrecommendation_validator(
     v: Union[StrBytes, dict, Path, FHIRAbstractModel]
 ):
-    return fhir_model_validator("ClaimResponseAddItemDetail", v)
+    return fhir_model_validator("ImmunizationRecommendationRecommendation", v)
 
 
-def claimresponseadditemdetailadjudication_validator(
+def immunizationrecommendationrecommendationdatecriterion_validator(
     v: Union[StrBytes, dict, Path, FHIRAbstractModel]
 ):
-    return fhir_model_validator("ClaimResponseAddItemDetailAdjudication", v)
-
-
-def claimresponsecoverage_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ClaimResponseCoverage", v)
-
-
-def claimresponseerror_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ClaimResponseError", v)
-
-
-def claimresponseitem_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ClaimResponseItem", v)
+    return fhir_model_validator(
+        "ImmunizationRecommendationRecommendationDateCriterion", v
+    )
 
 
-def claimresponseitemadjudication_validator(
+def immunizationrecommendationrecommendationprotocol_validator(
     v: Union[StrBytes, dict, Path, FHIRAbstractModel]
 ):
-    return fhir_model_validator("ClaimResponseItemAdjudication", v)
+    return fhir_model_validator("ImmunizationRecommendationRecommendationProtocol", v)
 
 
-def claimresponseitemdetail_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ClaimResponseItemDetail", v)
+def implementationguide_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
+    return fhir_model_validator("ImplementationGuide", v)
 
 
-def claimresponseitemdetailadjudication_validator(
+def implementationguidecontact_validator(
     v: Union[StrBytes, dict, Path, FHIRAbstractModel]
 ):
-    return fhir_model_validator("ClaimResponseItemDetailAdjudication", v)
+    return fhir_model_validator("ImplementationGuideContact", v)
 
 
-def claimresponseitemdetailsubdetail_validator(
+def implementationguidedependency_validator(
     v: Union[StrBytes, dict, Path, FHIRAbstractModel]
 ):
-    return fhir_model_validator("ClaimResponseItemDetailSubDetail", v)
+    return fhir_model_validator("ImplementationGuideDependency", v)
 
 
-def claimresponseitemdetailsubdetailadjudication_validator(
+def implementationguideglobal_validator(
     v: Union[StrBytes, dict, Path, FHIRAbstractModel]
 ):
-    return fhir_model_validator("ClaimResponseItemDetailSubDetailAdjudication", v)
-
-
-def claimresponsenote_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ClaimResponseNote", v)
-
-
-def clinicalimpression_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ClinicalImpression", v)
+    return fhir_model_validator("ImplementationGuideGlobal", v)
 
 
-def clinicalimpressionfinding_validator(
+def implementationguidepackage_validator(
     v: Union[StrBytes, dict, Path, FHIRAbstractModel]
 ):
-    return fhir_model_validator("ClinicalImpressionFinding", v)
+    return fhir_model_validator("ImplementationGuidePackage", v)
 
 
-def clinicalimpressioninvestigations_validator(
+def implementationguidepackageresource_validator(
     v: Union[StrBytes, dict, Path, FHIRAbstractModel]
 ):
-    return fhir_model_validator("ClinicalImpressionInvestigations", v)
+    return fhir_model_validator("ImplementationGuidePackageResource", v)
 
 
-def clinicalimpressionruledout_validator(
+def implementationguidepage_validator(
     v: Union[StrBytes, dict, Path, FHIRAbstractModel]
 ):
-    return fhir_model_validator("ClinicalImpressionRuledOut", v)
+    return fhir_model_validator("ImplementationGuidePage", v)
 
 
-def communication_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Communication", v)
+def list_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
+    return fhir_model_validator("List", v)
 
 
-def communicationpayload_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("CommunicationPayload", v)
+def listentry_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
+    return fhir_model_validator("ListEntry", v)
 
 
-def communicationrequest_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("CommunicationRequest", v)
+def medicationdispense_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
+    return fhir_model_validator("MedicationDispense", v)
 
 
-def communicationrequestpayload_validator(
+def medicationdispensedosageinstruction_validator(
     v: Union[StrBytes, dict, Path, FHIRAbstractModel]
 ):
-    return fhir_model_validator("CommunicationRequestPayload", v)
-
-
-def composition_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Composition", v)
-
-
-def compositionattester_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("CompositionAttester", v)
-
-
-def compositionevent_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("CompositionEvent", v)
-
-
-def compositionsection_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("CompositionSection", v)
-
-
-def conceptmap_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ConceptMap", v)
-
-
-def conceptmapcontact_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ConceptMapContact", v)
-
-
-def conceptmapelement_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ConceptMapElement", v)
+    return fhir_model_validator("MedicationDispenseDosageInstruction", v)
 
 
-def conceptmapelementtarget_validator(
+def medicationdispensesubstitution_validator(
     v: Union[StrBytes, dict, Path, FHIRAbstractModel]
 ):
-    return fhir_model_validator("ConceptMapElementTarget", v)
-
+    return fhir_model_validator("MedicationDispenseSubstitution", v)
 
-def conceptmapelementtargetdependson_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ConceptMapElementTargetDependsOn", v)
 
+def messageheader_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
+    return fhir_model_validator("MessageHeader", v)
 
-def condition_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Condition", v)
 
+def messageheaderdestination_validator(
+    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
+):
+    return fhir_model_validator("MessageHeaderDestination", v)
 
-def conditionevidence_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ConditionEvidence", v)
 
+def messageheaderresponse_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
+    return fhir_model_validator("MessageHeaderResponse", v)
 
-def conditionstage_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ConditionStage", v)
 
+def messageheadersource_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
+    return fhir_model_validator("MessageHeaderSource", v)
 
-def conformance_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Conformance", v)
 
+def namingsystem_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
+    return fhir_model_validator("NamingSystem", v)
 
-def conformancecontact_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ConformanceContact", v)
 
+def namingsystemcontact_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
+    return fhir_model_validator("NamingSystemContact", v)
 
-def conformancedocument_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ConformanceDocument", v)
 
+def namingsystemuniqueid_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
+    return fhir_model_validator("NamingSystemUniqueId", v)
 
-def conformanceimplementation_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ConformanceImplementation", v)
 
+def parameters_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
+    return fhir_model_validator("Parameters", v)
 
-def conformancemessaging_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ConformanceMessaging", v)
 
+@lru_cache(maxsize=None)
+def get_model_names_index() -> typing.Dict[str, str]:
+    """Lower cased model name -> model name."""
+    return {model_name.lower(): model_name for model_name in MODEL_CLASSES}
 
-def conformancemessagingendpoint_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ConformanceMessagingEndpoint", v)
 
+def make_fhir_model_validator(model_name: str) -> typing.Callable:
+    """``<model name lower>_validator`` functions are created on first access
+    (see ``__getattr__``), instead of defining one function per model."""
 
-def conformancemessagingevent_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ConformanceMessagingEvent", v)
+    def validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
+        return fhir_model_validator(model_name, v)
 
+    name = model_name.lower() + "_validator"
+    validator.__name__ = validator.__qualname__ = name
+    # in case of concurrent access, first one wins.
+    return globals().setdefault(name, validator)
 
-def conformancerest_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ConformanceRest", v)
 
+def __getattr__(name: str) -> typing.Any:
+    """ """
+    if name.endswith("_validator"):
+        model_name = get_model_names_index().get(name[: -len("_validator")], None)
+        if model_name is not None:
+            return make_fhir_model_validator(model_name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-def conformancerestinteraction_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ConformanceRestInteraction", v)
 
-
-def conformancerestoperation_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ConformanceRestOperation", v)
-
-
-def conformancerestresource_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ConformanceRestResource", v)
-
-
-def conformancerestresourceinteraction_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ConformanceRestResourceInteraction", v)
-
-
-def conformancerestsecurity_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ConformanceRestSecurity", v)
-
-
-def conformancerestsecuritycertificate_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ConformanceRestSecurityCertificate", v)
-
-
-def conformancesoftware_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ConformanceSoftware", v)
-
-
-def conformancerestresourcesearchparam_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ConformanceRestResourceSearchParam", v)
-
-
-def patient_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Patient", v)
-
-
-def patientanimal_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("PatientAnimal", v)
-
-
-def patientcommunication_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("PatientCommunication", v)
-
-
-def patientcontact_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("PatientContact", v)
-
-
-def patientlink_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("PatientLink", v)
-
-
-def organization_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Organization", v)
-
-
-def organizationcontact_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("OrganizationContact", v)
-
-
-def person_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Person", v)
-
-
-def personlink_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("PersonLink", v)
-
-
-def practitioner_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Practitioner", v)
-
-
-def practitionerpractitionerrole_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("PractitionerPractitionerRole", v)
-
-
-def practitionerqualification_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("PractitionerQualification", v)
-
-
-def valueset_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ValueSet", v)
-
-
-def valuesetcodesystem_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ValueSetCodeSystem", v)
-
-
-def valuesetcodesystemconcept_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ValueSetCodeSystemConcept", v)
-
-
-def valuesetcodesystemconceptdesignation_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ValueSetCodeSystemConceptDesignation", v)
-
-
-def valuesetcompose_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ValueSetCompose", v)
-
-
-def valuesetcomposeinclude_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ValueSetComposeInclude", v)
-
-
-def valuesetcomposeincludeconcept_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ValueSetComposeIncludeConcept", v)
-
-
-def valuesetcomposeincludefilter_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ValueSetComposeIncludeFilter", v)
-
-
-def valuesetcontact_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ValueSetContact", v)
-
-
-def valuesetexpansion_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ValueSetExpansion", v)
-
-
-def valuesetexpansioncontains_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ValueSetExpansionContains", v)
-
-
-def valuesetexpansionparameter_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ValueSetExpansionParameter", v)
-
-
-def procedure_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Procedure", v)
-
-
-def procedurefocaldevice_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ProcedureFocalDevice", v)
-
-
-def procedureperformer_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ProcedurePerformer", v)
-
-
-def procedurerequest_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ProcedureRequest", v)
-
-
-def diagnosticreport_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("DiagnosticReport", v)
-
-
-def diagnosticreportimage_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("DiagnosticReportImage", v)
-
-
-def goal_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Goal", v)
-
-
-def goaloutcome_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("GoalOutcome", v)
-
-
-def group_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Group", v)
-
-
-def groupcharacteristic_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("GroupCharacteristic", v)
-
-
-def groupmember_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("GroupMember", v)
-
-
-def eligibilityrequest_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("EligibilityRequest", v)
-
-
-def eligibilityresponse_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("EligibilityResponse", v)
-
-
-def encounter_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Encounter", v)
-
-
-def encounterhospitalization_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("EncounterHospitalization", v)
-
-
-def encounterlocation_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("EncounterLocation", v)
-
-
-def encounterparticipant_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("EncounterParticipant", v)
-
-
-def encounterstatushistory_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("EncounterStatusHistory", v)
-
-
-def enrollmentrequest_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("EnrollmentRequest", v)
-
-
-def enrollmentresponse_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("EnrollmentResponse", v)
-
-
-def immunization_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Immunization", v)
-
-
-def immunizationexplanation_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ImmunizationExplanation", v)
-
-
-def immunizationreaction_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ImmunizationReaction", v)
-
-
-def immunizationvaccinationprotocol_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ImmunizationVaccinationProtocol", v)
-
-
-def medicationadministration_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MedicationAdministration", v)
-
-
-def medicationadministrationdosage_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MedicationAdministrationDosage", v)
-
-
-def medicationstatement_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("MedicationStatement", v)
-
-
-def medicationstatementdosage_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MedicationStatementDosage", v)
-
-
-def observation_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Observation", v)
-
-
-def observationcomponent_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ObservationComponent", v)
-
-
-def observationreferencerange_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ObservationReferenceRange", v)
-
-
-def observationrelated_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ObservationRelated", v)
-
-
-def operationoutcome_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("OperationOutcome", v)
-
-
-def operationoutcomeissue_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("OperationOutcomeIssue", v)
-
-
-def medication_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Medication", v)
-
-
-def medicationpackage_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("MedicationPackage", v)
-
-
-def medicationpackagecontent_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MedicationPackageContent", v)
-
-
-def medicationproduct_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("MedicationProduct", v)
-
-
-def medicationproductbatch_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("MedicationProductBatch", v)
-
-
-def medicationproductingredient_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MedicationProductIngredient", v)
-
-
-def contract_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Contract", v)
-
-
-def contractactor_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ContractActor", v)
-
-
-def contractfriendly_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ContractFriendly", v)
-
-
-def contractlegal_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ContractLegal", v)
-
-
-def contractrule_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ContractRule", v)
-
-
-def contractsigner_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ContractSigner", v)
-
-
-def contractterm_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ContractTerm", v)
-
-
-def contracttermactor_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ContractTermActor", v)
-
-
-def contracttermvalueditem_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ContractTermValuedItem", v)
-
-
-def contractvalueditem_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ContractValuedItem", v)
-
-
-def device_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Device", v)
-
-
-def dataelement_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("DataElement", v)
-
-
-def dataelementcontact_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("DataElementContact", v)
-
-
-def dataelementmapping_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("DataElementMapping", v)
-
-
-def detectedissue_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("DetectedIssue", v)
-
-
-def detectedissuemitigation_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("DetectedIssueMitigation", v)
-
-
-def devicecomponent_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("DeviceComponent", v)
-
-
-def devicecomponentproductionspecification_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("DeviceComponentProductionSpecification", v)
-
-
-def devicemetric_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("DeviceMetric", v)
-
-
-def devicemetriccalibration_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("DeviceMetricCalibration", v)
-
-
-def deviceuserequest_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("DeviceUseRequest", v)
-
-
-def deviceusestatement_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("DeviceUseStatement", v)
-
-
-def diagnosticorder_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("DiagnosticOrder", v)
-
-
-def diagnosticorderevent_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("DiagnosticOrderEvent", v)
-
-
-def diagnosticorderitem_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("DiagnosticOrderItem", v)
-
-
-def documentmanifest_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("DocumentManifest", v)
-
-
-def documentmanifestcontent_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("DocumentManifestContent", v)
-
-
-def documentmanifestrelated_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("DocumentManifestRelated", v)
-
-
-def documentreference_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("DocumentReference", v)
-
-
-def documentreferencecontent_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("DocumentReferenceContent", v)
-
-
-def documentreferencecontext_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("DocumentReferenceContext", v)
-
-
-def documentreferencecontextrelated_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("DocumentReferenceContextRelated", v)
-
-
-def documentreferencerelatesto_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("DocumentReferenceRelatesTo", v)
-
-
-def elementdefinition_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ElementDefinition", v)
-
-
-def elementdefinitionbase_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ElementDefinitionBase", v)
-
-
-def elementdefinitionbinding_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ElementDefinitionBinding", v)
-
-
-def elementdefinitionconstraint_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ElementDefinitionConstraint", v)
-
-
-def elementdefinitionmapping_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ElementDefinitionMapping", v)
-
-
-def elementdefinitionslicing_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ElementDefinitionSlicing", v)
-
-
-def elementdefinitiontype_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ElementDefinitionType", v)
-
-
-def episodeofcare_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("EpisodeOfCare", v)
-
-
-def episodeofcarecareteam_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("EpisodeOfCareCareTeam", v)
-
-
-def episodeofcarestatushistory_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("EpisodeOfCareStatusHistory", v)
-
-
-def familymemberhistory_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("FamilyMemberHistory", v)
-
-
-def familymemberhistorycondition_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("FamilyMemberHistoryCondition", v)
-
-
-def explanationofbenefit_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ExplanationOfBenefit", v)
-
-
-def healthcareservice_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("HealthcareService", v)
-
-
-def healthcareserviceavailabletime_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("HealthcareServiceAvailableTime", v)
-
-
-def healthcareservicenotavailable_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("HealthcareServiceNotAvailable", v)
-
-
-def healthcareserviceservicetype_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("HealthcareServiceServiceType", v)
-
-
-def imagingobjectselection_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ImagingObjectSelection", v)
-
-
-def imagingobjectselectionstudy_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ImagingObjectSelectionStudy", v)
-
-
-def imagingobjectselectionstudyseries_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ImagingObjectSelectionStudySeries", v)
-
-
-def imagingobjectselectionstudyseriesinstance_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ImagingObjectSelectionStudySeriesInstance", v)
-
-
-def imagingobjectselectionstudyseriesinstanceframes_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ImagingObjectSelectionStudySeriesInstanceFrames", v)
-
-
-def imagingstudy_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ImagingStudy", v)
-
-
-def imagingstudyseries_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ImagingStudySeries", v)
-
-
-def imagingstudyseriesinstance_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ImagingStudySeriesInstance", v)
-
-
-def immunizationrecommendation_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ImmunizationRecommendation", v)
-
-
-def immunizationrecommendationrecommendation_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ImmunizationRecommendationRecommendation", v)
-
-
-def immunizationrecommendationrecommendationdatecriterion_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator(
-        "ImmunizationRecommendationRecommendationDateCriterion", v
-    )
-
-
-def immunizationrecommendationrecommendationprotocol_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ImmunizationRecommendationRecommendationProtocol", v)
-
-
-def implementationguide_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ImplementationGuide", v)
-
-
-def implementationguidecontact_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ImplementationGuideContact", v)
-
-
-def implementationguidedependency_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ImplementationGuideDependency", v)
-
-
-def implementationguideglobal_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ImplementationGuideGlobal", v)
-
-
-def implementationguidepackage_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ImplementationGuidePackage", v)
-
-
-def implementationguidepackageresource_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ImplementationGuidePackageResource", v)
-
-
-def implementationguidepage_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ImplementationGuidePage", v)
-
-
-def list_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("List", v)
-
-
-def listentry_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ListEntry", v)
-
-
-def medicationdispense_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("MedicationDispense", v)
-
-
-def medicationdispensedosageinstruction_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MedicationDispenseDosageInstruction", v)
-
-
-def medicationdispensesubstitution_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MedicationDispenseSubstitution", v)
-
-
-def medicationorder_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("MedicationOrder", v)
-
-
-def medicationorderdispenserequest_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MedicationOrderDispenseRequest", v)
-
-
-def medicationorderdosageinstruction_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MedicationOrderDosageInstruction", v)
-
-
-def medicationordersubstitution_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MedicationOrderSubstitution", v)
-
-
-def messageheader_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("MessageHeader", v)
-
-
-def messageheaderdestination_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MessageHeaderDestination", v)
-
-
-def messageheaderresponse_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("MessageHeaderResponse", v)
-
-
-def messageheadersource_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("MessageHeaderSource", v)
-
-
-def namingsystem_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("NamingSystem", v)
-
-
-def namingsystemcontact_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("NamingSystemContact", v)
-
-
-def namingsystemuniqueid_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("NamingSystemUniqueId", v)
-
-
-def nutritionorder_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("NutritionOrder", v)
-
-
-def nutritionorderoraldiet_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("NutritionOrderOralDiet", v)
-
-
-def nutritionordersupplement_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("NutritionOrderSupplement", v)
-
-
-def nutritionorderenteralformula_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("NutritionOrderEnteralFormula", v)
-
-
-def nutritionorderoraldietnutrient_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("NutritionOrderOralDietNutrient", v)
-
-
-def nutritionorderoraldiettexture_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("NutritionOrderOralDietTexture", v)
-
-
-def nutritionorderenteralformulaadministration_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("NutritionOrderEnteralFormulaAdministration", v)
-
-
-def operationdefinition_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("OperationDefinition", v)
-
-
-def operationdefinitioncontact_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("OperationDefinitionContact", v)
-
-
-def operationdefinitionparameter_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("OperationDefinitionParameter", v)
-
-
-def operationdefinitionparameterbinding_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("OperationDefinitionParameterBinding", v)
-
-
-def order_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Order", v)
-
-
-def orderwhen_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("OrderWhen", v)
-
-
-def orderresponse_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("OrderResponse", v)
-
-
-def parameters_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Parameters", v)
-
-
-def parametersparameter_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ParametersParameter", v)
-
-
-def processresponse_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ProcessResponse", v)
-
-
-def processresponsenotes_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ProcessResponseNotes", v)
-
-
-def processrequest_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ProcessRequest", v)
-
-
-def processrequestitem_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ProcessRequestItem", v)
-
-
-def paymentreconciliation_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("PaymentReconciliation", v)
-
-
-def paymentreconciliationdetail_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("PaymentReconciliationDetail", v)
-
-
-def paymentreconciliationnote_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("PaymentReconciliationNote", v)
-
-
-def paymentnotice_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("PaymentNotice", v)
-
-
-def provenance_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Provenance", v)
-
-
-def provenanceagent_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ProvenanceAgent", v)
-
-
-def provenanceagentrelatedagent_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ProvenanceAgentRelatedAgent", v)
-
-
-def provenanceentity_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ProvenanceEntity", v)
-
-
-def questionnaireresponse_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("QuestionnaireResponse", v)
-
-
-def questionnaireresponsegroup_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("QuestionnaireResponseGroup", v)
-
-
-def questionnaireresponsegroupquestion_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("QuestionnaireResponseGroupQuestion", v)
-
-
-def questionnaireresponsegroupquestionanswer_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("QuestionnaireResponseGroupQuestionAnswer", v)
-
-
-def questionnaire_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Questionnaire", v)
-
-
-def questionnairegroup_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("QuestionnaireGroup", v)
-
-
-def questionnairegroupquestion_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("QuestionnaireGroupQuestion", v)
-
-
-def referralrequest_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ReferralRequest", v)
-
-
-def riskassessment_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("RiskAssessment", v)
-
-
-def riskassessmentprediction_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("RiskAssessmentPrediction", v)
-
-
-def searchparameter_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("SearchParameter", v)
-
-
-def searchparametercontact_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("SearchParameterContact", v)
-
-
-def subscription_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Subscription", v)
-
-
-def subscriptionchannel_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("SubscriptionChannel", v)
-
-
-def substance_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Substance", v)
-
-
-def substanceinstance_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("SubstanceInstance", v)
-
-
-def substanceingredient_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("SubstanceIngredient", v)
-
-
-def supplydelivery_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("SupplyDelivery", v)
-
-
-def supplyrequest_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("SupplyRequest", v)
-
-
-def supplyrequestwhen_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("SupplyRequestWhen", v)
-
-
-def visionprescription_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("VisionPrescription", v)
-
-
-def visionprescriptiondispense_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("VisionPrescriptionDispense", v)
-
-
-def specimen_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Specimen", v)
-
-
-def specimencollection_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("SpecimenCollection", v)
-
-
-def specimentreatment_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("SpecimenTreatment", v)
-
-
-def specimencontainer_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("SpecimenContainer", v)
-
-
-def testscript_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("TestScript", v)
-
-
-def testscriptcontact_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("TestScriptContact", v)
-
-
-def testscriptmetadata_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("TestScriptMetadata", v)
-
-
-def testscriptfixture_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("TestScriptFixture", v)
-
-
-def testscriptvariable_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("TestScriptVariable", v)
-
-
-def testscriptsetup_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("TestScriptSetup", v)
-
-
-def testscripttest_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("TestScriptTest", v)
-
-
-def testscriptteardown_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("TestScriptTeardown", v)
-
-
-def testscriptmetadatalink_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("TestScriptMetadataLink", v)
-
-
-def testscriptmetadatacapability_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("TestScriptMetadataCapability", v)
-
-
-def testscriptsetupaction_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("TestScriptSetupAction", v)
-
-
-def testscripttestaction_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("TestScriptTestAction", v)
-
-
-def testscriptteardownaction_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("TestScriptTeardownAction", v)
-
-
-def testscriptsetupactionoperation_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("TestScriptSetupActionOperation", v)
-
-
-def testscriptsetupactionassert_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("TestScriptSetupActionAssert", v)
-
-
-def testscriptsetupactionoperationrequestheader_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("TestScriptSetupActionOperationRequestHeader", v)
+def __dir__():
+    """ """
+    return sorted(set(globals()) | set(__all__))
 
 
-__all__ = [
+__all__ = [  # noqa: F822
     "element_validator",
     "resource_validator",
     "domainresource_validator",
@@ -6,11 +6,22 @@ Version: 3.0.2
 Revision: 11917
 Last updated: 2019-10-24T11:53:00+11:00
 """
+
 import typing
+from pathlib import Path
 
 from pydantic import Field, root_validator
 from pydantic.error_wrappers import ErrorWrapper, ValidationError
 from pydantic.errors import MissingError, NoneIsNotAllowedError
+from pydantic.utils import ROOT_KEY
+
+from fhir.resources.core.utils.bundlereader import iter_bundle_entries
+from fhir.resources.core.utils.cache import raw_options
+from fhir.resources.core.utils.lazy import (
+    LazyElement,
+    make_lazy_entries,
+    split_bundle_json,
+)
 
 from . import backboneelement, fhirtypes, resource
 
@@ -806,3 +817,75 @@ class BundleLink(backboneelement.BackboneElement):
             raise ValidationError(errors, cls)  # type: ignore
 
         return values
+
+
+class LazyBundleEntry(BundleEntry):
+    """``BundleEntry`` whose ``resource`` is kept as raw json (bytes or dict)
+    and validated into its model class only on first access, see ``LazyBundle``.
+    """
+
+
+LazyBundleEntry.resource = LazyElement("resource")  # type: ignore
+
+
+class LazyBundle(Bundle):
+    """Bundle, where each ``entry.resource`` is not validated until accessed.
+    Everything else (envelope and entries itself) is validated as usual.
+    Untouched resources are serialized (json) from raw bytes as is.
+    """
+
+    @classmethod
+    def parse_obj(cls, obj: typing.Any, **kwargs) -> "LazyBundle":
+        """ """
+        return super().parse_obj(make_lazy_entries(LazyBundleEntry, obj), **kwargs)
+
+    @classmethod
+    def parse_file(cls, path: typing.Union[str, Path], **kwargs) -> "LazyBundle":
+        """XML document is decoded as a whole (not streamed into eagerly
+        validated entries, see ``xml_load_bundle``), so resources are kept lazy."""
+        kwargs.setdefault("stream_bundle", False)
+        return super().parse_file(path, **kwargs)
+
+    @classmethod
+    def parse_raw(
+        cls, b: typing.Union[str, bytes], *, content_type: str = None, **kwargs
+    ) -> "LazyBundle":
+        """``intern``, ``frozen`` and ``cache`` are same as of ``parse_obj``."""
+        if content_type is not None and not content_type.endswith("json"):
+            # xml is decoded as a whole, so resources are kept lazy
+            kwargs.setdefault("stream_bundle", False)
+            return super().parse_raw(b, content_type=content_type, **kwargs)
+        cache = kwargs.pop("cache", None)
+        if cache is not None:
+            frozen = kwargs.pop("frozen", False)
+            return cache.get_or_parse(
+                cls,
+                b,
+                lambda: cls.parse_raw(b, content_type=content_type, **kwargs),
+                frozen=frozen,
+                options=raw_options(content_type, kwargs.get("intern", None)),
+            )
+        try:
+            obj = split_bundle_json(b, cls.__config__.json_loads)
+        except (ValueError, TypeError, UnicodeDecodeError) as exc:
+            raise ValidationError([ErrorWrapper(exc, loc=ROOT_KEY)], cls)
+        return cls.parse_obj(obj, **kwargs)
+
+
+def iter_entries(
+    source: typing.Union[str, Path, typing.IO],
+    *,
+    content_type: str = None,
+    validate: bool = True,
+) -> typing.Iterator[BundleEntry]:
+    """Yields ``BundleEntry`` one by one from Bundle (JSON or XML) file path
+    or stream, without loading whole document into memory.
+    Use ``fhir.resources.core.utils.bundlereader.BundleReader`` directly,
+    to access Bundle envelope (all elements except entries) as well."""
+    return iter_bundle_entries(
+        Bundle,
+        BundleEntry,
+        source,
+        content_type=content_type,
+        validate=validate,
+    )
@@ -1,17 +1,24 @@
 # -*- coding: utf-8 -*-
 from pathlib import Path
-from typing import Any, Dict, Union
+from typing import TYPE_CHECKING, Any, Dict, Union
 
 from fhir.resources.core.fhirabstractmodel import FHIRAbstractModel
+from fhir.resources.core.utils.preload import preload
 
 from .fhirtypesvalidators import get_fhir_model_class
 
+if TYPE_CHECKING:
+    from fhir.resources.core.utils.cache import ValidationCache
+
 __fhir_version__ = "4.0.1"
 __version__ = "6.4.0"
 
 
 def construct_fhir_element(
-    element_type: str, data: Union[Dict[str, Any], str, bytes, Path]
+    element_type: str,
+    data: Union[Dict[str, Any], str, bytes, Path],
+    validate: bool = True,
+    cache: "ValidationCache" = None,
 ) -> FHIRAbstractModel:
 
     try:
@@ -20,11 +27,19 @@ def construct_fhir_element(
         raise LookupError(
             f"'{element_type}' is not valid FHIRModel (element type) name!"
         )
+    if validate is False:
+        # trusted input, skip all validators.
+        if isinstance(data, (str, bytes)):
+            data = klass.__config__.json_loads(data)
+        elif isinstance(data, Path):
+            data = klass.__config__.json_loads(data.read_bytes())
+        return klass.construct_tree(data)
+
     if isinstance(data, (str, bytes)):
-        return klass.parse_raw(data, content_type="application/json")
+        return klass.parse_raw(data, content_type="application/json", cache=cache)
     elif isinstance(data, Path):
         return klass.parse_file(data)
-    return klass.parse_obj(data)
+    return klass.parse_obj(data, cache=cache)
 
 
-__all__ = ["get_fhir_model_class", "construct_fhir_element"]
+__all__ = ["get_fhir_model_class", "construct_fhir_element", "preload"]
@@ -13,11 +13,29 @@ from pydantic import BaseModel, Extra, Field
 from pydantic.class_validators import ROOT_VALIDATOR_CONFIG_KEY, root_validator
 from pydantic.error_wrappers import ErrorWrapper, ValidationError
 from pydantic.errors import ConfigError, PydanticValueError
-from pydantic.fields import ModelField
+from pydantic.fields import SHAPE_LIST, ModelField
 from pydantic.parse import Protocol
 from pydantic.utils import ROOT_KEY, sequence_like
 
-from .utils import is_primitive_type, load_file, load_str_bytes, xml_dumps, yaml_dumps
+from .utils import (
+    RawResource,
+    batch,
+    binary,
+    cache,
+    clone,
+    compact,
+    construct_tree,
+    dumps_key_bytes,
+    frozen,
+    get_field_properties,
+    json_dumps_model,
+    load_file,
+    load_str_bytes,
+    pickling,
+    raw_options,
+    xml_dumps,
+    yaml_dumps,
+)
 
 try:
     import orjson
@@ -46,10 +64,12 @@ except ImportError:
 
 
 if typing.TYPE_CHECKING:
-    from pydantic.typing import TupleGenerator
+    from pydantic.typing import ReprArgs, TupleGenerator
     from pydantic.types import StrBytes
     from pydantic.typing import AnyCallable
     from pydantic.main import Model
+    from .utils.cache import ValidationCache
+    from .utils.intern import InternPool
 
 __author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
 
@@ -62,9 +82,28 @@ class WrongResourceType(PydanticValueError):
     msg_template = "Wrong ResourceType: {error}"
 
 
+class ElementPlan(typing.NamedTuple):
+    """Compiled (per class) serialization information of an element,
+    see ``FHIRAbstractModel.get_serialization_plan``."""
+
+    alias: str
+    name: str
+    ext_name: typing.Optional[str]
+    ext_alias: typing.Optional[str]
+    is_primitive: bool
+    is_list: bool
+    field: ModelField
+    ext_field: typing.Optional[ModelField]
+
+
 class FHIRAbstractModel(BaseModel, abc.ABC):
     """Abstract base model class for all FHIR elements."""
 
+    # ``batch_update`` state and frozen flag, not model fields.
+    __slots__ = (batch.BATCH_STATE_ATTR, frozen.FROZEN_ATTR)
+    # see ``configure_compact_storage``
+    __compact_storage__: typing.ClassVar[bool] = False
+
     resource_type: str = ...  # type: ignore
 
     fhir_comments: typing.Union[str, typing.List[str]] = Field(
@@ -103,6 +142,150 @@ class FHIRAbstractModel(BaseModel, abc.ABC):
             raise ValidationError(errors, __pydantic_self__.__class__)
 
         BaseModel.__init__(__pydantic_self__, **data)
+        if __pydantic_self__.__compact_storage__:
+            compact.compact(__pydantic_self__)
+
+    def __setattr__(self, name, value):
+        """Assignments are deferred while ``batch_update`` is active."""
+        if frozen.is_frozen(self):
+            frozen.raise_frozen_error(self)
+        state = batch.get_batch_state(self)
+        if state is not None and batch.can_defer_assignment(self, name):
+            return batch.defer_assignment(self, state, name, value)
+        return BaseModel.__setattr__(self, name, value)
+
+    def __eq__(self, other: typing.Any) -> bool:
+        """ """
+        if isinstance(other, BaseModel) and (
+            frozen.is_frozen(self) or frozen.is_frozen(other)
+        ):
+            return frozen.frozen_equals(self, other)
+        return BaseModel.__eq__(self, other)
+
+    def __hash__(self) -> int:
+        """Only frozen models are hashable, ``hash()`` of mutable model raises
+        ``TypeError``. Note: ``isinstance(model, collections.abc.Hashable)`` is
+        True for every model (it is a class level check)."""
+        return frozen.get_hash(self)
+
+    def __reduce__(self):
+        """Sparse state (``None`` values are left out), restored without validation."""
+        return pickling.restore_model, pickling.get_state(self)
+
+    def __deepcopy__(self: "Model", memo: typing.Dict[int, typing.Any]) -> "Model":
+        """Structural (mutable) copy, same as ``clone()``."""
+        return clone.clone_model(self, deep=True, memo=memo)
+
+    def __iter__(self) -> "TupleGenerator":
+        """ """
+        if compact.is_compact(self):
+            yield from compact.iter_values(self)
+        else:
+            yield from self.__dict__.items()
+
+    def __repr_args__(self) -> "ReprArgs":
+        """ """
+        if compact.is_compact(self):
+            return BaseModel.__repr_args__(compact.full_copy(self))
+        return BaseModel.__repr_args__(self)
+
+    def _iter(self, *args, **kwargs) -> "TupleGenerator":
+        """``None`` values are only materialised, if those are not excluded."""
+        if kwargs.get("exclude_none", False) is False and compact.is_compact(self):
+            return BaseModel._iter(compact.full_copy(self), *args, **kwargs)
+        return BaseModel._iter(self, *args, **kwargs)
+
+    @classmethod
+    def parse_obj(
+        cls: typing.Type["Model"],
+        obj: typing.Any,
+        *,
+        intern: "InternPool" = None,
+        frozen: bool = False,
+        cache: "ValidationCache" = None,
+    ) -> "Model":
+        """``intern`` pool (``fhir.resources.core.utils.intern.InternPool``) replaces
+        structurally identical elements (``Coding``, ``Reference``...) with shared
+        instances of the pool. ``frozen`` model is returned as ``model.freeze()``.
+        Validated models are looked up from and kept in ``cache``
+        (``fhir.resources.core.utils.cache.ValidationCache``)."""
+        if cache is not None and isinstance(obj, dict):
+            return cache.get_or_parse(
+                cls,
+                dumps_key_bytes(obj),
+                lambda: cls.parse_obj(obj, intern=intern),
+                frozen=frozen,
+                options=("obj", intern),
+            )
+        model = super().parse_obj(obj)
+        if intern is not None:
+            model = intern.intern_tree(model)
+        if frozen:
+            model.freeze()
+        return model
+
+    def to_bytes(self) -> bytes:
+        """Compact binary (schema aware) representation, i.e. for caching.
+        Use ``Model.from_bytes()`` to load it back without validation."""
+        return binary.dumps(self)
+
+    @classmethod
+    def from_bytes(cls: typing.Type["Model"], data: bytes) -> "Model":
+        """Loads model from ``to_bytes()`` output (of the same fhir.resources
+        version), no validator is executed."""
+        return binary.loads(cls, data)
+
+    def clone(
+        self: "Model",
+        *,
+        deep: bool = True,
+        update: typing.Dict[str, typing.Any] = None,
+    ) -> "Model":
+        """Structural copy without running validators, immutable values are shared
+        (nested elements too, if not ``deep``). Only fields in ``update`` are
+        validated, keys could be dotted path of nested element. Shallow clone of
+        frozen model shares (still frozen) nested elements, except the updated path.
+
+        >>> reading = template.clone(
+        ...     update={"status": "final", "valueQuantity.value": 7.2}
+        ... )
+        """
+        return clone.clone(self, deep=deep, update=update)
+
+    def freeze(self: "Model") -> "Model":
+        """Makes whole tree immutable (in place), list values become tuples and
+        any assignment raises ``TypeError``. Frozen models are hashable and
+        serialized output (``json()``, ``xml()``...) is memoised, so they are safe
+        to share between threads and to cache. ``clone()`` gives mutable copy
+        (``copy()`` keeps tuples and frozen nested elements)."""
+        return frozen.freeze_tree(self)
+
+    @classmethod
+    def configure_compact_storage(cls, enabled: bool = True):
+        """Compact storage keeps only present values in instance ``__dict__``,
+        ``None`` fields (i.e. all empty ``__ext`` fields) are not stored, for the cost
+        of ``__getattr__`` fallback for empty fields. Applies to all subclasses
+        (if configured on base class) and instances those are created afterwards.
+        Disabling removes the ``__getattr__`` fallback again, compact instances
+        created meanwhile must not be used afterwards (empty fields are missing)."""
+        cls.__compact_storage__ = enabled
+        if enabled:
+            # installed on demand, so that full layout doesn't pay for
+            # ``__getattr__`` hook on every failed attribute lookup.
+            cls.__getattr__ = compact.get_missing_value  # type: ignore
+        elif cls.__dict__.get("__getattr__", None) is compact.get_missing_value:
+            del cls.__getattr__
+
+    def batch_update(self: "Model") -> typing.ContextManager["Model"]:
+        """Context manager, assignments inside it are validated once at exit
+        (instead of running all root validators for each assignment).
+        On any error, none of the assignments are applied.
+
+        >>> with observation.batch_update():
+        ...     observation.status = "final"
+        ...     observation.issued = "2022-05-11T10:00:00Z"
+        """
+        return batch.batch_update(self)
 
     @classmethod
     def add_root_validator(
@@ -170,6 +353,7 @@ class FHIRAbstractModel(BaseModel, abc.ABC):
         # inject to class
         setattr(validator, "__manually_injected__", True)  # noqa:B010
         setattr(cls, func_name, validator)
+        cache.invalidate_validation_caches()
 
     @classmethod
     def element_properties(
@@ -188,7 +372,7 @@ class FHIRAbstractModel(BaseModel, abc.ABC):
         return []
 
     @classmethod
-    @lru_cache(maxsize=1024, typed=True)
+    @lru_cache(maxsize=None, typed=True)
     def has_resource_base(cls: typing.Type["Model"]) -> bool:
         """ """
         # xxx: calculate metrics, other than cache it!
@@ -214,6 +398,45 @@ class FHIRAbstractModel(BaseModel, abc.ABC):
             f.alias: fname for fname, f in cls.__fields__.items() if f.alias in aliases
         }
 
+    @classmethod
+    def construct_tree(
+        cls: typing.Type["Model"], data: typing.Dict[str, typing.Any]
+    ) -> "Model":
+        """Trusted fast construction, builds whole tree (nested elements are
+        resolved through ``fhirtypes``) from ``data`` without running any validator.
+        Only use it for payloads, those are already validated once!"""
+        return typing.cast("Model", construct_tree(cls, data))
+
+    @classmethod
+    @lru_cache(maxsize=None, typed=True)
+    def get_serialization_plan(
+        cls: typing.Type["FHIRAbstractModel"],
+    ) -> typing.Tuple[ElementPlan, ...]:
+        """Immutable plan of all elements (according to ``elements_sequence``),
+        is built once on first use and walked by every serializer."""
+        alias_maps = cls.get_alias_mapping()
+        properties = get_field_properties(cls)
+        plan = list()
+        for alias in cls.elements_sequence():
+            field = cls.__fields__[alias_maps[alias]]
+            is_primitive = properties[field.name].is_primitive
+            ext_field = None
+            if is_primitive:
+                ext_field = cls.__fields__.get(f"{field.name}__ext", None)
+            plan.append(
+                ElementPlan(
+                    alias=field.alias,
+                    name=field.name,
+                    ext_name=ext_field and ext_field.name or None,
+                    ext_alias=ext_field and ext_field.alias or None,
+                    is_primitive=is_primitive,
+                    is_list=field.shape == SHAPE_LIST,
+                    field=field,
+                    ext_field=ext_field,
+                )
+            )
+        return tuple(plan)
+
     @classmethod
     def get_json_encoder(cls) -> typing.Callable[[typing.Any], typing.Any]:
         """ """
@@ -228,6 +451,8 @@ class FHIRAbstractModel(BaseModel, abc.ABC):
         encoding: str = "utf8",
         proto: Protocol = None,
         allow_pickle: bool = False,
+        intern: "InternPool" = None,
+        frozen: bool = False,
         **extra,
     ) -> "Model":
         extra.update({"cls": cls})
@@ -240,7 +465,14 @@ class FHIRAbstractModel(BaseModel, abc.ABC):
             json_loads=cls.__config__.json_loads,
             **extra,
         )
-        return cls.parse_obj(obj)
+        if obj.__class__ is cls:
+            # streamed xml Bundle (``xml_load_bundle``) is already validated
+            if intern is not None:
+                obj = intern.intern_tree(obj)
+            if frozen:
+                obj.freeze()
+            return obj
+        return cls.parse_obj(obj, intern=intern, frozen=frozen)
 
     @classmethod
     def parse_raw(
@@ -251,8 +483,27 @@ class FHIRAbstractModel(BaseModel, abc.ABC):
         encoding: str = "utf8",
         proto: Protocol = None,
         allow_pickle: bool = False,
+        intern: "InternPool" = None,
+        frozen: bool = False,
+        cache: "ValidationCache" = None,
         **extra,
     ) -> "Model":
+        if cache is not None:
+            return cache.get_or_parse(
+                cls,
+                b,
+                lambda: cls.parse_raw(
+                    b,
+                    content_type=content_type,
+                    encoding=encoding,
+                    proto=proto,
+                    allow_pickle=allow_pickle,
+                    intern=intern,
+                    **extra,
+                ),
+                frozen=frozen,
+                options=raw_options(content_type, intern, encoding),
+            )
         extra.update({"cls": cls})
         try:
             obj = load_str_bytes(
@@ -266,8 +517,16 @@ class FHIRAbstractModel(BaseModel, abc.ABC):
             )
         except (ValueError, TypeError, UnicodeDecodeError) as e:  # noqa: B014
             raise ValidationError([ErrorWrapper(e, loc=ROOT_KEY)], cls)
-        return cls.parse_obj(obj)
-
+        if obj.__class__ is cls:
+            # streamed xml Bundle (``xml_load_bundle``) is already validated
+            if intern is not None:
+                obj = intern.intern_tree(obj)
+            if frozen:
+                obj.freeze()
+            return obj
+        return cls.parse_obj(obj, intern=intern, frozen=frozen)
+
+    @frozen.memoized_output
     def yaml(  # type: ignore
         self,
         *,
@@ -300,6 +559,7 @@ class FHIRAbstractModel(BaseModel, abc.ABC):
         result = yaml_dumps(data, return_bytes=return_bytes, **dumps_kwargs)
         return result
 
+    @frozen.memoized_output
     def xml(  # type: ignore
         self,
         *,
@@ -323,6 +583,7 @@ class FHIRAbstractModel(BaseModel, abc.ABC):
 
         return xml_string
 
+    @frozen.memoized_output
     def json(  # type: ignore
         self,
         *,
@@ -370,6 +631,27 @@ class FHIRAbstractModel(BaseModel, abc.ABC):
 
             dumps_kwargs["return_bytes"] = return_bytes
 
+        encoder = typing.cast(
+            typing.Callable[[typing.Any], typing.Any], encoder or self.__json_encoder__
+        )
+
+        if (
+            "return_bytes" in dumps_kwargs
+            and "option" not in dumps_kwargs
+            and not self.__custom_root_type__
+        ):
+            # compact orjson output, single pass encoder is used.
+            result = json_dumps_model(
+                self,
+                default=encoder,
+                by_alias=by_alias,
+                exclude_none=exclude_none,
+                exclude_comments=exclude_comments,
+            )
+            if return_bytes is False:
+                return result.decode()
+            return result
+
         data = self.dict(
             by_alias=by_alias,
             exclude_none=exclude_none,
@@ -378,10 +660,6 @@ class FHIRAbstractModel(BaseModel, abc.ABC):
         if self.__custom_root_type__:
             data = data[ROOT_KEY]
 
-        encoder = typing.cast(
-            typing.Callable[[typing.Any], typing.Any], encoder or self.__json_encoder__
-        )
-
         if typing.TYPE_CHECKING:
             result: typing.Union[str, bytes]
 
@@ -396,6 +674,47 @@ class FHIRAbstractModel(BaseModel, abc.ABC):
 
         return result
 
+    def json_dump(
+        self,
+        fp: typing.BinaryIO,
+        *,
+        by_alias: bool = None,
+        exclude_none: bool = None,
+        exclude_comments: bool = False,
+        encoder: typing.Optional[typing.Callable[[typing.Any], typing.Any]] = None,
+    ) -> None:
+        """Writes (compact) json bytes into writable binary stream ``fp`` directly,
+        without building whole output in memory first."""
+        if by_alias is None:
+            by_alias = True
+
+        if exclude_none is None:
+            exclude_none = True
+
+        if (
+            getattr(self.__config__.json_dumps, "__qualname__", "")
+            != "orjson_json_dumps"
+        ):
+            fp.write(
+                self.json(
+                    by_alias=by_alias,
+                    exclude_none=exclude_none,
+                    exclude_comments=exclude_comments,
+                    encoder=encoder,
+                    return_bytes=True,
+                )
+            )
+            return
+
+        json_dumps_model(
+            self,
+            default=encoder or self.__json_encoder__,
+            by_alias=by_alias,
+            exclude_none=exclude_none,
+            exclude_comments=exclude_comments,
+            stream=fp,
+        )
+
     @typing.no_type_check
     def dict(
         self,
@@ -432,14 +751,9 @@ class FHIRAbstractModel(BaseModel, abc.ABC):
         if self.__class__.has_resource_base():
             yield "resourceType", self.resource_type
 
-        alias_maps = self.get_alias_mapping()
-        for prop_name in self.elements_sequence():
-            field_key = alias_maps[prop_name]
-
-            field = self.__fields__[field_key]
-            is_primitive = is_primitive_type(field)
-            v = self.__dict__.get(field_key, None)
-            dict_key = by_alias and field.alias or field_key
+        for element in self.get_serialization_plan():
+            v = self.__dict__.get(element.name, None)
+            dict_key = by_alias and element.alias or element.name
             if v is not None:
                 v = self._fhir_get_value(
                     v,
@@ -452,11 +766,10 @@ class FHIRAbstractModel(BaseModel, abc.ABC):
                 yield dict_key, v
 
             # looking for comments or primitive extension for primitive data type
-            if is_primitive:
-                ext_key = f"{field_key}__ext"
-                ext_val = self.__dict__.get(ext_key, None)
+            if element.ext_name is not None:
+                ext_val = self.__dict__.get(element.ext_name, None)
                 if ext_val is not None:
-                    dict_key_ = by_alias and self.__fields__[ext_key].alias or ext_key
+                    dict_key_ = by_alias and element.ext_alias or element.ext_name
                     ext_val = self._fhir_get_value(
                         ext_val,
                         by_alias=by_alias,
@@ -476,6 +789,13 @@ class FHIRAbstractModel(BaseModel, abc.ABC):
         cls, v: typing.Any, by_alias: bool, exclude_none: bool, exclude_comments: bool
     ) -> typing.Any:
 
+        if isinstance(v, RawResource):
+            if by_alias is False or exclude_comments is True:
+                v = v.resolve()
+            else:
+                # lazy element, decoded json (fresh copy) is used as is.
+                return v.get_data()
+
         if isinstance(v, (FHIRAbstractModel, BaseModel)):
             v_dict = v.dict(
                 by_alias=by_alias,
@@ -497,7 +817,8 @@ class FHIRAbstractModel(BaseModel, abc.ABC):
                 for k_, v_ in v.items()
             }
         elif sequence_like(v):
-            value = v.__class__(
+            # tuples are from frozen models, represented as list.
+            value = (list if v.__class__ is tuple else v.__class__)(
                 cls._fhir_get_value(
                     v_,
                     by_alias=by_alias,
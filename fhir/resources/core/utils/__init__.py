@@ -8,7 +8,16 @@ from pydantic.parse import load_file as default_load_file
 from pydantic.parse import load_str_bytes as default_load_str_bytes
 from pydantic.types import StrBytes
 
-from .common import is_primitive_type  # noqa: F401
+from . import batch, binary, cache, clone, compact, frozen, pickling  # noqa: F401
+from .cache import dumps_key_bytes, raw_options  # noqa: F401
+from .common import (  # noqa: F401
+    get_cache_info,
+    get_field_properties,
+    is_primitive_type,
+)
+from .construct import construct_tree  # noqa: F401
+from .jsonwriter import json_dumps_model  # noqa: F401
+from .lazy import RawResource  # noqa: F401
 
 try:
     from .yaml import yaml_dumps, yaml_loads
@@ -39,7 +48,7 @@ except ImportError:
 
 
 try:
-    from .xml import xml_dumps, xml_loads
+    from .xml import xml_dumps, xml_loads, xml_loads_data
 except ImportError:
 
     def raise_lxml_import_error():
@@ -61,7 +70,13 @@ except ImportError:
         raise_lxml_import_error()
 
     @no_type_check
-    def xml_loads(cls, b, xmlparser=None):
+    def xml_loads(cls, b, xmlparser=None, validate_schema=False, validate=True):
+        raise_lxml_import_error()
+
+    @no_type_check
+    def xml_loads_data(
+        cls, b, xmlparser=None, validate_schema=False, stream_bundle=True
+    ):
         raise_lxml_import_error()
 
 
@@ -91,9 +106,13 @@ def load_str_bytes(
             params = {}
             if "xmlparser" in extra:
                 params["xmlparser"] = extra["xmlparser"]
+            if "validate_schema" in extra:
+                params["validate_schema"] = extra["validate_schema"]
+            if "stream_bundle" in extra:
+                params["stream_bundle"] = extra["stream_bundle"]
             if TYPE_CHECKING:
                 b = cast(bytes, b)
-            obj = xml_loads(extra["cls"], b, **params)
+            obj = xml_loads_data(extra["cls"], b, **params)
             return obj
     obj = default_load_str_bytes(
         b,
@@ -134,7 +153,11 @@ def load_file(
         params = {}
         if "xmlparser" in extra:
             params["xmlparser"] = extra["xmlparser"]
-        obj = xml_loads(extra["cls"], path.read_bytes(), **params)
+        if "validate_schema" in extra:
+            params["validate_schema"] = extra["validate_schema"]
+        if "stream_bundle" in extra:
+            params["stream_bundle"] = extra["stream_bundle"]
+        obj = xml_loads_data(extra["cls"], path.read_bytes(), **params)
     else:
         obj = default_load_file(
             path,
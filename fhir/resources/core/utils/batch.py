@@ -0,0 +1,120 @@
+# _*_ coding: utf-8 _*_
+"""Deferred validation of bulk assignments for ``validate_assignment`` models.
+Inside ``model.batch_update()`` assigned values are stored as is and whole
+batch is validated once at exit, same way as pydantic validates a single
+assignment (pre root validators, field validators, post root validators)."""
+
+import typing
+from contextlib import contextmanager
+
+from pydantic import BaseModel
+from pydantic.error_wrappers import ErrorWrapper, ValidationError
+from pydantic.utils import ROOT_KEY
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+BATCH_STATE_ATTR = "_batch_state"
+
+
+class BatchState(typing.NamedTuple):
+    """ """
+
+    values: typing.Dict[str, typing.Any]
+    fields_set: typing.Set[str]
+    # ordered set of assigned field names
+    names: typing.Dict[str, None]
+
+
+def get_batch_state(model: BaseModel) -> typing.Optional[BatchState]:
+    """ """
+    return getattr(model, BATCH_STATE_ATTR, None)
+
+
+def can_defer_assignment(model: BaseModel, name: str) -> bool:
+    """Anything but plain assignment of known mutable field goes to
+    ``BaseModel.__setattr__`` (i.e. to raise the usual errors immediately)."""
+    config = model.__config__
+    field = model.__fields__.get(name, None)
+    return (
+        field is not None
+        and config.validate_assignment
+        and config.allow_mutation
+        and not config.frozen
+        and field.field_info.allow_mutation
+    )
+
+
+def defer_assignment(model: BaseModel, state: BatchState, name: str, value: typing.Any):
+    """ """
+    model.__dict__[name] = value
+    state.names[name] = None
+
+
+def validate_batch(model: BaseModel, state: BatchState):
+    """Validate all deferred assignments at once, errors of all assigned fields
+    are collected (``loc`` is field name, same as normal assignment)."""
+    if not state.names:
+        return
+    klass = model.__class__
+    new_values = model.__dict__.copy()
+    for validator in klass.__pre_root_validators__:
+        try:
+            new_values = validator(klass, new_values)
+        except (ValueError, TypeError, AssertionError) as exc:
+            raise ValidationError([ErrorWrapper(exc, loc=ROOT_KEY)], klass)
+
+    errors: typing.List[typing.Any] = list()
+    for name in state.names:
+        # field validator gets ``values`` without own value, as normal assignment.
+        current = new_values.pop(name, None)
+        value, error = klass.__fields__[name].validate(
+            model.__dict__[name], new_values, loc=name, cls=klass
+        )
+        if error:
+            errors.append(error)
+            value = current
+        new_values[name] = value
+    if errors:
+        raise ValidationError(errors, klass)
+    # keep the fields order
+    ordered = {k: new_values[k] for k in model.__dict__ if k in new_values}
+    ordered.update(new_values)
+    new_values = ordered
+
+    for skip_on_failure, validator in klass.__post_root_validators__:
+        if skip_on_failure and errors:
+            continue
+        try:
+            new_values = validator(klass, new_values)
+        except (ValueError, TypeError, AssertionError) as exc:
+            errors.append(ErrorWrapper(exc, loc=ROOT_KEY))
+    if errors:
+        raise ValidationError(errors, klass)
+
+    object.__setattr__(model, "__dict__", new_values)
+    model.__fields_set__.update(state.names)
+
+
+@contextmanager
+def batch_update(model: BaseModel) -> typing.Iterator[BaseModel]:
+    """ """
+    if get_batch_state(model) is not None:
+        # nested batch, the outermost one validates.
+        yield model
+        return
+
+    state = BatchState(model.__dict__.copy(), set(model.__fields_set__), dict())
+    object.__setattr__(model, BATCH_STATE_ATTR, state)
+    try:
+        yield model
+        object.__setattr__(model, BATCH_STATE_ATTR, None)
+        validate_batch(model, state)
+    except BaseException:
+        # roll back, nothing from this batch is applied.
+        object.__setattr__(model, BATCH_STATE_ATTR, None)
+        object.__setattr__(model, "__dict__", state.values)
+        object.__setattr__(model, "__fields_set__", state.fields_set)
+        raise
+
+
+__all__ = ["batch_update"]
@@ -0,0 +1,268 @@
+# _*_ coding: utf-8 _*_
+"""Compact binary format of (already validated) models, i.e. for caching parsed
+resources. Elements are encoded as flat tuples of ``(field index, value, ...)``,
+field index is the position in ``elements_sequence()`` (followed by ``__ext``
+fields and ``fhir_comments``), so no key string is stored. Nested element class
+is known from the field, only polymorphic values (``Bundle.entry.resource``,
+``contained``) carry their resource type. The tree is serialized by ``marshal``.
+
+Decoding doesn't run any validator (same as trusted construction), bytes are
+only accepted from the same ``fhir.resources`` version and Python ``marshal``
+format, those are stored in the header."""
+
+import datetime
+import decimal
+import importlib
+import marshal
+import typing
+from functools import lru_cache
+
+from pydantic import BaseModel
+
+from .common import get_fhir_release
+from .compact import compact_values
+from .construct import (
+    KIND_MODEL,
+    KIND_POLYMORPHIC,
+    KIND_VALUE,
+    TrustedField,
+    get_default_values,
+    get_model_class,
+    get_trusted_fields,
+)
+from .lazy import RawResource
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+MAGIC = b"FHIRB\x01"
+
+# leaf value tags (anything but str, int, float, bool and bytes)
+TAG_DECIMAL = 1
+TAG_DATE = 2
+TAG_DATETIME = 3
+TAG_TIME = 4
+
+# fixed offset timezones are reused
+TIMEZONES: typing.Dict[int, datetime.timezone] = dict()
+
+
+@lru_cache(maxsize=None)
+def get_header() -> bytes:
+    """ """
+    version = importlib.import_module("fhir.resources").__version__
+    return MAGIC + marshal.dumps((version, marshal.version))
+
+
+@lru_cache(maxsize=None, typed=True)
+def get_binary_fields(klass: typing.Type[BaseModel]) -> typing.Tuple[TrustedField, ...]:
+    """Fields in index order, ``elements_sequence()`` first."""
+    trusted_fields = get_trusted_fields(klass)
+    elements_sequence = getattr(klass, "elements_sequence", None)
+    names: typing.Dict[str, None] = dict()
+    if elements_sequence is not None:
+        for alias in elements_sequence():
+            names[trusted_fields[alias].name] = None
+    for name in klass.__fields__:
+        if name != "resource_type":
+            names[name] = None
+    return tuple(trusted_fields[name] for name in names)
+
+
+@lru_cache(maxsize=None, typed=True)
+def get_binary_index(
+    klass: typing.Type[BaseModel],
+) -> typing.Dict[str, typing.Tuple[int, TrustedField]]:
+    """ """
+    return {
+        trusted_field.name: (index, trusted_field)
+        for index, trusted_field in enumerate(get_binary_fields(klass))
+    }
+
+
+def get_field_model_class(trusted_field: TrustedField) -> typing.Type[BaseModel]:
+    """ """
+    type_ = trusted_field.type_
+    return get_model_class(type_.__fhir_release__, type_.__resource_type__)
+
+
+def encode_leaf(value: typing.Any) -> typing.Any:
+    """ """
+    if value.__class__ in (str, int, float, bool, bytes):
+        return value
+    if isinstance(value, decimal.Decimal):
+        return TAG_DECIMAL, str(value)
+    if isinstance(value, datetime.datetime):
+        offset = value.utcoffset()
+        return (
+            TAG_DATETIME,
+            value.year,
+            value.month,
+            value.day,
+            value.hour,
+            value.minute,
+            value.second,
+            value.microsecond,
+            None if offset is None else int(offset.total_seconds()),
+        )
+    if isinstance(value, datetime.date):
+        return TAG_DATE, value.year, value.month, value.day
+    if isinstance(value, datetime.time):
+        offset = value.utcoffset()
+        return (
+            TAG_TIME,
+            value.hour,
+            value.minute,
+            value.second,
+            value.microsecond,
+            None if offset is None else int(offset.total_seconds()),
+        )
+    if isinstance(value, str):
+        return str(value)
+    raise TypeError(f"{value.__class__} value is not supported by binary format.")
+
+
+def get_timezone(offset: typing.Optional[int]) -> typing.Optional[datetime.timezone]:
+    """ """
+    if offset is None:
+        return None
+    try:
+        return TIMEZONES[offset]
+    except KeyError:
+        if offset == 0:
+            tz = datetime.timezone.utc
+        else:
+            tz = datetime.timezone(datetime.timedelta(seconds=offset))
+        return TIMEZONES.setdefault(offset, tz)
+
+
+def decode_leaf(value: typing.Tuple[typing.Any, ...]) -> typing.Any:
+    """ """
+    tag = value[0]
+    if tag == TAG_DECIMAL:
+        return decimal.Decimal(value[1])
+    if tag == TAG_DATE:
+        return datetime.date(value[1], value[2], value[3])
+    if tag == TAG_DATETIME:
+        return datetime.datetime(*value[1:8], tzinfo=get_timezone(value[8]))
+    if tag == TAG_TIME:
+        return datetime.time(*value[1:5], tzinfo=get_timezone(value[5]))
+    raise ValueError(f"Unknown binary value tag '{tag}'.")
+
+
+def encode_item(trusted_field: TrustedField, value: typing.Any) -> typing.Any:
+    """ """
+    if value is None:
+        return None
+    if trusted_field.kind == KIND_VALUE:
+        return encode_leaf(value)
+    if isinstance(value, RawResource):
+        value = value.resolve()
+    if trusted_field.kind == KIND_MODEL:
+        return encode_model(value, get_field_model_class(trusted_field))
+    return encode_model(value)
+
+
+def encode_model(
+    model: BaseModel, expected: typing.Type[BaseModel] = None
+) -> typing.Tuple[typing.Any, ...]:
+    """Resource type is only written if class is not the ``expected`` one."""
+    klass = model.__class__
+    index = get_binary_index(klass)
+    items: typing.List[typing.Any] = list()
+    if klass is not expected:
+        items.append(model.resource_type)
+    for name, value in model.__dict__.items():
+        if value is None or name == "resource_type":
+            continue
+        position, trusted_field = index[name]
+        items.append(position)
+        if isinstance(value, (list, tuple)):
+            items.append([encode_item(trusted_field, item) for item in value])
+        else:
+            items.append(encode_item(trusted_field, value))
+    return tuple(items)
+
+
+def decode_item(trusted_field: TrustedField, value: typing.Any) -> typing.Any:
+    """ """
+    if value is None:
+        return None
+    if trusted_field.kind == KIND_VALUE:
+        if value.__class__ is tuple:
+            return decode_leaf(value)
+        return value
+    if trusted_field.kind == KIND_POLYMORPHIC:
+        return decode_model(trusted_field.type_.__fhir_release__, None, value)
+    return decode_model(
+        trusted_field.type_.__fhir_release__,
+        get_field_model_class(trusted_field),
+        value,
+    )
+
+
+def decode_model(
+    fhir_release: str,
+    klass: typing.Optional[typing.Type[BaseModel]],
+    items: typing.Tuple[typing.Any, ...],
+) -> BaseModel:
+    """ """
+    start = 0
+    if items and items[0].__class__ is str:
+        if klass is None or klass.get_resource_type() != items[0]:
+            klass = get_model_class(fhir_release, items[0])
+        start = 1
+    if klass is None:
+        raise ValueError("Resource type of polymorphic element is missing.")
+    fields = get_binary_fields(klass)
+    values: typing.Dict[str, typing.Any] = dict()
+    for position in range(start, len(items), 2):
+        trusted_field = fields[items[position]]
+        value = items[position + 1]
+        if value.__class__ is list:
+            value = [decode_item(trusted_field, item) for item in value]
+        else:
+            value = decode_item(trusted_field, value)
+        values[trusted_field.name] = value
+
+    # same as ``construct_tree``
+    model = klass.__new__(klass)
+    fields_set = set(values)
+    fields_values = get_default_values(klass).copy()
+    fields_values.update(values)
+    if getattr(klass, "__compact_storage__", False):
+        fields_values = compact_values(klass, fields_values)
+    object.__setattr__(model, "__dict__", fields_values)
+    object.__setattr__(model, "__fields_set__", fields_set)
+    return model
+
+
+def dumps(model: BaseModel) -> bytes:
+    """ """
+    return get_header() + marshal.dumps(encode_model(model))
+
+
+def loads(klass: typing.Type[BaseModel], data: bytes) -> BaseModel:
+    """``data`` must be produced by ``dumps`` (from validated model)."""
+    header = get_header()
+    if (
+        not isinstance(data, (bytes, bytearray, memoryview))
+        or bytes(data[: len(header)]) != header
+    ):
+        raise ValueError(
+            "Invalid binary data, it is not produced by ``to_bytes()`` of the "
+            "current fhir.resources version."
+        )
+    try:
+        items = marshal.loads(data[len(header) :])
+    except (EOFError, TypeError) as exc:
+        raise ValueError(f"Invalid binary data, {exc}")
+    model = decode_model(get_fhir_release(klass), klass, items)
+    if not isinstance(model, klass):
+        raise ValueError(
+            f"Binary data of '{model.resource_type}' is not expected "
+            f"for class '{klass.__name__}'."
+        )
+    return model
+
+
+__all__ = ["dumps", "loads"]
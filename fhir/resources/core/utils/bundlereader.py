@@ -0,0 +1,333 @@
+# _*_ coding: utf-8 _*_
+"""Incremental (streaming) Bundle reader, entries are yielded one at a time
+while the document is read in chunks, so memory usage is bounded by the size
+of largest single entry, not by the whole Bundle."""
+
+import pathlib
+import re
+import typing
+
+if typing.TYPE_CHECKING:
+    from fhir.resources.core.fhirabstractmodel import FHIRAbstractModel
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+WHITESPACES = b" \t\r\n"
+STRUCTURAL_CHARS = re.compile(rb'["\[\]{}]')
+# from just after opening quote to the closing quote (including)
+STRING_REMAINING = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+STRING_SPECIAL = re.compile(rb'["\\]')
+SCALAR_VALUE = re.compile(rb"[^,}\]\s]*")
+
+SourceType = typing.Union[str, pathlib.Path, typing.IO]
+
+
+class JSONChunkScanner:
+    """Tiny pull scanner over chunked JSON bytes, it doesn't decode anything
+    rather finds boundaries of JSON values, decoding is left to ``json_loads``.
+    Chunks are appended to ``bytearray`` buffer and scan state (depth, inside
+    string, cursor) is kept across reads, so a large value is scanned once.
+    """
+
+    __slots__ = ("stream", "chunk_size", "buffer", "pos", "eof")
+
+    def __init__(self, stream: typing.IO, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """ """
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.buffer = bytearray()
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Read next chunk, consumed bytes (before ``pos``) are dropped from
+        buffer. While a value is read, ``pos`` stays at its start, so bytes
+        are only dropped on the first read of that value."""
+        if self.eof:
+            return False
+        chunk = self.stream.read(self.chunk_size)
+        if isinstance(chunk, str):
+            chunk = chunk.encode("utf-8")
+        if not chunk:
+            self.eof = True
+            return False
+        if self.pos > 0:
+            del self.buffer[: self.pos]
+            self.pos = 0
+        self.buffer += chunk
+        return True
+
+    def peek(self) -> bytes:
+        """Next non whitespace byte (not consumed)."""
+        while True:
+            buffer, pos = self.buffer, self.pos
+            while pos < len(buffer) and buffer[pos] in WHITESPACES:
+                pos += 1
+            self.pos = pos
+            if pos < len(buffer):
+                return bytes(buffer[pos : pos + 1])
+            if not self.fill():
+                raise ValueError("Unexpected end of JSON document.")
+
+    def expect(self, char: bytes):
+        """ """
+        found = self.peek()
+        if found != char:
+            raise ValueError(
+                f"Invalid JSON document, expected {char!r} but found {found!r} "
+                "while reading Bundle."
+            )
+        self.pos += 1
+
+    def skip_optional(self, char: bytes) -> bool:
+        """ """
+        if self.peek() == char:
+            self.pos += 1
+            return True
+        return False
+
+    def iter_object_keys(
+        self, json_loads: typing.Callable[[bytes], typing.Any]
+    ) -> typing.Iterator[str]:
+        """Yields each key of next JSON object, caller must consume the value
+        (i.e. ``read_value``) before asking the next key."""
+        self.expect(b"{")
+        if self.skip_optional(b"}"):
+            return
+        while True:
+            key = json_loads(self.read_value())
+            self.expect(b":")
+            yield key
+            if self.skip_optional(b"}"):
+                break
+            self.expect(b",")
+
+    def iter_array(self) -> typing.Iterator[None]:
+        """Yields once per item of next JSON array, caller must consume the item."""
+        self.expect(b"[")
+        if self.skip_optional(b"]"):
+            return
+        while True:
+            yield None
+            if self.skip_optional(b"]"):
+                break
+            self.expect(b",")
+
+    def take(self, end: int) -> bytes:
+        """Consumes buffer up to ``end``."""
+        value = bytes(self.buffer[self.pos : end])
+        self.pos = end
+        return value
+
+    def read_value(self) -> bytes:
+        """Raw bytes of next complete JSON value."""
+        first = self.peek()
+        if first not in (b'"', b"{", b"["):
+            cursor = self.pos
+            while True:
+                match = SCALAR_VALUE.match(self.buffer, cursor)
+                if match.end() < len(self.buffer) or self.eof:
+                    return self.take(match.end())
+                offset = match.end() - self.pos
+                self.fill()
+                cursor = self.pos + offset
+
+        # string, object or array; ``pos`` stays at the value start, ``cursor``
+        # is where the scan is resumed after more data is read.
+        depth = 0
+        in_string = False
+        cursor = self.pos
+        while True:
+            buffer = self.buffer
+            if in_string:
+                match = STRING_SPECIAL.search(buffer, cursor)
+                if match is None:
+                    cursor = len(buffer)
+                elif match.group() == b"\\":
+                    if match.end() < len(buffer):
+                        # skip escaped char
+                        cursor = match.end() + 1
+                        continue
+                    cursor = match.start()
+                else:
+                    cursor = match.end()
+                    in_string = False
+                    if depth == 0:
+                        return self.take(cursor)
+                    continue
+            else:
+                match = STRUCTURAL_CHARS.search(buffer, cursor)
+                if match is None:
+                    cursor = len(buffer)
+                else:
+                    cursor = match.end()
+                    char = match.group()
+                    if char == b'"':
+                        # fast path, whole string is already in buffer
+                        string_match = STRING_REMAINING.match(buffer, cursor)
+                        if string_match is None:
+                            in_string = True
+                            continue
+                        cursor = string_match.end()
+                        if depth == 0:
+                            return self.take(cursor)
+                    elif char in (b"{", b"["):
+                        depth += 1
+                    else:
+                        depth -= 1
+                        if depth == 0:
+                            return self.take(cursor)
+                    continue
+            offset = cursor - self.pos
+            if not self.fill():
+                raise ValueError("Unexpected end of JSON document.")
+            cursor = self.pos + offset
+
+
+class BundleReader:
+    """Reads Bundle (JSON or XML) from file path or (binary) stream and yields
+    ``BundleEntry`` models one by one. After iteration is completed, ``envelope``
+    contains all other (non entry) elements of Bundle and ``bundle`` is
+    the (validated) Bundle model of envelope, without entries.
+    """
+
+    def __init__(
+        self,
+        bundle_class: typing.Type["FHIRAbstractModel"],
+        entry_class: typing.Type["FHIRAbstractModel"],
+        source: SourceType,
+        *,
+        content_type: str = None,
+        validate: bool = True,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        """``source`` is file path (``str`` or ``Path``) or binary stream
+        (text stream is accepted for JSON). ``content_type`` (i.e.
+        ``application/fhir+xml``) decides the format, otherwise see ``is_xml``.
+        Entries are made as ``entry_class`` and envelope as ``bundle_class``,
+        validated (``parse_obj``) or, if not ``validate``, constructed from
+        trusted data (``construct_tree``). ``chunk_size`` is number of bytes
+        read at a time from JSON stream."""
+        self.bundle_class = bundle_class
+        self.entry_class = entry_class
+        self.source = source
+        self.content_type = content_type
+        self.validate = validate
+        self.chunk_size = chunk_size
+        self.envelope: typing.Dict[str, typing.Any] = dict()
+        self._bundle: typing.Optional["FHIRAbstractModel"] = None
+
+    @property
+    def bundle(self) -> "FHIRAbstractModel":
+        """Bundle model (without entries) of envelope."""
+        if self._bundle is None:
+            self._bundle = self.make_model(self.bundle_class, self.envelope)
+        return self._bundle
+
+    def make_model(
+        self, klass: typing.Type["FHIRAbstractModel"], data: typing.Dict
+    ) -> "FHIRAbstractModel":
+        """``klass`` model of decoded ``data``, validated if ``validate``."""
+        if self.validate:
+            return klass.parse_obj(data)
+        return klass.construct_tree(data)
+
+    def is_xml(self, stream: typing.IO) -> bool:
+        """XML if ``content_type`` ends with ``xml`` (any other content type is
+        JSON). Without ``content_type``, file path is XML if its suffix is
+        ``.xml``, and a stream is XML if its first non whitespace byte is ``<``
+        (looked ahead by ``peek`` or ``seek``, non seekable streams without
+        ``peek`` are read as JSON)."""
+        if self.content_type:
+            return self.content_type.endswith("xml")
+        if isinstance(self.source, (str, pathlib.Path)):
+            return pathlib.Path(self.source).suffix.lower() == ".xml"
+        peek = getattr(stream, "peek", None)
+        if peek is not None:
+            head = peek(64)
+        elif stream.seekable():
+            position = stream.tell()
+            head = stream.read(64)
+            stream.seek(position)
+        else:
+            return False
+        if isinstance(head, str):
+            head = head.encode("utf-8")
+        return head.lstrip()[:1] == b"<"
+
+    def __iter__(self) -> typing.Iterator["FHIRAbstractModel"]:
+        """Same as ``iter_entries``."""
+        return self.iter_entries()
+
+    def iter_entries(self) -> typing.Iterator["FHIRAbstractModel"]:
+        """Yields entries in document order, file path is opened (and closed)
+        here, given stream is not closed. ``envelope`` and ``bundle`` are
+        complete after iteration is exhausted."""
+        if isinstance(self.source, (str, pathlib.Path)):
+            with open(str(self.source), "rb") as stream:
+                yield from self._iter_stream(stream)
+        else:
+            yield from self._iter_stream(self.source)
+
+    def _iter_stream(self, stream: typing.IO) -> typing.Iterator["FHIRAbstractModel"]:
+        """Dispatches to XML or JSON reader, see ``is_xml``."""
+        if self.is_xml(stream):
+            yield from self._iter_xml(stream)
+        else:
+            yield from self._iter_json(stream)
+
+    def _iter_json(self, stream: typing.IO) -> typing.Iterator["FHIRAbstractModel"]:
+        """Top level keys are scanned by ``JSONChunkScanner``, each item of
+        ``entry`` is decoded and yielded, other values are kept in ``envelope``.
+        ``ValueError`` for malformed document or other resource type."""
+        json_loads = self.bundle_class.__config__.json_loads
+        scanner = JSONChunkScanner(stream, self.chunk_size)
+        resource_type = self.bundle_class.get_resource_type()
+        for key in scanner.iter_object_keys(json_loads):
+            if key == "entry":
+                for _ in scanner.iter_array():
+                    yield self.make_model(
+                        self.entry_class, json_loads(scanner.read_value())
+                    )
+                continue
+
+            value = json_loads(scanner.read_value())
+            if key == "resourceType" and value != resource_type:
+                raise ValueError(
+                    f"Expected resourceType is '{resource_type}', "
+                    f"but document has resourceType '{value}'"
+                )
+            self.envelope[key] = value
+
+    def _iter_xml(self, stream: typing.IO) -> typing.Iterator["FHIRAbstractModel"]:
+        """Entries are decoded by ``xml_element_to_dict``, then validated or
+        constructed (``validate=False``) same as json entries."""
+        from .xml import xml_iter_bundle_entries
+
+        self._bundle = yield from xml_iter_bundle_entries(
+            self.bundle_class, self.entry_class, stream, make_model=self.make_model
+        )
+        self.envelope = self._bundle.dict(by_alias=True)
+
+
+def iter_bundle_entries(
+    bundle_class: typing.Type["FHIRAbstractModel"],
+    entry_class: typing.Type["FHIRAbstractModel"],
+    source: SourceType,
+    *,
+    content_type: str = None,
+    validate: bool = True,
+) -> typing.Iterator["FHIRAbstractModel"]:
+    """Entries of Bundle ``source`` (file path or stream) one by one, see
+    ``BundleReader`` for parameters and how the format is detected."""
+    return BundleReader(
+        bundle_class,
+        entry_class,
+        source,
+        content_type=content_type,
+        validate=validate,
+    ).iter_entries()
+
+
+__all__ = ["BundleReader", "iter_bundle_entries"]
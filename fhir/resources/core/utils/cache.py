@@ -0,0 +1,210 @@
+# _*_ coding: utf-8 _*_
+"""Validation result cache, i.e. for endpoints those are receiving the same
+payloads over and over (retries, polling clients, reference data).
+Models are cached by (model class, parse options, hash of raw payload) in a
+bounded LRU (number of entries and payload bytes). Cached models are frozen,
+a hit returns the shared model if caller asks ``frozen=True``, otherwise a
+mutable ``clone()`` of it (same as a cache miss gives a mutable model).
+
+Validation semantics could be changed at runtime (``Id.configure_constraints``,
+``String.configure_empty_str``, ``add_root_validator``), those are clearing all
+caches through ``invalidate_validation_caches()``."""
+
+import hashlib
+import threading
+import typing
+import weakref
+from collections import OrderedDict
+
+from pydantic import BaseModel
+
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+    import json
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+# all live caches, see ``invalidate_validation_caches``
+CACHES: "weakref.WeakSet[ValidationCache]" = weakref.WeakSet()
+CACHES_LOCK = threading.Lock()
+
+
+class CacheStats(typing.NamedTuple):
+    """ """
+
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    entries: int
+    # sum of cached payload sizes
+    bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        """ """
+        total = self.hits + self.misses
+        if total == 0:
+            return 0.0
+        return self.hits / total
+
+    def __str__(self):
+        """ """
+        return (
+            f"{self.entries} entries ({self.bytes / 1024:.1f} KiB), "
+            f"hit rate {self.hit_rate:.1%} ({self.hits}/{self.hits + self.misses}), "
+            f"{self.evictions} evictions, {self.invalidations} invalidations"
+        )
+
+
+def dumps_key_bytes(obj: typing.Any) -> bytes:
+    """Bytes of a json object (``parse_obj`` input) for hashing."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str)
+    return json.dumps(obj, default=str, separators=(",", ":")).encode()
+
+
+def raw_options(
+    content_type: typing.Optional[str], intern: typing.Any, encoding: str = "utf8"
+) -> typing.Tuple[typing.Any, ...]:
+    """Key options of ``parse_raw`` payload, content types those are read the
+    same (``None`` and ``*json``) are one option."""
+    if content_type is None or content_type.endswith("json"):
+        content_type = "json"
+    return "raw", content_type, encoding, intern
+
+
+class ValidationCache:
+    """Thread safe LRU of validated models, limited by ``maxsize`` entries and
+    ``max_bytes`` (size of raw payloads, not the size of models in memory)."""
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+    ):
+        """ """
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        # key -> (model, size)
+        self.entries: typing.MutableMapping[
+            typing.Any, typing.Tuple[BaseModel, int]
+        ] = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.lock = threading.Lock()
+        with CACHES_LOCK:
+            CACHES.add(self)
+
+    def __len__(self):
+        """ """
+        return len(self.entries)
+
+    @staticmethod
+    def make_key(
+        klass: typing.Type[BaseModel],
+        raw: typing.Union[str, bytes],
+        options: typing.Tuple[typing.Any, ...] = (),
+    ) -> typing.Tuple[typing.Type[BaseModel], typing.Tuple[typing.Any, ...], bytes]:
+        """Model class itself (not resource type, so i.e. ``Bundle`` and
+        ``LazyBundle`` or user subclasses are cached apart), parse ``options``
+        those could change the result (content type, intern pool...) and
+        digest of ``raw`` payload."""
+        if isinstance(raw, str):
+            raw = raw.encode()
+        digest = hashlib.blake2b(raw, digest_size=16).digest()
+        return klass, options, digest
+
+    def get(self, key: typing.Any) -> typing.Optional[BaseModel]:
+        """ """
+        with self.lock:
+            try:
+                model, _ = self.entries[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+        return model
+
+    def put(self, key: typing.Any, model: BaseModel, size: int):
+        """``model`` must be frozen already."""
+        if size > self.max_bytes:
+            return
+        with self.lock:
+            previous = self.entries.pop(key, None)
+            if previous is not None:
+                self.bytes -= previous[1]
+            self.entries[key] = (model, size)
+            self.bytes += size
+            while len(self.entries) > self.maxsize or self.bytes > self.max_bytes:
+                _, (_, evicted_size) = self.entries.popitem(last=False)
+                self.bytes -= evicted_size
+                self.evictions += 1
+
+    def get_or_parse(
+        self,
+        klass: typing.Type[BaseModel],
+        raw: typing.Union[str, bytes],
+        parse: typing.Callable[[], BaseModel],
+        *,
+        frozen: bool = False,
+        options: typing.Tuple[typing.Any, ...] = (),
+    ) -> BaseModel:
+        """Cached model of ``raw`` payload, ``parse`` (returns mutable model) is
+        called on miss (validation errors are not cached). ``frozen`` returns the
+        shared frozen model, otherwise a mutable model (``clone()`` on hit)."""
+        key = self.make_key(klass, raw, options)
+        model = self.get(key)
+        if model is not None:
+            return model if frozen else model.clone()
+        model = parse()
+        if frozen:
+            cached = model.freeze()
+        else:
+            # caller gets the validated model as usual.
+            cached = model.clone().freeze()
+        self.put(key, cached, len(raw))
+        return model
+
+    def clear(self):
+        """ """
+        with self.lock:
+            self.entries.clear()
+            self.bytes = 0
+
+    def invalidate(self):
+        """Drops all entries, because validation semantics are changed."""
+        with self.lock:
+            self.invalidations += 1
+            self.entries.clear()
+            self.bytes = 0
+
+    def stats(self) -> CacheStats:
+        """ """
+        with self.lock:
+            return CacheStats(
+                self.hits,
+                self.misses,
+                self.evictions,
+                self.invalidations,
+                len(self.entries),
+                self.bytes,
+            )
+
+
+def invalidate_validation_caches():
+    """Invalidation hook, must be called after any change of validation rules."""
+    with CACHES_LOCK:
+        caches = list(CACHES)
+    for cache in caches:
+        cache.invalidate()
+
+
+__all__ = ["CacheStats", "ValidationCache", "invalidate_validation_caches"]
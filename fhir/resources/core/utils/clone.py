@@ -0,0 +1,155 @@
+# _*_ coding: utf-8 _*_
+"""Structural clone of model trees. Values are already validated, so nested
+elements are copied without running validators and immutable leaves (str,
+Decimal, date...) are shared. Only fields those are touched by ``update``
+are validated (same as assignment), along the path of nested updates."""
+
+import typing
+from functools import lru_cache
+
+from pydantic import BaseModel
+
+from .batch import BATCH_STATE_ATTR, BatchState, validate_batch
+from .frozen import FROZEN_ATTR
+from .lazy import RawResource
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+@lru_cache(maxsize=None)
+def get_field_names(klass: typing.Type[BaseModel]) -> typing.Dict[str, str]:
+    """Field name and alias -> field name."""
+    names = {field.alias: name for name, field in klass.__fields__.items()}
+    names.update({name: name for name in klass.__fields__})
+    return names
+
+
+def get_field_name(klass: typing.Type[BaseModel], name: str) -> str:
+    """ """
+    try:
+        return get_field_names(klass)[name]
+    except KeyError:
+        raise ValueError(f'"{klass.__name__}" object has no field "{name}"')
+
+
+def clone_value(
+    value: typing.Any, memo: typing.Dict[int, typing.Any] = None
+) -> typing.Any:
+    """ """
+    if isinstance(value, BaseModel):
+        return clone_model(value, deep=True, memo=memo)
+    if isinstance(value, (list, tuple)):
+        # tuples are from frozen models
+        return [clone_value(item, memo) for item in value]
+    if isinstance(value, RawResource):
+        # not yet validated (lazy) element, must not share the memoised model.
+        if value.model is not None:
+            return clone_model(value.model, deep=True, memo=memo)
+        return value.copy()
+    return value
+
+
+def clone_model(
+    model: BaseModel, deep: bool = True, memo: typing.Dict[int, typing.Any] = None
+) -> BaseModel:
+    """New (mutable) instance of the same class, nested elements are cloned as
+    well if ``deep``, otherwise shared (list values are copied). ``memo`` is same
+    as of ``copy.deepcopy``, elements those are shared in source tree (i.e.
+    interned) are shared in clone too."""
+    if memo is not None and id(model) in memo:
+        return memo[id(model)]
+    klass = model.__class__
+    clone = klass.__new__(klass)
+    if memo is not None:
+        memo[id(model)] = clone
+    if deep:
+        values = {
+            name: clone_value(value, memo) for name, value in model.__dict__.items()
+        }
+    else:
+        values = {
+            name: list(value) if isinstance(value, (list, tuple)) else value
+            for name, value in model.__dict__.items()
+        }
+    object.__setattr__(clone, "__dict__", values)
+    object.__setattr__(clone, "__fields_set__", set(model.__fields_set__))
+    object.__setattr__(clone, BATCH_STATE_ATTR, None)
+    object.__setattr__(clone, FROZEN_ATTR, None)
+    return clone
+
+
+def split_path(path: str) -> typing.Tuple[str, typing.Optional[int], str]:
+    """``component.0.valueQuantity.value`` -> ("component", 0, "valueQuantity.value")"""
+    name, _, rest = path.partition(".")
+    index = None
+    head, _, tail = rest.partition(".")
+    if head.isdigit():
+        index = int(head)
+        rest = tail
+    return name, index, rest
+
+
+def apply_update(model: BaseModel, update: typing.Dict[str, typing.Any]):
+    """Applies ``update`` to (already cloned) ``model``, keys are field names or
+    aliases, nested elements are addressed by dotted path, i.e.
+    ``{"code.text": "..", "component.0.valueQuantity.value": 7}``."""
+    klass = model.__class__
+    storage = model.__dict__
+    names: typing.Dict[str, None] = dict()
+    nested: typing.Dict[
+        typing.Tuple[str, typing.Optional[int]], typing.Dict[str, typing.Any]
+    ] = dict()
+    for path, value in update.items():
+        name, index, rest = split_path(path)
+        name = get_field_name(klass, name)
+        if not rest:
+            if index is None:
+                storage[name] = value
+            else:
+                items = storage.get(name, None)
+                if not isinstance(items, list):
+                    raise ValueError(f"'{klass.__name__}.{name}' is not a list")
+                items[index] = value
+            names[name] = None
+            continue
+        nested.setdefault((name, index), dict())[rest] = value
+
+    for (name, index), child_update in nested.items():
+        child = storage.get(name, None)
+        if index is not None:
+            if not isinstance(child, list):
+                raise ValueError(f"'{klass.__name__}.{name}' is not a list")
+            child = child[index]
+        if not isinstance(child, BaseModel):
+            raise ValueError(
+                f"'{klass.__name__}.{name}' is empty or not an element, "
+                f"nested update {list(child_update)} is not possible"
+            )
+        # nested element might be shared (shallow clone), copied on write.
+        child = clone_model(child, deep=False)
+        apply_update(child, child_update)
+        if index is None:
+            storage[name] = child
+        else:
+            storage[name][index] = child
+        model.__fields_set__.add(name)
+
+    if names:
+        # same as assignment, errors are raised with field name as location.
+        validate_batch(model, BatchState(dict(), set(), names))
+
+
+def clone(
+    model: BaseModel,
+    *,
+    deep: bool = True,
+    update: typing.Dict[str, typing.Any] = None,
+) -> BaseModel:
+    """ """
+    new = clone_model(model, deep=deep)
+    if update:
+        apply_update(new, update)
+    return new
+
+
+__all__ = ["clone"]
@@ -1,13 +1,60 @@
 # _*_ coding: utf-8 _*_
+import importlib
+import sys
+import threading
+import typing
+import weakref
 from functools import lru_cache
+from types import MappingProxyType
 
 from pydantic.fields import ModelField
 from pydantic.typing import get_args, get_origin
 
 __author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
 
+# Important! type based caches are unbounded (there are more than thousands of
+# fields in all releases together), a size bounded cache keeps evicting under
+# mixed workload. Entries are living as long as model classes anyway. Field
+# properties are kept per model class, see ``get_field_properties``.
+
+# immutable (read without lock), replaced as a whole once a release is resolved.
+FHIR_ROOT_MODULES: typing.Mapping[str, typing.Any] = MappingProxyType(
+    {
+        "R4": None,
+        "STU3": None,
+        "DSTU2": None,
+    }
+)
+FHIR_ROOT_MODULES_LOCK = threading.Lock()
+
+
+def get_fhir_root_module(fhir_release: str):
+    """ """
+    global FHIR_ROOT_MODULES
+    module = FHIR_ROOT_MODULES[fhir_release]
+    if module is None:
+        mod_name = "fhir.resources"
+        if fhir_release != "R4":
+            mod_name += f".{fhir_release}"
+        module = importlib.import_module(mod_name)
+        with FHIR_ROOT_MODULES_LOCK:
+            FHIR_ROOT_MODULES = MappingProxyType(
+                {**FHIR_ROOT_MODULES, fhir_release: module}
+            )
+
+    return module
+
+
+@lru_cache(maxsize=None, typed=True)
+def get_fhir_release(klass: typing.Type[typing.Any]) -> str:
+    """FHIR release of model class, from it's package (primitive ``id`` type of
+    STU3 is shared with R4)."""
+    for fhir_release in ("STU3", "DSTU2"):
+        if klass.__module__.startswith(f"fhir.resources.{fhir_release}."):
+            return fhir_release
+    return "R4"
+
 
-@lru_cache(maxsize=1024, typed=True)
 def is_list_type(field: ModelField) -> bool:
     """ """
     if field.outer_type_:
@@ -16,7 +63,6 @@ def is_list_type(field: ModelField) -> bool:
     return False
 
 
-@lru_cache(maxsize=1024, typed=True)
 def is_primitive_type(field: ModelField) -> bool:
     """ """
     origin = get_origin(field.type_)
@@ -36,7 +82,7 @@ def is_primitive_type(field: ModelField) -> bool:
     return out
 
 
-@lru_cache(maxsize=512, typed=True)
+@lru_cache(maxsize=None, typed=True)
 def get_fhir_type_name(type_):
     """ """
     try:
@@ -54,7 +100,7 @@ def get_fhir_type_name(type_):
         raise
 
 
-@lru_cache(maxsize=512, typed=True)
+@lru_cache(maxsize=None, typed=True)
 def normalize_fhir_type_class(type_):
     """ """
     if get_origin(type_) is not None:
@@ -66,3 +112,78 @@ def normalize_fhir_type_class(type_):
                 return normalize_fhir_type_class(tp_)
     else:
         return type_
+
+
+class FieldProperties(typing.NamedTuple):
+    """Type properties of a model field, see ``get_field_properties``."""
+
+    is_list: bool
+    is_primitive: bool
+    # i.e. ``typing.Union[FHIRPrimitiveExtensionType, None]`` is resolved
+    type_class: typing.Any
+    # ``None`` for non FHIR types
+    type_name: typing.Optional[str]
+
+
+FIELD_PROPERTIES_ATTR = "__fhir_field_properties__"
+# model classes, those have field properties already, see ``get_cache_info``
+FIELD_PROPERTIES_CLASSES: "weakref.WeakSet[typing.Any]" = weakref.WeakSet()
+
+
+def make_field_properties(field: ModelField) -> FieldProperties:
+    """ """
+    try:
+        type_name = get_fhir_type_name(field.type_)
+    except (AttributeError, TypeError):
+        type_name = None
+    try:
+        is_primitive = is_primitive_type(field)
+    except TypeError:
+        # i.e. ``fhir_comments`` (``typing.Union[str, typing.List[str]]``)
+        is_primitive = False
+    return FieldProperties(
+        is_list_type(field),
+        is_primitive,
+        normalize_fhir_type_class(field.type_),
+        type_name,
+    )
+
+
+def get_field_properties(
+    klass: typing.Type[typing.Any],
+) -> typing.Mapping[str, FieldProperties]:
+    """Field name -> ``FieldProperties`` of model class, computed once and kept
+    on the class itself, so next lookups are plain ``__dict__`` access (no
+    argument hashing of a global cache)."""
+    try:
+        return klass.__dict__[FIELD_PROPERTIES_ATTR]
+    except KeyError:
+        pass
+    properties = MappingProxyType(
+        {name: make_field_properties(field) for name, field in klass.__fields__.items()}
+    )
+    setattr(klass, FIELD_PROPERTIES_ATTR, properties)
+    FIELD_PROPERTIES_CLASSES.add(klass)
+    return properties
+
+
+def get_cache_info() -> typing.Dict[str, typing.Any]:
+    """Hit/miss statistics of type based caches and number of model classes
+    with computed ``field_properties``. Cache of ``has_resource_base`` is
+    shared by all models of a base model class, DSTU2 one is only reported if
+    DSTU2 models are imported."""
+    info: typing.Dict[str, typing.Any] = {
+        func.__name__: func.cache_info()
+        for func in (get_fhir_type_name, normalize_fhir_type_class)
+    }
+    info["field_properties"] = len(FIELD_PROPERTIES_CLASSES)
+    for name, module_name in (
+        ("has_resource_base", "fhir.resources.core.fhirabstractmodel"),
+        ("has_resource_base (DSTU2)", "fhir.resources.DSTU2.fhirabstractmodel"),
+    ):
+        module = sys.modules.get(module_name, None)
+        if module is None:
+            continue
+        method = module.FHIRAbstractModel.__dict__["has_resource_base"]
+        info[name] = method.__func__.cache_info()
+    return info
@@ -0,0 +1,80 @@
+# _*_ coding: utf-8 _*_
+"""Compact (sparse) instance storage. Fields those are ``None`` (and their default
+is ``None`` too, i.e. most of elements and all ``__ext`` fields) are not kept in
+instance ``__dict__``. Missing fields are served by ``__getattr__`` fallback,
+so callers see exactly the same values as with the full layout."""
+
+import typing
+from functools import lru_cache
+
+from pydantic import BaseModel
+
+from .batch import BATCH_STATE_ATTR
+from .frozen import FROZEN_ATTR
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+@lru_cache(maxsize=None)
+def get_sparse_fields(klass: typing.Type[BaseModel]) -> typing.FrozenSet[str]:
+    """Names of fields, those could be left out from ``__dict__`` while ``None``."""
+    return frozenset(
+        name
+        for name, field in klass.__fields__.items()
+        if field.default is None and field.default_factory is None
+    )
+
+
+def compact_values(
+    klass: typing.Type[BaseModel], values: typing.Dict[str, typing.Any]
+) -> typing.Dict[str, typing.Any]:
+    """ """
+    sparse = get_sparse_fields(klass)
+    return {
+        name: value
+        for name, value in values.items()
+        if value is not None or name not in sparse
+    }
+
+
+def compact(model: BaseModel):
+    """Drops ``None`` values from ``model.__dict__`` (new and exact sized dict)."""
+    object.__setattr__(
+        model, "__dict__", compact_values(model.__class__, model.__dict__)
+    )
+    # initialized slots are found without ``__getattr__`` fallback.
+    object.__setattr__(model, BATCH_STATE_ATTR, None)
+    object.__setattr__(model, FROZEN_ATTR, None)
+
+
+def get_missing_value(model: BaseModel, name: str) -> typing.Any:
+    """Value of field that is not stored, installed as model's ``__getattr__``
+    (only reached if normal lookup fails)."""
+    if name in get_sparse_fields(model.__class__):
+        return None
+    raise AttributeError(
+        f"'{model.__class__.__name__}' object has no attribute '{name}'"
+    )
+
+
+def iter_values(model: BaseModel) -> typing.Iterator[typing.Tuple[str, typing.Any]]:
+    """All fields (in fields order) with values, same as full ``__dict__``."""
+    storage = model.__dict__
+    for name in model.__fields__:
+        yield name, storage.get(name, None)
+
+
+def full_copy(model: BaseModel) -> BaseModel:
+    """Shallow copy of ``model`` with full (not compact) ``__dict__``."""
+    clone = model.__class__.__new__(model.__class__)
+    object.__setattr__(clone, "__dict__", dict(iter_values(model)))
+    object.__setattr__(clone, "__fields_set__", model.__fields_set__)
+    return clone
+
+
+def is_compact(model: BaseModel) -> bool:
+    """ """
+    return len(model.__dict__) < len(model.__fields__)
+
+
+__all__ = ["compact", "get_sparse_fields", "iter_values"]
@@ -0,0 +1,174 @@
+# _*_ coding: utf-8 _*_
+"""Trusted (non validating) construction of FHIR model trees.
+
+Payloads those are already validated once (i.e. read back from own FHIR store)
+could be turned into models without paying for whole pydantic validator chain
+again. Nested elements are resolved from ``fhirtypes.*Type`` field metadata and
+the ``MODEL_CLASSES`` registry of the FHIR release; no validator (field or root)
+is executed, so garbage in is garbage out!
+"""
+import decimal
+import typing
+from functools import lru_cache
+
+from pydantic import BaseModel
+from pydantic.fields import SHAPE_LIST
+
+from .common import FieldProperties, get_fhir_root_module, get_field_properties
+from .compact import compact_values
+
+if typing.TYPE_CHECKING:
+    from pydantic.fields import ModelField
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+KIND_VALUE = "value"
+KIND_MODEL = "model"
+KIND_POLYMORPHIC = "polymorphic"
+
+
+def _to_decimal(value):
+    """ """
+    if isinstance(value, (decimal.Decimal, bool)) or value is None:
+        return value
+    if isinstance(value, float):
+        value = str(value)
+    return decimal.Decimal(value)
+
+
+def _to_bytes(value):
+    """ """
+    if isinstance(value, str):
+        return value.encode()
+    return value
+
+
+PRIMITIVE_COERCERS: typing.Dict[str, typing.Callable[[typing.Any], typing.Any]] = {
+    "decimal": _to_decimal,
+    "base64Binary": _to_bytes,
+}
+
+
+class TrustedField(typing.NamedTuple):
+    """ """
+
+    name: str
+    kind: str
+    is_list: bool
+    type_: typing.Any
+    coerce: typing.Optional[typing.Callable[[typing.Any], typing.Any]]
+
+
+def _make_trusted_field(
+    field: "ModelField", properties: FieldProperties
+) -> TrustedField:
+    """ """
+    # i.e. ``typing.Union[FHIRPrimitiveExtensionType, None]``
+    type_ = properties.type_class
+    is_list = field.shape == SHAPE_LIST
+    if getattr(type_, "__resource_type__", None) is not None:
+        if hasattr(type_, "validate"):
+            # ``ResourceType`` or ``ElementType``, target is chosen from value.
+            return TrustedField(field.name, KIND_POLYMORPHIC, is_list, type_, None)
+        return TrustedField(field.name, KIND_MODEL, is_list, type_, None)
+
+    coerce = None
+    fhir_type_name = getattr(type_, "fhir_type_name", None)
+    if fhir_type_name is not None:
+        coerce = PRIMITIVE_COERCERS.get(fhir_type_name(), None)
+    return TrustedField(field.name, KIND_VALUE, is_list, type_, coerce)
+
+
+@lru_cache(maxsize=None, typed=True)
+def get_trusted_fields(
+    klass: typing.Type[BaseModel],
+) -> typing.Dict[str, TrustedField]:
+    """Mappings from both alias and field name to ``TrustedField``,
+    computed once per model class."""
+    mapping: typing.Dict[str, TrustedField] = dict()
+    properties = get_field_properties(klass)
+    for name, field in klass.__fields__.items():
+        if name == "resource_type":
+            continue
+        trusted_field = _make_trusted_field(field, properties[name])
+        mapping[name] = trusted_field
+        mapping[field.alias] = trusted_field
+    return mapping
+
+
+@lru_cache(maxsize=None, typed=True)
+def get_default_values(klass: typing.Type[BaseModel]) -> typing.Dict[str, typing.Any]:
+    """Defaults of all fields, FHIR models have only immutable defaults
+    (``None`` or ``resource_type`` constant)."""
+    return {
+        name: field.default
+        for name, field in klass.__fields__.items()
+        if not field.required
+    }
+
+
+@lru_cache(maxsize=None, typed=True)
+def get_model_class(fhir_release: str, model_name: str) -> typing.Type[BaseModel]:
+    """ """
+    return get_fhir_root_module(fhir_release).get_fhir_model_class(model_name)
+
+
+def _construct_value(trusted_field: TrustedField, value: typing.Any) -> typing.Any:
+    """ """
+    if value is None:
+        return value
+
+    if trusted_field.kind == KIND_VALUE:
+        if trusted_field.coerce is not None:
+            return trusted_field.coerce(value)
+        return value
+
+    if isinstance(value, BaseModel):
+        return value
+
+    type_ = trusted_field.type_
+    klass = get_model_class(type_.__fhir_release__, type_.__resource_type__)
+    if isinstance(value, (str, bytes)):
+        # a json str, the way validators are also accepting.
+        value = klass.__config__.json_loads(value)
+
+    if trusted_field.kind == KIND_POLYMORPHIC:
+        resource_type = value.get("resourceType", None)
+        if resource_type is not None and resource_type != type_.__resource_type__:
+            klass = get_model_class(type_.__fhir_release__, resource_type)
+    return construct_tree(klass, value)
+
+
+def construct_tree(
+    klass: typing.Type[BaseModel], data: typing.Dict[str, typing.Any]
+) -> BaseModel:
+    """Recursively build ``klass`` instance (with all nested elements) from
+    trusted ``data``, skipping every validator."""
+    fields = get_trusted_fields(klass)
+    values: typing.Dict[str, typing.Any] = dict()
+    for key, value in data.items():
+        try:
+            trusted_field = fields[key]
+        except KeyError:
+            if key in ("resourceType", "resource_type"):
+                continue
+            raise ValueError(f"'{key}' is not a valid element of ``{klass.__name__}``.")
+        if trusted_field.is_list and isinstance(value, list):
+            value = [_construct_value(trusted_field, v) for v in value]
+        else:
+            value = _construct_value(trusted_field, value)
+        values[trusted_field.name] = value
+
+    # same as ``BaseModel.construct`` but defaults are not computed over again.
+    model = klass.__new__(klass)
+    fields_set = set(values)
+    fields_values = get_default_values(klass).copy()
+    fields_values.update(values)
+    if getattr(klass, "__compact_storage__", False):
+        fields_values = compact_values(klass, fields_values)
+    object.__setattr__(model, "__dict__", fields_values)
+    object.__setattr__(model, "__fields_set__", fields_set)
+    return model
+
+
+__all__ = ["construct_tree"]
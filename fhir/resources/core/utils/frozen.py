@@ -0,0 +1,118 @@
+# _*_ coding: utf-8 _*_
+"""Read-only model trees, i.e. instances those are shared between many parents
+(see ``intern.InternPool``), between threads or cached. Assignment to a frozen
+instance raises ``TypeError``, list values are replaced by tuples.
+Frozen instances are hashable and their serialized output is memoised."""
+
+import functools
+import typing
+
+from pydantic import BaseModel
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+FROZEN_ATTR = "_frozen"
+
+
+class FrozenState:
+    """ """
+
+    __slots__ = ("hash", "outputs")
+
+    def __init__(self):
+        """ """
+        self.hash: typing.Optional[int] = None
+        # (method name, kwargs) -> serialized output
+        self.outputs: typing.Dict[typing.Any, typing.Any] = dict()
+
+
+def get_frozen_state(model: BaseModel) -> typing.Optional[FrozenState]:
+    """ """
+    return getattr(model, FROZEN_ATTR, None)
+
+
+def is_frozen(model: BaseModel) -> bool:
+    """ """
+    return getattr(model, FROZEN_ATTR, None) is not None
+
+
+def freeze_value(value: typing.Any) -> typing.Any:
+    """ """
+    if isinstance(value, list):
+        return tuple(freeze_value(item) for item in value)
+    if isinstance(value, BaseModel) and not is_frozen(value):
+        freeze_tree(value)
+    return value
+
+
+def freeze_tree(model: BaseModel) -> BaseModel:
+    """Freezes ``model`` and all nested elements in place (already frozen
+    elements are frozen as a whole)."""
+    storage = model.__dict__
+    for name, value in storage.items():
+        if isinstance(value, (list, BaseModel)):
+            storage[name] = freeze_value(value)
+    object.__setattr__(model, FROZEN_ATTR, FrozenState())
+    return model
+
+
+def raise_frozen_error(model: BaseModel):
+    """ """
+    raise TypeError(
+        f'"{model.__class__.__name__}" is frozen and does not support item '
+        "assignment, use ``model.clone()`` to get a mutable copy."
+    )
+
+
+def get_hash(model: BaseModel) -> int:
+    """Hash of frozen model (from memoised json), computed once."""
+    state = get_frozen_state(model)
+    if state is None:
+        raise TypeError(
+            f"unhashable type: '{model.__class__.__name__}' "
+            "(only frozen models are hashable, see ``freeze()``)"
+        )
+    if state.hash is None:
+        state.hash = hash((model.__class__, model.json()))
+    return state.hash
+
+
+def frozen_equals(model: BaseModel, other: BaseModel) -> bool:
+    """Either ``model`` or ``other`` is frozen, cached hashes are compared first
+    if both are frozen. Serialized (memoised) output is compared, because list
+    values of frozen model are tuples."""
+    if model is other:
+        return True
+    if model.__class__ is not other.__class__:
+        return False
+    if is_frozen(model) and is_frozen(other) and get_hash(model) != get_hash(other):
+        return False
+    return model.json() == other.json()
+
+
+def memoized_output(method: typing.Callable) -> typing.Callable:
+    """Serialization method decorator, output of frozen model is kept per
+    (keyword) arguments."""
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self, **kwargs):
+        state = get_frozen_state(self)
+        if state is None:
+            return method(self, **kwargs)
+        try:
+            key = (name, frozenset(kwargs.items()))
+            return state.outputs[key]
+        except TypeError:
+            # unhashable argument
+            return method(self, **kwargs)
+        except KeyError:
+            pass
+        result = method(self, **kwargs)
+        state.outputs[key] = result
+        return result
+
+    return wrapper
+
+
+__all__ = ["freeze_tree", "get_hash", "is_frozen"]
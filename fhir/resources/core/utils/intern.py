@@ -0,0 +1,209 @@
+# _*_ coding: utf-8 _*_
+"""Interning of structurally identical (small) elements, i.e. the same ``Coding``,
+``CodeableConcept`` or ``Reference`` repeated in thousands of resources of a bulk
+export. After parsing, the element tree is walked bottom-up and each element of
+pooled type is replaced by a shared (frozen) instance of the pool, values of
+``code``, ``uri`` and ``canonical`` fields are replaced by shared strings."""
+
+import typing
+
+from pydantic import BaseModel
+
+from .common import get_field_properties
+from .frozen import freeze_tree
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+# field kinds (intern plan)
+MODEL_FIELD = 1
+STRING_FIELD = 2
+
+
+class InternStats(typing.NamedTuple):
+    """ """
+
+    # number of values those went through the pool
+    total: int
+    # number of distinct values (kept by the pool)
+    unique: int
+
+    @property
+    def ratio(self) -> float:
+        """Deduplication ratio, i.e. ``10.0`` means ten references per instance."""
+        if self.unique == 0:
+            return 1.0
+        return self.total / self.unique
+
+    def __str__(self):
+        """ """
+        return f"{self.total} -> {self.unique} (x{self.ratio:.2f})"
+
+
+class InternPool:
+    """Pool of shared instances, the same pool should be used for all resources
+    of a batch (``Model.parse_obj(data, intern=pool)``).
+    Pooled instances are frozen (read-only) because they are shared, modifying
+    them raises ``TypeError``, use ``clone()`` to get a mutable element."""
+
+    DEFAULT_TYPES: typing.Tuple[str, ...] = (
+        "Coding",
+        "CodeableConcept",
+        "Quantity",
+        "Reference",
+    )
+    DEFAULT_STRING_TYPES: typing.Tuple[str, ...] = ("Code", "Uri", "Canonical")
+
+    def __init__(
+        self,
+        types: typing.Iterable[str] = None,
+        *,
+        strings: typing.Union[bool, typing.Iterable[str]] = True,
+    ):
+        """``types`` are element (resource) type names, ``strings`` are primitive
+        type class names (or False to disable strings interning)."""
+        if types is None:
+            types = self.DEFAULT_TYPES
+        if strings is True:
+            strings = self.DEFAULT_STRING_TYPES
+        elif strings is False:
+            strings = ()
+        self.types: typing.FrozenSet[str] = frozenset(types)
+        self.string_types: typing.FrozenSet[str] = frozenset(strings)
+        # structural key -> shared instance
+        self.elements: typing.Dict[typing.Any, BaseModel] = dict()
+        # id(shared instance) -> structural key
+        self.keys: typing.Dict[int, typing.Any] = dict()
+        self.strings: typing.Dict[str, str] = dict()
+        self.counters: typing.Dict[str, typing.List[int]] = dict()
+        self.plans: typing.Dict[
+            typing.Type[BaseModel], typing.Tuple[typing.Tuple[str, int], ...]
+        ] = dict()
+
+    def __len__(self):
+        """ """
+        return len(self.elements)
+
+    def get_plan(
+        self, klass: typing.Type[BaseModel]
+    ) -> typing.Tuple[typing.Tuple[str, int], ...]:
+        """Fields of ``klass`` those could contain elements or poolable strings."""
+        try:
+            return self.plans[klass]
+        except KeyError:
+            pass
+        plan = list()
+        for name, properties in get_field_properties(klass).items():
+            type_ = properties.type_class
+            if not isinstance(type_, type):
+                continue
+            if issubclass(type_, str) and type_.__name__ in self.string_types:
+                plan.append((name, STRING_FIELD))
+            elif getattr(type_, "__resource_type__", None) is not None:
+                # ``*Type`` (element) fields and ``Resource`` fields (polymorphic)
+                plan.append((name, MODEL_FIELD))
+        self.plans[klass] = tuple(plan)
+        return self.plans[klass]
+
+    def intern_string(self, value: str) -> str:
+        """ """
+        counter = self.counters.setdefault("strings", [0, 0])
+        counter[0] += 1
+        try:
+            return self.strings[value]
+        except KeyError:
+            counter[1] += 1
+            self.strings[value] = value
+            return value
+
+    def make_key(self, value: typing.Any) -> typing.Any:
+        """Structural (hashable) key of an element or a value, type is part of the
+        key and values are compared by their string form (``1`` and ``True``,
+        ``Decimal("1.0")`` and ``Decimal("1.00")`` are different in FHIR)."""
+        if isinstance(value, BaseModel):
+            try:
+                return self.keys[id(value)]
+            except KeyError:
+                pass
+            return (
+                value.__class__,
+                tuple(
+                    (name, self.make_key(item))
+                    for name, item in value.__dict__.items()
+                    if item is not None
+                ),
+            )
+        if isinstance(value, (list, tuple)):
+            return (list, tuple(self.make_key(item) for item in value))
+        if value.__class__ is str:
+            return value
+        # i.e. datetimes with different offsets might be equal, but not the same.
+        return (value.__class__, str(value))
+
+    def intern_element(self, model: BaseModel) -> BaseModel:
+        """Shared instance, equal to ``model`` (nested elements must be interned
+        already)."""
+        counter = self.counters.setdefault(model.resource_type, [0, 0])
+        counter[0] += 1
+        try:
+            key = self.make_key(model)
+            shared = self.elements.setdefault(key, model)
+        except TypeError:
+            # unhashable value, not interned.
+            counter[1] += 1
+            return model
+        if shared is model:
+            counter[1] += 1
+            self.keys[id(model)] = key
+            freeze_tree(model)
+        return shared
+
+    def intern_value(self, value: typing.Any, kind: int) -> typing.Any:
+        """ """
+        if kind == STRING_FIELD:
+            if value.__class__ is str:
+                return self.intern_string(value)
+            return value
+        if isinstance(value, BaseModel):
+            return self.intern_tree(value)
+        return value
+
+    def intern_tree(self, model: BaseModel) -> BaseModel:
+        """Interns nested elements of ``model`` (in place, bottom-up) and returns
+        shared instance of ``model`` (or ``model`` itself, if type is not pooled)."""
+        if id(model) in self.keys:
+            # already shared instance
+            return model
+        storage = model.__dict__
+        for name, kind in self.get_plan(model.__class__):
+            value = storage.get(name, None)
+            if value is None:
+                continue
+            if isinstance(value, list):
+                for index, item in enumerate(value):
+                    value[index] = self.intern_value(item, kind)
+            else:
+                storage[name] = self.intern_value(value, kind)
+        if model.resource_type in self.types:
+            return self.intern_element(model)
+        return model
+
+    def stats(self) -> typing.Dict[str, InternStats]:
+        """Deduplication stats per element type (and ``strings``)."""
+        return {
+            name: InternStats(total, unique)
+            for name, (total, unique) in sorted(self.counters.items())
+        }
+
+    def report(self) -> str:
+        """ """
+        return "\n".join(f"{name:<20} {stats}" for name, stats in self.stats().items())
+
+    def clear(self):
+        """ """
+        self.elements.clear()
+        self.keys.clear()
+        self.strings.clear()
+        self.counters.clear()
+
+
+__all__ = ["InternPool", "InternStats"]
@@ -0,0 +1,290 @@
+# _*_ coding: utf-8 _*_
+"""Single pass JSON encoder, walks the model once (through per class serialization
+plan) and writes JSON bytes directly to buffer or writable stream, instead of
+building intermediate ``OrderedDict`` tree first.
+Output is byte to byte identical with ``FHIRAbstractModel.json()`` (orjson based).
+"""
+
+import typing
+from collections import deque
+from enum import Enum
+from functools import lru_cache
+
+from pydantic import BaseModel
+
+from .lazy import RawResource
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if typing.TYPE_CHECKING:
+    from fhir.resources.core.fhirabstractmodel import FHIRAbstractModel
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+SEQUENCE_TYPES = (list, tuple, set, frozenset, deque)
+FHIR_COMMENTS_FIELD_NAME = "fhir_comments"
+# value write statuses
+NONE_VALUE = 0
+EMPTY_VALUE = 1
+VALUE = 2
+DEFAULT_FLUSH_SIZE = 64 * 1024
+
+
+@lru_cache(maxsize=None, typed=True)
+def get_encoded_plan(
+    klass: typing.Type["FHIRAbstractModel"], by_alias: bool
+) -> typing.Tuple[typing.Tuple[str, typing.Optional[str], bytes, bytes], ...]:
+    """Serialization plan of class with already encoded (json) keys."""
+    plan = list()
+    for element in klass.get_serialization_plan():
+        key = by_alias and element.alias or element.name
+        ext_key = b""
+        if element.ext_name is not None:
+            ext_key = (
+                orjson.dumps(by_alias and element.ext_alias or element.ext_name) + b":"
+            )
+        plan.append((element.name, element.ext_name, orjson.dumps(key) + b":", ext_key))
+    return tuple(plan)
+
+
+class JSONWriter:
+    """ """
+
+    __slots__ = (
+        "buffer",
+        "stream",
+        "flush_size",
+        "default",
+        "by_alias",
+        "exclude_none",
+        "exclude_comments",
+        "_offset",
+        "_pending",
+    )
+
+    def __init__(
+        self,
+        *,
+        default: typing.Callable[[typing.Any], typing.Any],
+        by_alias: bool = True,
+        exclude_none: bool = True,
+        exclude_comments: bool = False,
+        stream: typing.Optional[typing.BinaryIO] = None,
+        flush_size: int = DEFAULT_FLUSH_SIZE,
+    ):
+        """ """
+        if orjson is None:
+            raise ImportError(
+                "``orjson`` library is required for direct json writer, "
+                "make sure ``fhir.resources[orjson]`` is installed."
+            )
+        self.buffer = bytearray()
+        self.stream = stream
+        self.flush_size = flush_size
+        self.default = default
+        self.by_alias = by_alias
+        self.exclude_none = exclude_none
+        self.exclude_comments = exclude_comments
+        # number of bytes those are already flushed into stream
+        self._offset = 0
+        # the earliest position, those bytes might be discarded later
+        # (i.e. nested element became empty)
+        self._pending: typing.Optional[int] = None
+
+    def mark(self) -> int:
+        """ """
+        position = self._offset + len(self.buffer)
+        if self._pending is None:
+            self._pending = position
+        return position
+
+    def discard(self, position: int):
+        """Discard everything written after ``position``"""
+        del self.buffer[position - self._offset :]
+        if self._pending == position:
+            self._pending = None
+
+    def write_leaf(self, data: bytes):
+        """ """
+        self.buffer += data
+        # whatever is written so far will never be discarded.
+        self._pending = None
+
+    def maybe_flush(self):
+        """ """
+        if self.stream is None or len(self.buffer) < self.flush_size:
+            return
+        if self._pending is None:
+            size = len(self.buffer)
+        else:
+            size = self._pending - self._offset
+        if size <= 0:
+            return
+        self.stream.write(bytes(self.buffer[:size]))
+        del self.buffer[:size]
+        self._offset += size
+
+    def close(self) -> bytes:
+        """ """
+        if self.stream is None:
+            return bytes(self.buffer)
+        if len(self.buffer) > 0:
+            self.stream.write(bytes(self.buffer))
+            self._offset += len(self.buffer)
+            self.buffer.clear()
+        return b""
+
+    def dumps(self, value: typing.Any) -> bytes:
+        """ """
+        return orjson.dumps(value, default=self.default)
+
+    def write_model(self, model: "FHIRAbstractModel", root: bool = False) -> int:
+        """ """
+        start = 0
+        if root is False:
+            start = self.mark()
+        buffer = self.buffer
+        buffer += b"{"
+        first = True
+        if model.__class__.has_resource_base():
+            self.write_leaf(b'"resourceType":' + self.dumps(model.resource_type))
+            first = False
+
+        storage = model.__dict__
+        for name, ext_name, key, ext_key in get_encoded_plan(
+            model.__class__, self.by_alias
+        ):
+            value = storage.get(name, None)
+            if value is not None:
+                position = self.mark()
+                if first is False:
+                    buffer += b","
+                buffer += key
+                if self.write_value(value) == NONE_VALUE:
+                    self.discard(position)
+                else:
+                    first = False
+            elif self.exclude_none is False:
+                self.write_leaf((first is False and b"," or b"") + key + b"null")
+                first = False
+
+            if ext_name is None:
+                continue
+            ext_value = storage.get(ext_name, None)
+            if ext_value is None:
+                continue
+            position = self.mark()
+            if first is False:
+                buffer += b","
+            buffer += ext_key
+            if self.write_value(ext_value) != VALUE:
+                self.discard(position)
+            else:
+                first = False
+
+        comments = storage.get(FHIR_COMMENTS_FIELD_NAME, None)
+        if comments is not None and not self.exclude_comments:
+            self.write_leaf(
+                (first is False and b"," or b"")
+                + b'"'
+                + FHIR_COMMENTS_FIELD_NAME.encode()
+                + b'":'
+                + self.dumps(comments)
+            )
+            first = False
+
+        buffer += b"}"
+        if first is True:
+            if root is False and self.exclude_none is True:
+                self.discard(start)
+                return NONE_VALUE
+            return EMPTY_VALUE
+        return VALUE
+
+    def write_value(self, value: typing.Any) -> int:
+        """ """
+        if isinstance(value, RawResource):
+            if self.by_alias is False or self.exclude_comments is True:
+                value = value.resolve()
+            elif value.raw is not None:
+                # untouched lazy element, raw json is passed through.
+                self.write_leaf(value.raw)
+                return VALUE
+            else:
+                return self.write_generic(value.data)
+
+        if isinstance(value, BaseModel):
+            if hasattr(value.__class__, "get_serialization_plan"):
+                return self.write_model(value)
+            return self.write_generic(value)
+
+        if isinstance(value, SEQUENCE_TYPES):
+            if len(value) == 0:
+                if self.exclude_none is True:
+                    return NONE_VALUE
+                self.buffer += self.dumps(list())
+                return EMPTY_VALUE
+            self.buffer += b"["
+            first = True
+            for item in value:
+                if first is False:
+                    self.buffer += b","
+                first = False
+                if item is None or self.write_value(item) == NONE_VALUE:
+                    self.write_leaf(b"null")
+                self.maybe_flush()
+            self.buffer += b"]"
+            return VALUE
+
+        if isinstance(value, (dict, Enum)):
+            return self.write_generic(value)
+
+        self.write_leaf(self.dumps(value))
+        return VALUE
+
+    def write_generic(self, value: typing.Any) -> int:
+        """Fallback for values, those are not FHIR elements."""
+        from fhir.resources.core.fhirabstractmodel import FHIRAbstractModel
+
+        value = FHIRAbstractModel._fhir_get_value(
+            value,
+            by_alias=self.by_alias,
+            exclude_none=self.exclude_none,
+            exclude_comments=self.exclude_comments,
+        )
+        if value is None:
+            return NONE_VALUE
+        self.write_leaf(self.dumps(value))
+        if isinstance(value, (dict, list, tuple)) and len(value) == 0:
+            return EMPTY_VALUE
+        return VALUE
+
+
+def json_dumps_model(
+    model: "FHIRAbstractModel",
+    *,
+    default: typing.Callable[[typing.Any], typing.Any] = None,
+    by_alias: bool = True,
+    exclude_none: bool = True,
+    exclude_comments: bool = False,
+    stream: typing.Optional[typing.BinaryIO] = None,
+    flush_size: int = DEFAULT_FLUSH_SIZE,
+) -> bytes:
+    """Encode model as json bytes. If ``stream`` is provided, bytes are written
+    (in chunks of about ``flush_size``) into that and empty bytes is returned."""
+    writer = JSONWriter(
+        default=default or model.__json_encoder__,
+        by_alias=by_alias,
+        exclude_none=exclude_none,
+        exclude_comments=exclude_comments,
+        stream=stream,
+        flush_size=flush_size,
+    )
+    writer.write_model(model, root=True)
+    return writer.close()
+
+
+__all__ = ["json_dumps_model", "JSONWriter"]
@@ -0,0 +1,184 @@
+# _*_ coding: utf-8 _*_
+"""Lazy (deferred) validation of resource elements, mainly for Bundle entries.
+The resource is kept as raw json bytes (or already decoded dict) and validated
+into its model class only on first attribute access. Untouched raw bytes are
+written as is, while serializing into json."""
+
+import copy
+import io
+import typing
+
+from pydantic import BaseModel, ValidationError
+
+from .bundlereader import JSONChunkScanner
+from .frozen import freeze_tree, is_frozen
+
+if typing.TYPE_CHECKING:
+    from fhir.resources.core.fhirabstractmodel import FHIRAbstractModel
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+class RawResource:
+    """Not yet validated value of ``owner.name`` field."""
+
+    __slots__ = ("owner", "name", "raw", "data", "model")
+
+    def __init__(
+        self,
+        owner: typing.Type["FHIRAbstractModel"],
+        name: str,
+        *,
+        raw: bytes = None,
+        data: typing.Dict[str, typing.Any] = None,
+    ):
+        """ """
+        self.owner = owner
+        self.name = name
+        self.raw = raw
+        self.data = data
+        self.model: typing.Optional["FHIRAbstractModel"] = None
+
+    def get_data(self) -> typing.Dict[str, typing.Any]:
+        """Decoded (not validated) json, a new object for each call, so the
+        caller (i.e. ``dict()`` output) could change it freely."""
+        if self.raw is not None:
+            return self.owner.__config__.json_loads(self.raw)
+        return copy.deepcopy(self.data)
+
+    def copy(self) -> "RawResource":
+        """Unresolved copy, raw bytes are shared (immutable), decoded ``data``
+        is copied."""
+        return self.__class__(
+            self.owner,
+            self.name,
+            raw=self.raw,
+            data=copy.deepcopy(self.data) if self.raw is None else None,
+        )
+
+    def resolve(self) -> "FHIRAbstractModel":
+        """Validate with field's own validators (so errors are same as eager
+        validation), result is memoised."""
+        if self.model is None:
+            field = self.owner.__fields__[self.name]
+            value, errors = field.validate(
+                self.raw if self.raw is not None else self.data,
+                {},
+                loc=field.alias,
+                cls=self.owner,
+            )
+            if errors:
+                if not isinstance(errors, list):
+                    errors = [errors]
+                raise ValidationError(errors, self.owner)
+            self.model = value
+        return self.model
+
+    def __repr__(self):
+        """ """
+        state = self.raw is not None and "raw" or "data"
+        return (
+            f"<{self.__class__.__name__} {self.owner.__name__}.{self.name} ({state})>"
+        )
+
+
+class LazyElement:
+    """Data descriptor (takes precedence over instance ``__dict__``), resolves
+    ``RawResource`` on first access and replaces it with validated model."""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        """ """
+        self.name = name
+
+    def __get__(self, instance, owner):
+        """ """
+        if instance is None:
+            return self
+        value = instance.__dict__.get(self.name, None)
+        if isinstance(value, RawResource):
+            value = value.resolve()
+            if is_frozen(instance):
+                # i.e. shared LazyBundle from ``ValidationCache``
+                freeze_tree(value)
+            instance.__dict__[self.name] = value
+        return value
+
+    def __set__(self, instance, value):
+        """Only for completeness, ``BaseModel.__setattr__`` writes ``__dict__``."""
+        instance.__dict__[self.name] = value
+
+
+def make_lazy(
+    klass: typing.Type["FHIRAbstractModel"],
+    data: typing.Dict[str, typing.Any],
+    name: str,
+) -> "FHIRAbstractModel":
+    """Validate ``data`` as ``klass`` except the ``name`` element,
+    that is kept as ``RawResource``."""
+    value = data.get(name, None)
+    if value is None or isinstance(value, BaseModel):
+        return klass.parse_obj(data)
+    data = dict(data)
+    del data[name]
+    model = klass.parse_obj(data)
+    if isinstance(value, RawResource):
+        value = value.raw if value.raw is not None else value.data
+    if isinstance(value, str):
+        value = value.encode("utf-8")
+    if isinstance(value, bytes):
+        raw_resource = RawResource(klass, name, raw=value)
+    else:
+        raw_resource = RawResource(klass, name, data=value)
+    model.__dict__[name] = raw_resource
+    model.__fields_set__.add(name)
+    return model
+
+
+def make_lazy_entries(
+    entry_class: typing.Type["FHIRAbstractModel"], obj: typing.Any
+) -> typing.Any:
+    """Bundle data with ``entry`` items as lazy entry models."""
+    if not isinstance(obj, dict) or not isinstance(obj.get("entry", None), list):
+        return obj
+    obj = dict(obj)
+    obj["entry"] = [
+        make_lazy(entry_class, entry, "resource") if isinstance(entry, dict) else entry
+        for entry in obj["entry"]
+    ]
+    return obj
+
+
+def split_bundle_json(
+    b: typing.Union[str, bytes],
+    json_loads: typing.Callable[[typing.Any], typing.Any],
+) -> typing.Dict[str, typing.Any]:
+    """Decode Bundle json except ``entry.resource``, those are kept as raw
+    json bytes (slices of original document)."""
+    if isinstance(b, str):
+        b = b.encode("utf-8")
+    scanner = JSONChunkScanner(io.BytesIO(b), chunk_size=max(len(b), 1))
+    data: typing.Dict[str, typing.Any] = dict()
+    for key in scanner.iter_object_keys(json_loads):
+        if key != "entry" or scanner.peek() != b"[":
+            data[key] = json_loads(scanner.read_value())
+            continue
+        entries = list()
+        for _ in scanner.iter_array():
+            if scanner.peek() != b"{":
+                entries.append(json_loads(scanner.read_value()))
+                continue
+            entry: typing.Dict[str, typing.Any] = dict()
+            for entry_key in scanner.iter_object_keys(json_loads):
+                value = scanner.read_value()
+                if entry_key == "resource" and value[:1] == b"{":
+                    entry[entry_key] = value
+                else:
+                    entry[entry_key] = json_loads(value)
+            entries.append(entry)
+        data[key] = entries
+    return data
+
+
+__all__ = ["LazyElement", "RawResource", "make_lazy_entries", "split_bundle_json"]
@@ -0,0 +1,217 @@
+# _*_ coding: utf-8 _*_
+"""NDJSON (FHIR Bulk Data) reader, parallel validator and writer.
+Each line is an independent resource, invalid lines are reported (with line number)
+as ``NDJSONRecord.error`` instead of aborting the whole file."""
+
+import os
+import pathlib
+import typing
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, wait
+from contextlib import contextmanager
+
+from pydantic import ValidationError
+
+from .construct import get_model_class
+
+if typing.TYPE_CHECKING:
+    from fhir.resources.core.fhirabstractmodel import FHIRAbstractModel
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+DEFAULT_CHUNK_SIZE = 1000
+DEFAULT_READ_SIZE = 1024 * 1024
+
+SourceType = typing.Union[str, pathlib.Path, typing.IO]
+RawLine = typing.Tuple[int, bytes]
+
+
+class NDJSONError(typing.NamedTuple):
+    """ """
+
+    message: str
+    # pydantic's ``ValidationError.errors()``, if it was validation error.
+    errors: typing.Optional[typing.List[typing.Dict[str, typing.Any]]] = None
+
+
+class NDJSONRecord(typing.NamedTuple):
+    """Outcome of single line, either ``model`` or ``error`` is set."""
+
+    line_number: int
+    model: typing.Optional["FHIRAbstractModel"] = None
+    error: typing.Optional[NDJSONError] = None
+
+
+@contextmanager
+def open_source(source: SourceType, mode: str = "rb"):
+    """ """
+    if isinstance(source, (str, pathlib.Path)):
+        with open(str(source), mode) as fp:
+            yield fp
+    else:
+        yield source
+
+
+def iter_lines(
+    source: SourceType, read_size: int = DEFAULT_READ_SIZE
+) -> typing.Iterator[RawLine]:
+    """Yields (line number, raw line) of all non blank lines, file is read in
+    chunks of ``read_size`` bytes. Line number starts from 1."""
+    with open_source(source) as fp:
+        line_number = 0
+        remaining = b""
+        while True:
+            chunk = fp.read(read_size)
+            if isinstance(chunk, str):
+                chunk = chunk.encode("utf-8")
+            if not chunk:
+                break
+            lines = (remaining + chunk).split(b"\n")
+            remaining = lines.pop()
+            for line in lines:
+                line_number += 1
+                if line.strip():
+                    yield line_number, line
+        if remaining.strip():
+            yield line_number + 1, remaining
+
+
+def iter_chunks(
+    source: SourceType, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> typing.Iterator[typing.List[RawLine]]:
+    """ """
+    chunk: typing.List[RawLine] = list()
+    for raw_line in iter_lines(source):
+        chunk.append(raw_line)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = list()
+    if chunk:
+        yield chunk
+
+
+def validate_line(
+    fhir_release: str, line_number: int, line: bytes, validate: bool = True
+) -> NDJSONRecord:
+    """ """
+    try:
+        klass = get_model_class(fhir_release, "Resource")
+        data = klass.__config__.json_loads(line)
+        if not isinstance(data, dict) or "resourceType" not in data:
+            raise ValueError("Line is not a FHIR resource (missing 'resourceType').")
+        try:
+            klass = get_model_class(fhir_release, data["resourceType"])
+        except KeyError:
+            raise LookupError(
+                f"'{data['resourceType']}' is not valid FHIR resource type "
+                f"({fhir_release})."
+            )
+        if validate:
+            model = klass.parse_obj(data)
+        else:
+            model = klass.construct_tree(data)
+    except ValidationError as exc:
+        return NDJSONRecord(line_number, error=NDJSONError(str(exc), exc.errors()))
+    except (ValueError, LookupError, TypeError) as exc:
+        return NDJSONRecord(line_number, error=NDJSONError(str(exc)))
+    return NDJSONRecord(line_number, model=model)
+
+
+def validate_chunk(
+    fhir_release: str, chunk: typing.List[RawLine], validate: bool = True
+) -> typing.List[NDJSONRecord]:
+    """Worker function (module level, so that it is picklable)."""
+    return [
+        validate_line(fhir_release, line_number, line, validate)
+        for line_number, line in chunk
+    ]
+
+
+def iter_ndjson(
+    source: SourceType, *, fhir_release: str = "R4", validate: bool = True
+) -> typing.Iterator[NDJSONRecord]:
+    """Single process reader, records are yielded in file order."""
+    for line_number, line in iter_lines(source):
+        yield validate_line(fhir_release, line_number, line, validate)
+
+
+def iter_ndjson_parallel(
+    source: SourceType,
+    *,
+    fhir_release: str = "R4",
+    validate: bool = True,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_workers: int = None,
+    ordered: bool = True,
+    executor: Executor = None,
+    max_pending: int = None,
+) -> typing.Iterator[NDJSONRecord]:
+    """Lines are validated in chunks of ``chunk_size`` by pool of processes.
+    If ``ordered`` is False, records are yielded as soon as any chunk is done.
+    At most ``max_pending`` chunks are in flight (default is twice
+    ``max_workers`` or ``os.cpu_count()``), so memory is bounded even for huge
+    files. A custom ``executor`` is not shut down here."""
+    if max_pending is None:
+        max_pending = 2 * (max_workers or os.cpu_count() or 1)
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+    pending: typing.Deque = deque()
+    try:
+        for chunk in iter_chunks(source, chunk_size):
+            pending.append(
+                executor.submit(validate_chunk, fhir_release, chunk, validate)
+            )
+            if len(pending) < max_pending:
+                continue
+            if ordered:
+                yield from pending.popleft().result()
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.remove(future)
+                    yield from future.result()
+
+        while pending:
+            if ordered:
+                yield from pending.popleft().result()
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.remove(future)
+                    yield from future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+        if own_executor:
+            executor.shutdown(wait=True)
+
+
+def write_ndjson(
+    models: typing.Iterable["FHIRAbstractModel"],
+    target: SourceType,
+    *,
+    exclude_comments: bool = False,
+) -> int:
+    """Writes one model per line (``model.json(return_bytes=True)``), returns
+    number of written lines. ``target`` is file path or binary stream."""
+    count = 0
+    with open_source(target, mode="wb") as fp:
+        for model in models:
+            line = model.json(return_bytes=True, exclude_comments=exclude_comments)
+            if isinstance(line, str):
+                line = line.encode("utf-8")
+            fp.write(line)
+            fp.write(b"\n")
+            count += 1
+    return count
+
+
+__all__ = [
+    "NDJSONError",
+    "NDJSONRecord",
+    "iter_lines",
+    "iter_ndjson",
+    "iter_ndjson_parallel",
+    "write_ndjson",
+]
@@ -0,0 +1,56 @@
+# _*_ coding: utf-8 _*_
+"""Compact pickling of models. Only values those are not default (mostly
+``None`` elements and ``__ext`` fields) are written and the instance is
+restored the same way as trusted construction, without any validator."""
+
+import typing
+
+from pydantic import BaseModel
+
+from .compact import compact_values
+from .construct import get_default_values
+from .frozen import FROZEN_ATTR, FrozenState, is_frozen
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+def get_state(model: BaseModel) -> typing.Tuple[typing.Any, ...]:
+    """Arguments of ``restore_model``, ``__fields_set__`` and frozen flag are
+    only written if those are different from usual."""
+    klass = model.__class__
+    defaults = get_default_values(klass)
+    values = {
+        name: value
+        for name, value in model.__dict__.items()
+        if value is not None and value is not defaults.get(name, None)
+    }
+    if is_frozen(model):
+        return klass, values, model.__fields_set__, True
+    if model.__fields_set__ != values.keys():
+        return klass, values, model.__fields_set__
+    return klass, values
+
+
+def restore_model(
+    klass: typing.Type[BaseModel],
+    values: typing.Dict[str, typing.Any],
+    fields_set: typing.Set[str] = None,
+    frozen: bool = False,
+) -> BaseModel:
+    """ """
+    model = klass.__new__(klass)
+    fields_values = get_default_values(klass).copy()
+    fields_values.update(values)
+    if getattr(klass, "__compact_storage__", False):
+        fields_values = compact_values(klass, fields_values)
+    object.__setattr__(model, "__dict__", fields_values)
+    object.__setattr__(
+        model, "__fields_set__", set(values if fields_set is None else fields_set)
+    )
+    if frozen:
+        # nested elements are restored as frozen already.
+        object.__setattr__(model, FROZEN_ATTR, FrozenState())
+    return model
+
+
+__all__ = ["get_state", "restore_model"]
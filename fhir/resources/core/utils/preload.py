@@ -0,0 +1,144 @@
+# _*_ coding: utf-8 _*_
+"""Warm-up of model classes, i.e. in master process of prefork servers
+(gunicorn, uwsgi) before fork, so that workers share already built classes,
+validators and caches (copy-on-write) and the first request does not pay
+for imports."""
+
+import importlib
+import time
+import tracemalloc
+import typing
+
+from .common import get_fhir_root_module, get_field_properties
+
+if typing.TYPE_CHECKING:
+    from fhir.resources.core.fhirabstractmodel import FHIRAbstractModel
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+class PreloadReport(typing.NamedTuple):
+    """ """
+
+    releases: typing.Tuple[str, ...]
+    # number of loaded model classes (including nested elements)
+    models: int
+    seconds: float
+    # python memory allocated (and still alive) while preloading, in bytes.
+    memory: typing.Optional[int] = None
+
+    def __str__(self):
+        """ """
+        memory = ""
+        if self.memory is not None:
+            memory = f", {self.memory / 1024 / 1024:.2f} MiB"
+        return (
+            f"{self.models} models ({', '.join(self.releases)}) are preloaded "
+            f"in {self.seconds:.3f}s{memory}"
+        )
+
+
+def preload_model(
+    klass: typing.Type["FHIRAbstractModel"],
+    fhirtypes: typing.Any,
+    fhirtypesvalidators: typing.Any,
+    seen: typing.Set[typing.Any],
+):
+    """Builds class level caches of ``klass`` and walks through all (nested)
+    ``*Type`` fields, the target model classes are loaded recursively."""
+    if klass in seen:
+        return
+    seen.add(klass)
+    klass.has_resource_base()
+    klass.get_resource_type()
+    for method_name in ("get_alias_mapping", "get_serialization_plan"):
+        # not available for all releases
+        method = getattr(klass, method_name, None)
+        if method is not None:
+            method()
+
+    for properties in get_field_properties(klass).values():
+        type_ = properties.type_class
+        if not isinstance(type_, type) or not issubclass(
+            type_, (fhirtypes.AbstractType, fhirtypes.AbstractBaseType)
+        ):
+            continue
+        try:
+            model_class, _ = fhirtypesvalidators.get_fhir_type_validators(type_)
+        except (KeyError, AttributeError, ImportError):
+            # not (properly) registered in ``MODEL_CLASSES``, left as it is.
+            continue
+        preload_model(model_class, fhirtypes, fhirtypesvalidators, seen)
+
+
+def preload_release(
+    fhir_release: str,
+    resource_types: typing.Optional[typing.Iterable[str]] = None,
+    seen: typing.Set[typing.Any] = None,
+) -> typing.Set[typing.Any]:
+    """ """
+    if seen is None:
+        seen = set()
+    root = get_fhir_root_module(fhir_release)
+    fhirtypes = importlib.import_module(root.__name__ + ".fhirtypes")
+    fhirtypesvalidators = importlib.import_module(
+        root.__name__ + ".fhirtypesvalidators"
+    )
+    names = resource_types
+    if names is None:
+        names = list(fhirtypesvalidators.MODEL_CLASSES)
+    for resource_type in names:
+        try:
+            klass = fhirtypesvalidators.get_fhir_model_class(resource_type)
+        except KeyError:
+            raise LookupError(
+                f"'{resource_type}' is not valid FHIRModel (element type) name "
+                f"({fhir_release})!"
+            )
+        except (AttributeError, ImportError):
+            if resource_types is not None:
+                raise
+            # broken registry entry, nothing to preload.
+            continue
+        preload_model(klass, fhirtypes, fhirtypesvalidators, seen)
+    return seen
+
+
+def preload(
+    resource_types: typing.Union[str, typing.Iterable[str]] = None,
+    releases: typing.Union[str, typing.Iterable[str]] = ("R4",),
+    *,
+    trace_memory: bool = True,
+) -> PreloadReport:
+    """Imports model modules of ``resource_types`` (all models if None) of each
+    release, resolves validators of all nested ``*Type`` and populates class level
+    caches (``get_alias_mapping``, ``has_resource_base``...).
+    Memory is measured by ``tracemalloc``, disable ``trace_memory`` to avoid
+    tracing overhead."""
+    if isinstance(resource_types, str):
+        resource_types = [resource_types]
+    if isinstance(releases, str):
+        releases = [releases]
+    releases = tuple(releases)
+
+    tracing = trace_memory and not tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.start()
+    memory = None
+    if trace_memory:
+        memory = tracemalloc.get_traced_memory()[0]
+    try:
+        start = time.perf_counter()
+        seen: typing.Set[typing.Any] = set()
+        for fhir_release in releases:
+            preload_release(fhir_release, resource_types, seen)
+        seconds = time.perf_counter() - start
+        if memory is not None:
+            memory = tracemalloc.get_traced_memory()[0] - memory
+    finally:
+        if tracing:
+            tracemalloc.stop()
+    return PreloadReport(releases, len(seen), seconds, memory)
+
+
+__all__ = ["PreloadReport", "preload"]
@@ -1,20 +1,29 @@
 # _*_ coding: utf-8 _*_
-import importlib
+import decimal
+import io
 import logging
 import typing
 from collections import OrderedDict, deque
-from copy import copy
+from functools import lru_cache
 from pathlib import Path
 
 from lxml import etree  # type: ignore
 from lxml.etree import QName  # type: ignore
 from pydantic.fields import SHAPE_LIST, SHAPE_SINGLETON
 
-from .common import (
+from .common import (  # noqa: F401
+    FHIR_ROOT_MODULES,
+    FieldProperties,
+    get_fhir_release,
+    get_fhir_root_module,
     get_fhir_type_name,
+    get_field_properties,
     is_primitive_type,
     normalize_fhir_type_class,
 )
+from .construct import KIND_VALUE, get_model_class, get_trusted_fields
+from .lazy import RawResource
+from .xsd import SCHEMA_REGISTRY
 
 if typing.TYPE_CHECKING:
     from fhir.resources.core.fhirabstractmodel import FHIRAbstractModel
@@ -33,11 +42,6 @@ TupleStrKeyVal = typing.Tuple[str, StrBytes]
 ROOT_NS = "http://hl7.org/fhir"
 XHTML_NS = "http://www.w3.org/1999/xhtml"
 EMPTY_VALUE = None
-FHIR_ROOT_MODULES: typing.Dict[str, typing.Any] = {
-    "R4": None,
-    "STU3": None,
-    "DSTU2": None,
-}
 LOG = logging.getLogger(__name__)
 
 
@@ -69,18 +73,6 @@ def get_fhir_model_class(field, check=True):
     return mod.get_fhir_model_class(get_fhir_type_name(field.type_))
 
 
-def get_fhir_root_module(fhir_release: str):
-    """ """
-    global FHIR_ROOT_MODULES
-    if FHIR_ROOT_MODULES[fhir_release] is None:
-        mod_name = "fhir.resources"
-        if fhir_release != "R4":
-            mod_name += f".{fhir_release}"
-        FHIR_ROOT_MODULES[fhir_release] = importlib.import_module(mod_name)
-
-    return FHIR_ROOT_MODULES[fhir_release]
-
-
 class SimpleNodeStorage:
 
     __slots__ = ("__storage__", "node")
@@ -335,6 +327,29 @@ class Comment:
         return self.to_string()
 
 
+# (prefix, location) of namespaces those are declared by ancestors
+NamespaceScope = typing.FrozenSet[typing.Tuple[StrNone, str]]
+EMPTY_NAMESPACE_SCOPE: NamespaceScope = frozenset()
+
+
+def make_namespace_scope(
+    exists_ns: typing.Union[typing.List[Namespace], NamespaceScope, None],
+    parent: typing.Optional["Node"],
+) -> NamespaceScope:
+    """Scope is passed as is (from ``Node.from_element`` of the parent),
+    list of ``Namespace`` (and parent namespaces) is converted once."""
+    if isinstance(exists_ns, frozenset):
+        return exists_ns
+    keys = set()
+    if exists_ns:
+        keys.update(ns.to_xml() for ns in exists_ns)
+    if parent is not None:
+        keys.update(ns.to_xml() for ns in parent.namespaces)
+    if not keys:
+        return EMPTY_NAMESPACE_SCOPE
+    return frozenset(keys)
+
+
 class Node:
     """ """
 
@@ -503,10 +518,13 @@ class Node:
         cls,
         element: etree._Element,
         parent: "Node" = None,
-        exists_ns: typing.List[Namespace] = None,
+        exists_ns: typing.Union[typing.List[Namespace], NamespaceScope] = None,
         comments: typing.List[Comment] = None,
     ):
-        """ """
+        """``exists_ns`` are namespaces those are already declared by ancestors,
+        only new namespaces are added to the node. Children share the same
+        (immutable) scope, it is copied only if the element declares any new
+        namespace, so the cost per element doesn't depend on depth."""
         name = Node.clean_tag(element)
         me = cls(name)
         if element.text:
@@ -518,19 +536,18 @@ class Node:
             else:
                 me.add_attribute(attr, value)
 
-        if exists_ns is None:
-            exists_ns = []
-
-        if parent is not None:
-            exists_ns += parent.namespaces.as_list()
-
+        scope = make_namespace_scope(exists_ns, parent)
         # handle namespaces
-        for prefix, location in element.nsmap.items():
-            ns = Namespace(prefix, location)
-            if ns in exists_ns:
+        declared: typing.Optional[typing.Set[typing.Tuple[StrNone, str]]] = None
+        for key in element.nsmap.items():
+            if key in scope:
                 continue
-            me.namespaces.append(ns)
-            exists_ns.append(ns)
+            me.namespaces.append(Namespace(*key))
+            if declared is None:
+                declared = set(scope)
+            declared.add(key)
+        if declared is not None:
+            scope = frozenset(declared)
 
         # handle comments
         if comments:
@@ -551,7 +568,7 @@ class Node:
             child_name = Node.clean_tag(child)
             child_class = globals().get(child_name, Node)
             child_class.from_element(
-                child, parent=me, exists_ns=copy(exists_ns), comments=child_comments
+                child, parent=me, exists_ns=scope, comments=child_comments
             )
             # reset
             child_comments = None
@@ -577,11 +594,13 @@ class Node:
     @staticmethod
     def add_fhir_element(parent, field, value, ext=None, ext_field=None):
         """"""
+        if isinstance(value, RawResource):
+            value = value.resolve()
         child = Node.create(field.alias)
         field_type = field.type_
         if is_primitive_type(field):
-            if isinstance(value, list):
-                if ext and not isinstance(ext, list):
+            if isinstance(value, (list, tuple)):
+                if ext and not isinstance(ext, (list, tuple)):
                     ext = [ext]
 
                 if ext is None:
@@ -623,7 +642,7 @@ class Node:
             else:
                 child.value = EMPTY_VALUE
                 if ext is not None:
-                    exts = not isinstance(ext, list) and [ext] or ext
+                    exts = not isinstance(ext, (list, tuple)) and [ext] or ext
                     for ext_ in exts:
                         if ext_ is None:
                             continue
@@ -641,7 +660,7 @@ class Node:
             return
 
         # Handle Multiple non primitive type values
-        if isinstance(value, list):
+        if isinstance(value, (list, tuple)):
             for value_ in value:
                 Node.add_fhir_element(
                     parent,
@@ -691,10 +710,9 @@ class Node:
         comments = value.__dict__.get("fhir_comments", None)
         Node.inject_comments(parent, comments)
 
-        alias_maps = value.__class__.get_alias_mapping()
-        for prop_name in value.__class__.elements_sequence():
-            field_ = value.__class__.__fields__[alias_maps[prop_name]]
-            val = value.__dict__.get(field_.name)
+        for element in value.__class__.get_serialization_plan():
+            field_ = element.field
+            val = value.__dict__.get(element.name)
             if (
                 field_type.fhir_type_name() == "Extension"
                 and field_.alias in ("url", "id")
@@ -715,11 +733,10 @@ class Node:
                     continue
 
             value_ext, value_ext_field = None, None
-            if is_primitive_type(field_):
-                ext_key = f"{field_.name}__ext"
-                value_ext = value.__dict__.get(ext_key, None)
+            if element.ext_name is not None:
+                value_ext = value.__dict__.get(element.ext_name, None)
                 if value_ext:
-                    value_ext_field = value.__class__.__fields__[ext_key]
+                    value_ext_field = element.ext_field
 
             if value_ext is None and val is None:
                 continue
@@ -740,16 +757,14 @@ class Node:
     def from_fhir_obj(cls, model: "FHIRAbstractModel"):
         """ """
         resource_node = cls(model.resource_type, namespaces=[Namespace(None, ROOT_NS)])
-        alias_maps = model.__class__.get_alias_mapping()
-        for prop_name in model.__class__.elements_sequence():
-            field = model.__class__.__fields__[alias_maps[prop_name]]
-            value = model.__dict__.get(field.name, None)
+        for element in model.__class__.get_serialization_plan():
+            field = element.field
+            value = model.__dict__.get(element.name, None)
             value_ext, value_ext_field = None, None
-            if is_primitive_type(field):
-                ext_key = f"{field.name}__ext"
-                value_ext = model.__dict__.get(ext_key, None)
+            if element.ext_name is not None:
+                value_ext = model.__dict__.get(element.ext_name, None)
                 if value_ext:
-                    value_ext_field = model.__class__.__fields__[ext_key]
+                    value_ext_field = element.ext_field
 
             if value_ext is None and value is None:
                 continue
@@ -852,8 +867,8 @@ class Node:
 
         if xmlparser is None:
             assert xsd_file and xsd_file.exists() and xsd_file.is_file()
-            schema = etree.XMLSchema(file=str(xsd_file))
-            xmlparser = etree.XMLParser(schema=schema)
+            # compiled once, see ``xsd.SchemaRegistry``
+            xmlparser = SCHEMA_REGISTRY.get_parser_by_file(xsd_file)
 
         try:
             etree.fromstring(element_str, parser=xmlparser)
@@ -1015,6 +1030,503 @@ class Node:
         return self.to_string(pretty_print=False)
 
 
+# kinds of (non primitive) field value, see ``make_xml_field``
+XML_KIND_UNSUPPORTED = 0
+XML_KIND_MODEL = 1
+XML_KIND_RESOURCE = 2
+XML_KIND_PRIMITIVE_EXTENSION = 3
+# kinds of primitive field value, see ``get_xml_decode_fields``
+XML_KIND_VALUE = 4
+XML_KIND_XHTML = 5
+
+
+class XMLField(typing.NamedTuple):
+    """Compiled (per field) information for ``write_fhir_element``."""
+
+    alias: str
+    is_primitive: bool
+    # primitive value -> xml ``value`` attribute
+    to_string: typing.Optional[typing.Callable[[typing.Any], str]]
+    kind: int
+    # ``id`` and ``url`` are written as attributes
+    is_extension: bool
+
+
+class XMLElementPlan(typing.NamedTuple):
+    """ """
+
+    name: str
+    alias: str
+    ext_name: typing.Optional[str]
+    xml_field: XMLField
+    ext_xml_field: typing.Optional[XMLField]
+    is_xhtml: bool
+
+
+def bool_to_string(value: bool) -> str:
+    """ """
+    return value is True and "true" or "false"
+
+
+def make_xml_field(field: "ModelField", properties: FieldProperties) -> XMLField:
+    """Same decisions as ``Node.add_fhir_element``, made once per field."""
+    field_type = field.type_
+    if properties.is_primitive:
+        if field_type is bool:
+            to_string = bool_to_string
+        else:
+            to_string = getattr(field_type, "to_string", None)
+            if to_string is None:
+                to_string = properties.type_class.to_string
+        return XMLField(field.alias, True, to_string, XML_KIND_UNSUPPORTED, False)
+
+    if getattr(field_type, "__resource_type__", None) is None:
+        type_str = str(field_type)
+        if (
+            type_str.startswith(("typing.Union[", "typing.Optional["))
+            and "fhirtypes.FHIRPrimitiveExtensionType" in type_str
+        ):
+            for cls in field_type.__args__:
+                if cls.__name__ == "FHIRPrimitiveExtensionType":
+                    field_type = cls
+        else:
+            return XMLField(field.alias, False, None, XML_KIND_UNSUPPORTED, False)
+
+    type_name = get_fhir_type_name(field_type)
+    if type_name == "Resource":
+        kind = XML_KIND_RESOURCE
+    elif type_name == "FHIRPrimitiveExtension":
+        kind = XML_KIND_PRIMITIVE_EXTENSION
+    else:
+        kind = XML_KIND_MODEL
+    return XMLField(
+        field.alias, False, None, kind, field_type.fhir_type_name() == "Extension"
+    )
+
+
+@lru_cache(maxsize=None, typed=True)
+def get_xml_fields(
+    klass: typing.Type["FHIRAbstractModel"],
+) -> typing.Dict[str, XMLField]:
+    """Field name -> ``XMLField``, computed once per model class."""
+    properties = get_field_properties(klass)
+    return {
+        name: make_xml_field(field, properties[name])
+        for name, field in klass.__fields__.items()
+    }
+
+
+@lru_cache(maxsize=None, typed=True)
+def get_xml_plan(
+    klass: typing.Type["FHIRAbstractModel"],
+) -> typing.Tuple[XMLElementPlan, ...]:
+    """ """
+    properties = get_field_properties(klass)
+    xml_fields = get_xml_fields(klass)
+    return tuple(
+        XMLElementPlan(
+            element.name,
+            element.alias,
+            element.ext_name,
+            xml_fields[element.name],
+            element.ext_name is not None and xml_fields[element.ext_name] or None,
+            properties[element.name].type_name == "xhtml",
+        )
+        for element in klass.get_serialization_plan()
+    )
+
+
+def write_comments(
+    parent: etree._Element, comments: typing.Union[str, typing.List[str], None]
+):
+    """ """
+    if comments:
+        if isinstance(comments, str):
+            comments = [comments]
+        for comment in comments:
+            parent.append(etree.Comment(comment))
+
+
+def write_fhir_element(
+    parent: etree._Element,
+    xml_field: XMLField,
+    value: typing.Any,
+    ext: typing.Any = None,
+    ext_xml_field: XMLField = None,
+):
+    """Writes ``value`` of ``field`` as child(ren) of ``parent``, without
+    intermediate ``Node``. Mirrors ``Node.add_fhir_element`` + ``Node.to_xml``
+    exactly (element creation and append order), output is identical."""
+    if isinstance(value, RawResource):
+        value = value.resolve()
+    if xml_field.is_primitive:
+        if isinstance(value, (list, tuple)):
+            if ext and not isinstance(ext, (list, tuple)):
+                ext = [ext]
+            if ext is None:
+                ext = []
+            if len(value) < len(ext):
+                LOG.warning(f"Some {(len(ext) - len(value))} extension(s) are ignored.")
+            for idx, val in enumerate(value):
+                try:
+                    ext_ = ext[idx]
+                except IndexError:
+                    ext_ = None
+                if ext_ is None and val is None:
+                    continue
+                write_fhir_element(
+                    parent, xml_field, val, ext=ext_, ext_xml_field=ext_xml_field
+                )
+            return
+
+        if value is not None:
+            represent = xml_field.to_string(value)  # type: ignore
+            if represent:
+                child = parent.makeelement(xml_field.alias, value=represent)
+            else:
+                child = parent.makeelement(xml_field.alias)
+            if ext is not None:
+                write_comments(parent, ext.__dict__.get("fhir_comments", None))
+                write_fhir_element(child, ext_xml_field, ext)
+        else:
+            child = parent.makeelement(xml_field.alias)
+            if ext is not None:
+                exts = not isinstance(ext, (list, tuple)) and [ext] or ext
+                for ext_ in exts:
+                    if ext_ is None:
+                        continue
+                    write_comments(parent, ext_.__dict__.get("fhir_comments", None))
+                    write_fhir_element(child, ext_xml_field, ext_)
+        parent.append(child)
+        return
+
+    if isinstance(value, (list, tuple)):
+        for value_ in value:
+            write_fhir_element(
+                parent, xml_field, value_, ext=ext, ext_xml_field=ext_xml_field
+            )
+        return
+
+    kind = xml_field.kind
+    if kind == XML_KIND_UNSUPPORTED:
+        raise NotImplementedError
+    if kind == XML_KIND_PRIMITIVE_EXTENSION:
+        extensions = value.__dict__.get("extension", None)
+        if extensions:
+            write_fhir_element(
+                parent,
+                get_xml_fields(value.__class__)["extension"],
+                extensions,
+                ext=ext,
+                ext_xml_field=ext_xml_field,
+            )
+        return
+
+    child = parent.makeelement(xml_field.alias)
+    wrapper = None
+    if kind == XML_KIND_RESOURCE:
+        wrapper = child
+        child = wrapper.makeelement(value.resource_type)
+        wrapper.append(child)
+
+    write_comments(parent, value.__dict__.get("fhir_comments", None))
+
+    storage = value.__dict__
+    is_extension = xml_field.is_extension
+    for element in get_xml_plan(value.__class__):
+        val = storage.get(element.name)
+        if is_extension and val and element.alias in ("url", "id"):
+            child.set(element.alias, val)
+            continue
+        if element.is_xhtml and val:
+            # xxx: fhir-xhtml.xsd validation
+            xhtml_element = etree.fromstring(val)
+            if xhtml_element.nsmap[None] != XHTML_NS:
+                raise ValueError
+            child.append(xhtml_element)
+            continue
+
+        value_ext, value_ext_field = None, None
+        if element.ext_name is not None:
+            value_ext = storage.get(element.ext_name, None)
+            if value_ext:
+                value_ext_field = element.ext_xml_field
+
+        if value_ext is None and val is None:
+            continue
+
+        write_fhir_element(
+            child, element.xml_field, val, ext=value_ext, ext_xml_field=value_ext_field
+        )
+
+    parent.append(child if wrapper is None else wrapper)
+
+
+def model_to_xml(model: "FHIRAbstractModel") -> etree._Element:
+    """lxml element tree of (root) ``model``, same as
+    ``Node.from_fhir_obj(model).to_xml()`` but in a single pass."""
+    root = etree.Element(model.resource_type, nsmap={None: ROOT_NS})
+    storage = model.__dict__
+    for element in get_xml_plan(model.__class__):
+        value = storage.get(element.name, None)
+        value_ext, value_ext_field = None, None
+        if element.ext_name is not None:
+            value_ext = storage.get(element.ext_name, None)
+            if value_ext:
+                value_ext_field = element.ext_xml_field
+
+        if value_ext is None and value is None:
+            continue
+
+        write_fhir_element(
+            root,
+            element.xml_field,
+            value,
+            ext=value_ext,
+            ext_xml_field=value_ext_field,
+        )
+    return root
+
+
+def xml_to_bool(value: str) -> typing.Any:
+    """ """
+    if value == "true":
+        return True
+    if value == "false":
+        return False
+    # validator reports it
+    return value
+
+
+def xml_to_int(value: str) -> typing.Any:
+    """ """
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+
+def xml_to_decimal(value: str) -> typing.Any:
+    """ """
+    try:
+        return decimal.Decimal(value)
+    except decimal.InvalidOperation:
+        return value
+
+
+# xml ``value`` attribute -> json value, by FHIR primitive type
+XML_VALUE_CONVERTERS: typing.Dict[str, typing.Callable[[str], typing.Any]] = {
+    "integer": xml_to_int,
+    "positiveInt": xml_to_int,
+    "unsignedInt": xml_to_int,
+    "decimal": xml_to_decimal,
+}
+
+
+class XMLDecodeField(typing.NamedTuple):
+    """Compiled (per field) information for ``xml_element_to_dict``."""
+
+    alias: str
+    is_list: bool
+    # XML_KIND_VALUE, XML_KIND_XHTML, XML_KIND_MODEL or XML_KIND_RESOURCE
+    kind: int
+    # nested element class of XML_KIND_MODEL
+    model_class: typing.Optional[typing.Type["FHIRAbstractModel"]]
+    to_value: typing.Optional[typing.Callable[[str], typing.Any]]
+
+
+@lru_cache(maxsize=None, typed=True)
+def get_xml_decode_fields(
+    klass: typing.Type["FHIRAbstractModel"],
+) -> typing.Dict[str, XMLDecodeField]:
+    """Fields by xml tag (json key), ``__ext`` (``_field``) fields and
+    ``fhir_comments`` are not elements of xml."""
+    trusted_fields = get_trusted_fields(klass)
+    fields: typing.Dict[str, XMLDecodeField] = dict()
+    for name, field in klass.__fields__.items():
+        if name in ("resource_type", "fhir_comments") or field.alias[0] == "_":
+            continue
+        trusted_field = trusted_fields[name]
+        type_ = trusted_field.type_
+        model_class, to_value = None, None
+        if trusted_field.kind == KIND_VALUE:
+            kind = XML_KIND_VALUE
+            if type_ is bool:
+                to_value = xml_to_bool
+            elif hasattr(type_, "fhir_type_name"):
+                if type_.fhir_type_name() == "xhtml":
+                    kind = XML_KIND_XHTML
+                to_value = XML_VALUE_CONVERTERS.get(type_.fhir_type_name(), None)
+        elif type_.__resource_type__ == "Resource":
+            kind = XML_KIND_RESOURCE
+        else:
+            kind = XML_KIND_MODEL
+            model_class = get_model_class(
+                type_.__fhir_release__, type_.__resource_type__
+            )
+        fields[field.alias] = XMLDecodeField(
+            field.alias, trusted_field.is_list, kind, model_class, to_value
+        )
+    return fields
+
+
+def xml_local_name(tag: str) -> str:
+    """``{namespace}name`` -> ``name``"""
+    if tag[0] == "{":
+        return tag[tag.index("}") + 1 :]
+    return tag
+
+
+def xml_comments_value(
+    comments: typing.List[str],
+) -> typing.Union[str, typing.List[str]]:
+    """Single comment is str (same as ``Node.to_fhir``)."""
+    return comments[0] if len(comments) == 1 else comments
+
+
+def xml_primitive_ext_to_dict(
+    fhir_release: str,
+    element: etree._Element,
+    comments: typing.Optional[typing.List[str]],
+) -> typing.Optional[typing.Dict[str, typing.Any]]:
+    """json ``_field`` object of primitive ``element``, None if element has
+    neither id, extension nor (preceding) comments."""
+    data: typing.Dict[str, typing.Any] = dict()
+    if comments:
+        data["fhir_comments"] = xml_comments_value(comments)
+    id_ = element.get("id")
+    if id_ is not None:
+        data["id"] = id_
+    if len(element) > 0:
+        extension_class = get_model_class(fhir_release, "Extension")
+        extensions = list()
+        extension_comments: typing.Optional[typing.List[str]] = None
+        for child in element:
+            if child.tag.__class__ is not str:
+                if isinstance(child, etree._Comment):
+                    if extension_comments is None:
+                        extension_comments = list()
+                    extension_comments.append(child.text)
+                continue
+            if xml_local_name(child.tag) != "extension":
+                raise ValueError(
+                    f"Primitive element '{xml_local_name(element.tag)}' could "
+                    f"have only extensions, but '{xml_local_name(child.tag)}' found."
+                )
+            extensions.append(
+                xml_element_to_dict(extension_class, child, extension_comments)
+            )
+            extension_comments = None
+        if extensions:
+            data["extension"] = extensions
+    return data or None
+
+
+def xml_element_to_dict(
+    klass: typing.Type["FHIRAbstractModel"],
+    element: etree._Element,
+    comments: typing.List[str] = None,
+) -> typing.Dict[str, typing.Any]:
+    """JSON equivalent (``parse_obj`` and ``construct_tree`` input) of xml
+    ``element`` of ``klass``, built in a single pass over the element tree
+    with ``get_xml_decode_fields``: primitive ``value`` attribute is the json
+    value, its id/extensions/comments are ``_field`` object (lists of primitive
+    are aligned with ``_field`` list, None for gaps), contained resources carry
+    ``resourceType``. ``comments`` are preceding comments of the element."""
+    fields = get_xml_decode_fields(klass)
+    data: typing.Dict[str, typing.Any] = dict()
+    if xml_local_name(element.tag) == klass.get_resource_type():
+        data["resourceType"] = klass.get_resource_type()
+    if comments:
+        data["fhir_comments"] = xml_comments_value(comments)
+    # Extension.url, Element.id
+    for name, value in element.attrib.items():
+        field = fields.get(name, None)
+        if field is not None and field.kind == XML_KIND_VALUE:
+            data[name] = value
+
+    fhir_release = None
+    primitive_lists: typing.Optional[typing.Set[str]] = None
+    child_comments: typing.Optional[typing.List[str]] = None
+    for child in element:
+        if child.tag.__class__ is not str:
+            # comment or processing instruction
+            if isinstance(child, etree._Comment):
+                if child_comments is None:
+                    child_comments = list()
+                child_comments.append(child.text)
+            continue
+        name = xml_local_name(child.tag)
+        try:
+            field = fields[name]
+        except KeyError:
+            raise ValueError(
+                f"'{name}' is not a valid element of ``{klass.__name__}``."
+            )
+        kind = field.kind
+        if kind == XML_KIND_VALUE:
+            value = child.get("value")
+            if value is not None and field.to_value is not None:
+                value = field.to_value(value)
+            ext = None
+            if len(child) > 0 or child_comments or "id" in child.attrib:
+                if fhir_release is None:
+                    fhir_release = get_fhir_release(klass)
+                ext = xml_primitive_ext_to_dict(fhir_release, child, child_comments)
+            if field.is_list:
+                values = data.setdefault(name, list())
+                values.append(value)
+                if ext is not None:
+                    exts = data.setdefault(f"_{name}", list())
+                    exts.extend([None] * (len(values) - len(exts) - 1))
+                    exts.append(ext)
+                    if primitive_lists is None:
+                        primitive_lists = set()
+                    primitive_lists.add(name)
+            else:
+                if value is not None:
+                    data[name] = value
+                if ext is not None:
+                    data[f"_{name}"] = ext
+            child_comments = None
+            continue
+
+        if kind == XML_KIND_XHTML:
+            # whitespace after ``</div>`` (formatting) is not part of the value
+            value = etree.tostring(child, encoding="unicode", with_tail=False)
+        elif kind == XML_KIND_RESOURCE:
+            # <contained><Patient>...</Patient></contained>
+            resource_comments = child_comments or list()
+            value = None
+            for resource in child:
+                if resource.tag.__class__ is not str:
+                    if isinstance(resource, etree._Comment):
+                        resource_comments.append(resource.text)
+                    continue
+                if fhir_release is None:
+                    fhir_release = get_fhir_release(klass)
+                value = xml_element_to_dict(
+                    get_model_class(fhir_release, xml_local_name(resource.tag)),
+                    resource,
+                    resource_comments,
+                )
+                break
+        else:
+            value = xml_element_to_dict(field.model_class, child, child_comments)
+        child_comments = None
+
+        if field.is_list:
+            data.setdefault(name, list()).append(value)
+        else:
+            data[name] = value
+
+    if primitive_lists is not None:
+        for name in primitive_lists:
+            exts = data[f"_{name}"]
+            exts.extend([None] * (len(data[name]) - len(exts)))
+    return data
+
+
 def xml_dumps(
     model: "FHIRAbstractModel",
     *,
@@ -1024,22 +1536,174 @@ def xml_dumps(
     strip_text=False,
 ):
     """ """
-    node = Node.from_fhir_obj(model)
-    return node.to_string(
-        pretty_print=pretty_print,
-        xml_declaration=xml_declaration,
-        with_comments=with_comments,
-        strip_text=strip_text,
-    )
+    params = {"encoding": "utf-8", "method": "xml", "pretty_print": pretty_print}
+    if xml_declaration:
+        params["xml_declaration"] = '<?xml version="1.0" encoding="UTF-8"?>'
+    params["with_comments"] = with_comments
+    params["strip_text"] = strip_text
+    return etree.tostring(model_to_xml(model), **params)
+
+
+def xml_loads_data(
+    cls: typing.Type["FHIRAbstractModel"],
+    b: bytes,
+    xmlparser: etree.XMLParser = None,
+    validate_schema: bool = False,
+    stream_bundle: bool = True,
+) -> typing.Union[typing.Dict[str, typing.Any], "FHIRAbstractModel"]:
+    """``parse_obj`` input of xml document, the JSON equivalent dict (see
+    ``xml_element_to_dict``), so the whole tree is validated once. Bundle
+    document is parsed incrementally into model (see ``xml_load_bundle``),
+    unless custom ``xmlparser`` is provided or ``stream_bundle`` is False.
+    ``validate_schema`` validates document against XSD of the resource type,
+    from ``xsd.SCHEMA_REGISTRY``, it cannot be combined with ``xmlparser``
+    (give the parser with own schema instead)."""
+    if validate_schema and xmlparser is not None:
+        raise ValueError(
+            "'validate_schema' is not supported with custom 'xmlparser', "
+            "use 'etree.XMLParser(schema=...)' instead."
+        )
+    resource_type = cls.get_resource_type()
+    stream_bundle = stream_bundle and xmlparser is None and resource_type == "Bundle"
+    if validate_schema:
+        fhir_release = get_fhir_release(cls)
+        try:
+            if stream_bundle:
+                schema = SCHEMA_REGISTRY.get_schema(fhir_release, resource_type)
+                return xml_load_bundle(cls, b, schema=schema)
+            root = etree.fromstring(
+                b, parser=SCHEMA_REGISTRY.get_parser(fhir_release, resource_type)
+            )
+        except etree.XMLSyntaxError as exc:
+            raise ValueError(f"XML schema validation error: {exc}")
+    elif stream_bundle:
+        return xml_load_bundle(cls, b)
+    else:
+        root = etree.fromstring(b, parser=xmlparser)
+
+    if xml_local_name(root.tag) != resource_type:
+        raise ValueError(
+            f"Expected resourceType is '{resource_type}', "
+            f"but document has resourceType '{xml_local_name(root.tag)}'"
+        )
+    return xml_element_to_dict(cls, root)
 
 
 def xml_loads(
-    cls: typing.Type["FHIRAbstractModel"], b: bytes, xmlparser: etree.XMLParser = None
+    cls: typing.Type["FHIRAbstractModel"],
+    b: bytes,
+    xmlparser: etree.XMLParser = None,
+    validate_schema: bool = False,
+    validate: bool = True,
 ) -> "FHIRAbstractModel":
-    """ """
-    root = etree.fromstring(b, parser=xmlparser)
-    node = Node.from_element(root)
-    return node.to_fhir(cls)
+    """Model from ``xml_loads_data``. ``validate=False`` takes the trusted
+    construction path (``construct_tree``), no validator is executed."""
+    data = xml_loads_data(
+        cls, b, xmlparser, validate_schema=validate_schema, stream_bundle=validate
+    )
+    if not isinstance(data, dict):
+        return data
+    if validate:
+        return cls.parse_obj(data)
+    return cls.construct_tree(data)
 
 
-__all__ = ["xml_dumps", "xml_loads"]
+def parse_model(
+    klass: typing.Type["FHIRAbstractModel"], data: typing.Dict[str, typing.Any]
+) -> "FHIRAbstractModel":
+    """ """
+    return klass.parse_obj(data)
+
+
+def xml_iter_bundle_entries(
+    bundle_class: typing.Type["FHIRAbstractModel"],
+    entry_class: typing.Type["FHIRAbstractModel"],
+    stream: typing.IO,
+    schema: etree.XMLSchema = None,
+    make_model: typing.Callable[
+        [typing.Type["FHIRAbstractModel"], typing.Dict[str, typing.Any]],
+        "FHIRAbstractModel",
+    ] = None,
+) -> typing.Generator["FHIRAbstractModel", None, "FHIRAbstractModel"]:
+    """Incrementally parse Bundle, each (direct) ``entry`` element is converted
+    into ``entry_class`` and removed from tree as soon as its end tag is reached.
+    Generator returns the Bundle (envelope only) at the end. Document is
+    validated against ``schema`` while parsing. Models are made from decoded
+    dict by ``make_model(klass, data)``, ``klass.parse_obj`` by default."""
+    if make_model is None:
+        make_model = parse_model
+    context = etree.iterparse(
+        stream, events=("end",), tag=f"{{{ROOT_NS}}}entry", schema=schema
+    )
+    for _, element in context:
+        if schema is not None:
+            # validation errors are raised after events of the whole chunk
+            # are delivered, entries must not be converted from invalid document.
+            errors = context.error_log.filter_from_errors()
+            if errors:
+                raise ValueError(f"XML schema validation error: {errors[0].message}")
+        parent = element.getparent()
+        if parent is None or parent.getparent() is not None:
+            # nested entry (i.e. ``List.entry``, ``entry`` of contained Bundle)
+            continue
+        comments = list()
+        for sibling in element.itersiblings(preceding=True):
+            if not isinstance(sibling, etree._Comment):
+                break
+            comments.insert(0, sibling.text)
+            parent.remove(sibling)
+        # conversion must happen before detaching, xhtml children are
+        # serialized with namespaces from ancestors.
+        entry = make_model(
+            entry_class, xml_element_to_dict(entry_class, element, comments)
+        )
+        parent.remove(element)
+        yield entry
+
+    root = context.root
+    if xml_local_name(root.tag) != bundle_class.get_resource_type():
+        raise ValueError(
+            f"Expected resourceType is '{bundle_class.get_resource_type()}', "
+            f"but document has resourceType '{xml_local_name(root.tag)}'"
+        )
+    return make_model(bundle_class, xml_element_to_dict(bundle_class, root))
+
+
+def xml_load_bundle(
+    bundle_class: typing.Type["FHIRAbstractModel"],
+    source: typing.Union[StrBytes, typing.IO],
+    schema: etree.XMLSchema = None,
+) -> "FHIRAbstractModel":
+    """Whole Bundle from ``xml_iter_bundle_entries``, each entry is converted
+    as soon as its end tag is reached and removed from tree, so neither full
+    element tree nor full ``Node`` tree of the document is kept in memory.
+    Entries (resources included) are validated eagerly as ``entry`` field type,
+    ``LazyBundle`` decodes the whole document instead (``stream_bundle=False``).
+    Validated entries are attached to validated envelope as they are."""
+    if isinstance(source, str):
+        source = source.encode("utf-8")
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+    entry_class = get_fhir_model_class(bundle_class.__fields__["entry"], False)
+    entries = list()
+    iterator = xml_iter_bundle_entries(bundle_class, entry_class, source, schema)
+    while True:
+        try:
+            entries.append(next(iterator))
+        except StopIteration as exc:
+            envelope = exc.value
+            break
+    if entries:
+        envelope.__dict__["entry"] = entries
+        envelope.__fields_set__.add("entry")
+    return envelope
+
+
+__all__ = [
+    "xml_dumps",
+    "xml_element_to_dict",
+    "xml_loads",
+    "xml_loads_data",
+    "xml_load_bundle",
+    "xml_iter_bundle_entries",
+]
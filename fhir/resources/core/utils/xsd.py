@@ -0,0 +1,123 @@
+# _*_ coding: utf-8 _*_
+"""Process wide registry of compiled XML schemas (XSD). Compiling FHIR schema
+takes ~100 ms, so each schema file is compiled once (lazily, on first use) and
+shared. ``lxml`` parsers are not thread safe, a parser (bound to the shared
+schema) is kept per thread.
+
+Schema files are not shipped with ``fhir.resources``, download them from
+https://hl7.org/fhir/downloads.html (XML Schema) and register the directory,
+i.e. ``register_xsd_directory("/path/to/fhir-all-xsd", "R4")``. Schema of a
+resource type is ``<resource type in lower case>.xsd`` inside the directory."""
+
+import pathlib
+import threading
+import typing
+
+from lxml import etree  # type: ignore
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+PathType = typing.Union[str, pathlib.Path]
+
+
+class SchemaRegistry:
+    """Compiled schemas by xsd file, schema file by (FHIR release, resource type)."""
+
+    def __init__(self):
+        """ """
+        # fhir release -> directory of xsd files
+        self.directories: typing.Dict[str, pathlib.Path] = dict()
+        # xsd file (resolved path) -> compiled schema
+        self.schemas: typing.Dict[str, etree.XMLSchema] = dict()
+        self.lock = threading.Lock()
+        self.local = threading.local()
+
+    def register_directory(self, fhir_release: str, directory: PathType):
+        """ """
+        directory = pathlib.Path(directory)
+        if not directory.is_dir():
+            raise ValueError(f"XSD directory '{directory}' doesn't exist.")
+        self.directories[fhir_release] = directory.resolve()
+
+    def get_xsd_file(self, fhir_release: str, resource_type: str) -> pathlib.Path:
+        """ """
+        try:
+            directory = self.directories[fhir_release]
+        except KeyError:
+            raise LookupError(
+                f"No XSD directory is registered for FHIR release '{fhir_release}', "
+                "see ``fhir.resources.core.utils.xsd.register_xsd_directory``."
+            )
+        xsd_file = directory / f"{resource_type.lower()}.xsd"
+        if not xsd_file.is_file():
+            raise LookupError(
+                f"XSD file of '{resource_type}' ({fhir_release}) is not found "
+                f"in '{directory}'."
+            )
+        return xsd_file
+
+    def get_schema_by_file(self, xsd_file: PathType) -> etree.XMLSchema:
+        """Compiled schema, shared between threads."""
+        key = str(pathlib.Path(xsd_file).resolve())
+        try:
+            return self.schemas[key]
+        except KeyError:
+            pass
+        with self.lock:
+            # might be compiled by another thread meanwhile
+            if key not in self.schemas:
+                self.schemas[key] = etree.XMLSchema(file=key)
+            return self.schemas[key]
+
+    def get_parser_by_file(self, xsd_file: PathType) -> etree.XMLParser:
+        """Schema validating parser of the current thread."""
+        parsers = getattr(self.local, "parsers", None)
+        if parsers is None:
+            parsers = self.local.parsers = dict()
+        key = str(pathlib.Path(xsd_file).resolve())
+        try:
+            return parsers[key]
+        except KeyError:
+            parser = etree.XMLParser(schema=self.get_schema_by_file(key))
+            return parsers.setdefault(key, parser)
+
+    def get_schema(self, fhir_release: str, resource_type: str) -> etree.XMLSchema:
+        """ """
+        return self.get_schema_by_file(self.get_xsd_file(fhir_release, resource_type))
+
+    def get_parser(self, fhir_release: str, resource_type: str) -> etree.XMLParser:
+        """ """
+        return self.get_parser_by_file(self.get_xsd_file(fhir_release, resource_type))
+
+    def clear(self):
+        """Drops compiled schemas and cached parsers of all threads."""
+        with self.lock:
+            self.schemas.clear()
+        self.local = threading.local()
+
+
+SCHEMA_REGISTRY = SchemaRegistry()
+
+
+def register_xsd_directory(directory: PathType, fhir_release: str = "R4"):
+    """ """
+    SCHEMA_REGISTRY.register_directory(fhir_release, directory)
+
+
+def get_schema(fhir_release: str, resource_type: str) -> etree.XMLSchema:
+    """ """
+    return SCHEMA_REGISTRY.get_schema(fhir_release, resource_type)
+
+
+def get_parser(fhir_release: str, resource_type: str) -> etree.XMLParser:
+    """ """
+    return SCHEMA_REGISTRY.get_parser(fhir_release, resource_type)
+
+
+__all__ = [
+    "SCHEMA_REGISTRY",
+    "SchemaRegistry",
+    "get_parser",
+    "get_schema",
+    "register_xsd_directory",
+]
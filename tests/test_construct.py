@@ -0,0 +1,65 @@
+# _*_ coding: utf-8 _*_
+import decimal
+
+import pytest
+
+from fhir.resources import construct_fhir_element
+from fhir.resources.bundle import Bundle
+from fhir.resources.explanationofbenefit import ExplanationOfBenefit
+from fhir.resources.humanname import HumanName
+from fhir.resources.patient import Patient
+
+from .fixtures import STATIC_PATH
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+def test_construct_tree_patient():
+    """ """
+    data = Patient.__config__.json_loads(
+        (STATIC_PATH / "Patient-with-ext.json").read_bytes()
+    )
+    patient = Patient.construct_tree(data)
+    assert isinstance(patient.name[0], HumanName)
+    # contained resource is resolved from ``resourceType``
+    assert patient.contained[0].resource_type == data["contained"][0]["resourceType"]
+
+    validated = Patient.parse_obj(data)
+    assert patient.json() == validated.json()
+    assert patient.xml() == validated.xml()
+
+
+def test_construct_fhir_element_without_validation():
+    """ """
+    path = STATIC_PATH / "ExplanationOfBenefit.json"
+    eob = construct_fhir_element("ExplanationOfBenefit", path, validate=False)
+    assert isinstance(eob, ExplanationOfBenefit)
+    assert isinstance(eob.payment.amount.value, decimal.Decimal)
+    assert eob.json() == construct_fhir_element("ExplanationOfBenefit", path).json()
+
+    bundle_data = {
+        "resourceType": "Bundle",
+        "type": "collection",
+        "entry": [{"resource": eob.dict()}],
+    }
+    bundle = construct_fhir_element("Bundle", bundle_data, validate=False)
+    assert isinstance(bundle, Bundle)
+    assert isinstance(bundle.entry[0].resource, ExplanationOfBenefit)
+    # no validator is executed, so invalid value is simply accepted
+    assert Bundle.construct_tree({"type": "wrong"}).type == "wrong"
+
+    with pytest.raises(ValueError):
+        Bundle.construct_tree({"type": "collection", "unknown": True})
+
+
+def test_construct_tree_stu3():
+    """ """
+    from fhir.resources.STU3 import construct_fhir_element as stu3_construct
+
+    patient = stu3_construct(
+        "Patient",
+        '{"resourceType": "Patient", "name": [{"family": "Doe"}]}',
+        validate=False,
+    )
+    assert patient.name[0].__class__.__module__ == "fhir.resources.STU3.humanname"
+    assert patient.name[0].family == "Doe"
@@ -0,0 +1,352 @@
+# _*_ coding: utf-8 _*_
+import datetime
+
+import pytest
+from pydantic import ValidationError
+
+from fhir.resources.observation import Observation
+from fhir.resources.patient import Patient
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+def test_serialization_plan():
+    """ """
+    plan = Patient.get_serialization_plan()
+    assert isinstance(plan, tuple)
+    # built once
+    assert plan is Patient.get_serialization_plan()
+    assert [element.alias for element in plan] == Patient.elements_sequence()
+
+    elements = {element.alias: element for element in plan}
+    assert elements["birthDate"].is_primitive is True
+    assert elements["birthDate"].ext_name == "birthDate__ext"
+    assert elements["birthDate"].ext_alias == "_birthDate"
+    assert elements["birthDate"].is_list is False
+    # Resource.id doesn't have any extension
+    assert elements["id"].ext_name is None
+    assert elements["name"].is_primitive is False
+    assert elements["name"].is_list is True
+    assert elements["name"].field is Patient.__fields__["name"]
+
+
+def test_batch_update(monkeypatch):
+    """ """
+    observation = Observation(status="preliminary", code={"text": "Glucose"})
+    calls = list()
+    validator = Observation.__pre_root_validators__[0]
+
+    def counting_validator(cls, values):
+        calls.append(cls)
+        return validator(cls, values)
+
+    monkeypatch.setattr(
+        Observation,
+        "__pre_root_validators__",
+        [counting_validator] + Observation.__pre_root_validators__[1:],
+    )
+    with observation.batch_update() as obs:
+        obs.status = "final"
+        obs.issued = "2022-05-11T10:00:00Z"
+        obs.valueQuantity = {"value": 6.3, "unit": "mmol/l"}
+        # not validated yet
+        assert obs.issued == "2022-05-11T10:00:00Z"
+        with obs.batch_update():
+            obs.language = "en"
+    assert len(calls) == 1
+    assert observation.status == "final"
+    assert isinstance(observation.issued, datetime.datetime)
+    assert observation.valueQuantity.unit == "mmol/l"
+    assert observation.language == "en"
+    assert {"issued", "valueQuantity"} <= observation.__fields_set__
+
+    # normal assignment keeps working as usual
+    observation.status = "amended"
+    assert len(calls) == 2
+
+
+def test_batch_update_errors():
+    """ """
+    observation = Observation(status="preliminary", code={"text": "Glucose"})
+    original = observation.json()
+    errors = list()
+    for name, value in (("status", ["wrong"]), ("issued", "wrong")):
+        with pytest.raises(ValidationError) as exc:
+            setattr(observation, name, value)
+        errors.extend(exc.value.errors())
+
+    with pytest.raises(ValidationError) as exc:
+        with observation.batch_update():
+            observation.status = ["wrong"]
+            observation.language = "en"
+            observation.issued = "wrong"
+    # all errors at once, same as normal assignments
+    assert exc.value.errors() == errors
+    # nothing is applied
+    assert observation.json() == original
+    assert observation.language is None
+
+    # unknown field is rejected immediately
+    with pytest.raises(ValueError):
+        with observation.batch_update():
+            observation.unknown = True
+    with pytest.raises(KeyError):
+        with observation.batch_update():
+            observation.language = "fr"
+            raise KeyError("any")
+    assert observation.language is None
+
+
+def test_compact_storage(monkeypatch, request):
+    """ """
+    import copy
+    import pickle
+
+    from fhir.resources.core.fhirabstractmodel import FHIRAbstractModel
+    from fhir.resources.core.utils import compact
+
+    from .fixtures import STATIC_PATH
+
+    raw = (STATIC_PATH / "Patient-with-ext.json").read_bytes()
+    full = Patient.parse_raw(raw)
+    # restored after test, ``__getattr__`` hook is removed even if test fails
+    monkeypatch.setattr(Patient, "__compact_storage__", False)
+    request.addfinalizer(lambda: Patient.configure_compact_storage(False))
+    Patient.configure_compact_storage()
+    assert Patient.__dict__["__getattr__"] is compact.get_missing_value
+    assert Patient.__compact_storage__ is True
+    assert FHIRAbstractModel.__compact_storage__ is False
+
+    patient = Patient.parse_raw(raw)
+    assert len(patient.__dict__) < len(full.__dict__)
+    assert None not in patient.__dict__.values()
+    # looks exactly like today
+    assert patient.language is None
+    assert patient.birthDate__ext is None
+    assert patient.gender__ext == full.gender__ext
+    assert patient == full
+    assert patient.json() == full.json()
+    assert patient.xml() == full.xml()
+    assert patient.dict(exclude_none=False) == full.dict(exclude_none=False)
+    assert list(patient) == list(full)
+    assert repr(patient) == repr(full)
+    assert pickle.loads(pickle.dumps(patient)) == full
+    assert copy.deepcopy(patient) == full
+    assert patient.copy(update={"active": False}).active is False
+    assert Patient.construct_tree(full.dict()).__dict__ == patient.__dict__
+    with pytest.raises(AttributeError):
+        patient.unknown
+
+    patient.language = "en"
+    assert patient.language == "en"
+    patient.language = None
+    assert patient.language is None
+    with patient.batch_update():
+        patient.active = True
+        patient.gender = "female"
+    assert patient.active is True
+    Patient.configure_compact_storage(False)
+    assert "__getattr__" not in Patient.__dict__
+    assert len(Patient.parse_raw(raw).__dict__) == len(full.__dict__)
+
+
+def test_frozen_model():
+    """ """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from .fixtures import STATIC_PATH
+
+    raw = (STATIC_PATH / "Observation.json").read_bytes()
+    mutable = Observation.parse_raw(raw)
+    with pytest.raises(TypeError):
+        hash(mutable)
+
+    observation = Observation.parse_raw(raw, frozen=True)
+    assert isinstance(observation.code.coding, tuple)
+    with pytest.raises(TypeError) as exc_info:
+        observation.status = "final"
+    assert "model.clone()" in str(exc_info.value)
+    with pytest.raises(TypeError):
+        observation.code.coding[0].code = "changed"
+    with pytest.raises(TypeError):
+        with observation.batch_update():
+            observation.status = "final"
+
+    # same output as mutable model, memoised.
+    assert observation.json() == mutable.json()
+    assert observation.json() is observation.json()
+    assert observation.xml() == mutable.xml()
+    assert observation.dict() == mutable.dict()
+    assert observation.json(indent=2) == mutable.json(indent=2)
+
+    other = Observation.parse_obj(mutable.dict()).freeze()
+    assert hash(other) == hash(observation)
+    assert other == observation
+    assert observation == mutable
+    assert len({observation, other}) == 1
+    mutable.status = "amended"
+    assert observation != mutable
+
+    with ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(lambda _: observation.json(), range(20)))
+    assert set(results) == {other.json()}
+
+    # copy is mutable
+    copied = observation.copy(deep=True)
+    copied.status = "amended"
+    copied.code.text = "changed"
+    assert observation.status == "final"
+    assert observation.code.text != "changed"
+    cloned = observation.clone()
+    cloned.code.coding.append(cloned.code.coding[0])
+    assert len(observation.code.coding) == len(cloned.code.coding) - 1
+
+
+def test_clone():
+    """ """
+    from .fixtures import STATIC_PATH
+
+    template = Observation.parse_file(STATIC_PATH / "Observation.json")
+    reading = template.clone()
+    assert reading == template
+    assert reading.json() == template.json()
+    assert reading.code is not template.code
+    assert reading.code.coding[0] is not template.code.coding[0]
+    # immutable leaves are shared
+    assert reading.id is template.id
+    assert reading.valueQuantity.value is template.valueQuantity.value
+
+    reading = template.clone(
+        update={
+            "status": "amended",
+            "valueQuantity.value": "7.20",
+            "code.coding.0.display": "changed",
+            "subject": {"reference": "Patient/1"},
+        }
+    )
+    assert reading.status == "amended"
+    assert str(reading.valueQuantity.value) == "7.20"
+    assert reading.code.coding[0].display == "changed"
+    assert reading.subject.reference == "Patient/1"
+    assert template.status == "final"
+    assert template.code.coding[0].display != "changed"
+    assert template.subject.reference != "Patient/1"
+
+    # nested elements are shared, except the updated path.
+    shallow = template.clone(deep=False, update={"code.text": "changed"})
+    assert shallow.subject is template.subject
+    assert shallow.code is not template.code
+    assert template.code.text != "changed"
+
+    with pytest.raises(ValidationError) as exc_info:
+        template.clone(update={"valueQuantity.value": "not a number"})
+    assert exc_info.value.errors()[0]["loc"] == ("value",)
+    with pytest.raises(ValidationError):
+        # choice of value[x]
+        template.clone(update={"valueString": "7.2"})
+    with pytest.raises(ValueError):
+        template.clone(update={"unknown": "value"})
+
+    # clone of frozen model is mutable
+    frozen = Observation.parse_file(STATIC_PATH / "Observation.json", frozen=True)
+    reading = frozen.clone()
+    reading.status = "amended"
+    reading.code.coding.append(reading.code.coding[0].clone())
+    assert len(reading.code.coding) == len(template.code.coding) + 1
+    # shallow clone shares (frozen) nested elements, except the updated path
+    shallow = frozen.clone(deep=False, update={"code.text": "changed"})
+    shallow.status = "amended"
+    shallow.code.text = "changed again"
+    with pytest.raises(TypeError):
+        shallow.subject.reference = "Patient/1"
+
+
+def test_binary_format():
+    """ """
+    from fhir.resources.bundle import Bundle
+    from fhir.resources.DSTU2.patient import Patient as PatientDSTU2
+    from fhir.resources.STU3.patient import Patient as PatientSTU3
+
+    from .fixtures import STATIC_PATH
+
+    for klass, fixture in (
+        (Patient, "Patient-with-ext.json"),
+        (Observation, "Observation.json"),
+    ):
+        model = klass.parse_file(STATIC_PATH / fixture)
+        data = model.to_bytes()
+        assert isinstance(data, bytes)
+        assert len(data) < len(model.json(return_bytes=True))
+        loaded = klass.from_bytes(data)
+        assert loaded == model
+        # fhir_comments, primitive extensions, decimals and dates.
+        assert loaded.json() == model.json()
+        assert loaded.xml() == model.xml()
+        assert loaded.dict(exclude_none=False) == model.dict(exclude_none=False)
+
+    patient = Patient.parse_file(STATIC_PATH / "Patient-with-ext.json")
+    assert patient.gender__ext is not None
+    bundle = Bundle.parse_obj(
+        {
+            "resourceType": "Bundle",
+            "type": "collection",
+            "entry": [{"resource": patient.dict()}],
+        }
+    )
+    loaded = Bundle.from_bytes(bundle.to_bytes())
+    assert isinstance(loaded.entry[0].resource, Patient)
+    assert loaded == bundle
+
+    for model in (
+        PatientSTU3.parse_obj({"resourceType": "Patient", "name": [{"family": "a"}]}),
+        PatientDSTU2.parse_obj(
+            {"resourceType": "Patient", "name": [{"family": ["a"]}], "active": True}
+        ),
+    ):
+        assert model.__class__.from_bytes(model.to_bytes()) == model
+
+    with pytest.raises(ValueError):
+        Observation.from_bytes(patient.to_bytes())
+    with pytest.raises(ValueError):
+        Patient.from_bytes(patient.json(return_bytes=True))
+
+
+def test_pickle():
+    """ """
+    import pickle
+
+    from fhir.resources.core.utils import frozen
+    from fhir.resources.DSTU2.patient import Patient as PatientDSTU2
+    from fhir.resources.STU3.patient import Patient as PatientSTU3
+
+    from .fixtures import STATIC_PATH
+
+    models = [
+        Patient.parse_file(STATIC_PATH / "Patient-with-ext.json"),
+        Observation.parse_file(STATIC_PATH / "Observation.json"),
+        PatientSTU3.parse_obj(
+            {"resourceType": "Patient", "name": [{"family": "a"}], "active": True}
+        ),
+        PatientDSTU2.parse_obj(
+            {"resourceType": "Patient", "name": [{"family": ["a"]}], "active": True}
+        ),
+    ]
+    for model in models:
+        reduced = model.__reduce__()
+        # sparse state, no ``None`` values
+        assert None not in reduced[1][1].values()
+        loaded = pickle.loads(pickle.dumps(model))
+        assert loaded.__class__ is model.__class__
+        assert loaded == model
+        assert loaded.__dict__ == model.__dict__
+        assert loaded.__fields_set__ == model.__fields_set__
+
+    # restored as is, without validators.
+    invalid = Patient.construct_tree({"gender": "invalid gender"})
+    assert pickle.loads(pickle.dumps(invalid)).gender == "invalid gender"
+
+    patient = Patient.parse_file(STATIC_PATH / "Patient-with-ext.json", frozen=True)
+    loaded = pickle.loads(pickle.dumps(patient))
+    assert frozen.is_frozen(loaded)
+    assert frozen.is_frozen(loaded.name[0])
+    assert hash(loaded) == hash(patient)
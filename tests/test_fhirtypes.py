@@ -0,0 +1,123 @@
+# _*_ coding: utf-8 _*_
+import pytest
+from pydantic import ValidationError
+
+from fhir.resources.bundle import Bundle
+from fhir.resources.organization import Organization
+from fhir.resources.patient import Patient
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+def test_polymorphic_json_str_decoded_once(monkeypatch):
+    """``ResourceType`` field value as json str is decoded only once,
+    the target model class gets dict."""
+
+    def parse_raw(*args, **kwargs):
+        raise AssertionError("json str must not be parsed again")
+
+    monkeypatch.setattr(Patient, "parse_raw", classmethod(parse_raw))
+    monkeypatch.setattr(Organization, "parse_raw", classmethod(parse_raw))
+
+    bundle = Bundle.parse_obj(
+        {
+            "type": "collection",
+            "entry": [
+                {"resource": '{"resourceType": "Patient", "id": "p1"}'},
+                {
+                    "resource": b'{"resourceType": "Patient", "id": "p2", '
+                    b'"contained": [{"resourceType": "Organization", "id": "o1"}]}'
+                },
+            ],
+        }
+    )
+    assert isinstance(bundle.entry[0].resource, Patient)
+    assert bundle.entry[1].resource.id == "p2"
+    assert isinstance(bundle.entry[1].resource.contained[0], Organization)
+
+    patient = Patient.parse_obj(
+        {"contained": ['{"resourceType": "Organization", "name": "ACME"}']}
+    )
+    assert patient.contained[0].name == "ACME"
+
+
+def test_polymorphic_json_str_errors():
+    """ """
+    with pytest.raises(ValidationError):
+        Patient.parse_obj({"contained": ['{"resourceType": "Organization", ']})
+
+    with pytest.raises(LookupError):
+        Patient.parse_obj({"contained": ['{"resourceType": "Unknown"}']})
+
+    with pytest.raises(ValidationError) as exc:
+        Patient.parse_obj(
+            {"contained": ['{"resourceType": "Organization", "active": "wrong"}']}
+        )
+    assert exc.value.errors()[0]["loc"] == ("contained", 0, "active")
+
+
+def test_fhir_type_validators_prepared_once(monkeypatch):
+    """ """
+    from fhir.resources import fhirtypesvalidators
+
+    calls = list()
+    make_generic_validator = fhirtypesvalidators.make_generic_validator
+
+    def counting_make_generic_validator(validator):
+        calls.append(validator)
+        return make_generic_validator(validator)
+
+    monkeypatch.setattr(fhirtypesvalidators, "FHIR_TYPE_VALIDATORS", dict())
+    monkeypatch.setattr(
+        fhirtypesvalidators, "make_generic_validator", counting_make_generic_validator
+    )
+    patients = [Patient(id=f"p{idx}") for idx in range(10)]
+    bundle = Bundle(
+        type="collection", entry=[{"resource": patient} for patient in patients]
+    )
+    assert [e.resource.id for e in bundle.entry] == [p.id for p in patients]
+    assert len(calls) == 1
+    klass, validators = fhirtypesvalidators.FHIR_TYPE_VALIDATORS["Patient"]
+    assert klass is Patient
+    assert len(validators) == 1
+
+
+def test_fhir_types_created_on_demand():
+    """ """
+    import subprocess
+    import sys
+
+    from fhir.resources import fhirtypes, fhirtypesvalidators
+    from fhir.resources.STU3 import fhirtypes as stu3_fhirtypes
+
+    klass = fhirtypes.get_fhir_type_class("ImplementationGuideDefinitionPage")
+    assert klass is fhirtypes.ImplementationGuideDefinitionPageType
+    assert klass.__resource_type__ == "ImplementationGuideDefinitionPage"
+    assert klass.__module__ == "fhir.resources.fhirtypes"
+    assert issubclass(klass, fhirtypes.AbstractType)
+    assert stu3_fhirtypes.PatientType is not fhirtypes.PatientType
+    assert "PatientType" in dir(fhirtypes)
+
+    validator = fhirtypesvalidators.implementationguidedefinitionpage_validator
+    assert validator is fhirtypesvalidators.implementationguidedefinitionpage_validator
+    assert validator.__name__ == "implementationguidedefinitionpage_validator"
+    assert validator(
+        {"nameUrl": "http://example.org/a.html", "title": "A", "generation": "html"}
+    ).title
+
+    with pytest.raises(AttributeError):
+        fhirtypes.UnknownType
+    with pytest.raises(AttributeError):
+        fhirtypesvalidators.unknown_validator
+    with pytest.raises(LookupError):
+        fhirtypes.get_fhir_type_class("Unknown")
+
+    # only referenced types are made, while importing a model
+    code = (
+        "from fhir.resources import fhirtypes, fhirtypesvalidators;"
+        "import fhir.resources.patient;"
+        "made = [n for n in vars(fhirtypes) if n[:-4] in "
+        "fhirtypesvalidators.MODEL_CLASSES];"
+        "assert 0 < len(made) < 100, len(made)"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
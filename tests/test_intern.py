@@ -0,0 +1,92 @@
+# _*_ coding: utf-8 _*_
+import copy
+import json
+
+import pytest
+
+from fhir.resources.bundle import LazyBundle
+from fhir.resources.core.utils import frozen
+from fhir.resources.core.utils.intern import InternPool, InternStats
+from fhir.resources.observation import Observation
+
+from .fixtures import STATIC_PATH
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+def test_intern_pool():
+    """ """
+    data = json.loads((STATIC_PATH / "Observation.json").read_bytes())
+    other = copy.deepcopy(data)
+    other["id"] = "other"
+    other["valueQuantity"]["value"] = "7.20"
+
+    pool = InternPool()
+    obs1 = Observation.parse_obj(data, intern=pool)
+    obs2 = Observation.parse_raw(json.dumps(other), intern=pool)
+    # structurally identical elements are shared
+    assert obs1.code is obs2.code
+    assert obs1.code.coding[0] is obs2.code.coding[0]
+    assert obs1.subject is obs2.subject
+    assert obs1.code.coding[0].system is obs2.code.coding[0].system
+    # "7.2" and "7.20" are different values
+    assert obs1.valueQuantity is not obs2.valueQuantity
+    assert str(obs2.valueQuantity.value) == "7.20"
+    # same as without pool
+    assert obs1.json() == Observation.parse_obj(data).json()
+
+    stats = pool.stats()
+    assert isinstance(stats["Coding"], InternStats)
+    assert stats["Coding"].total == 2 * stats["Coding"].unique
+    assert stats["Quantity"] == InternStats(2, 2)
+    assert stats["strings"].ratio > 1
+    assert "CodeableConcept" in pool.report()
+
+    # shared instances are read-only, resource itself is not.
+    assert frozen.is_frozen(obs1.code)
+    assert frozen.is_frozen(obs1.code.coding[0])
+    with pytest.raises(TypeError) as exc_info:
+        obs1.code.text = "changed"
+    assert "frozen" in str(exc_info.value)
+    # lists of shared instances are read-only too
+    assert isinstance(obs1.code.coding, tuple)
+    with pytest.raises(AttributeError):
+        obs1.code.coding.append(obs1.code.coding[0])
+    assert len(obs2.code.coding) == len(data["code"]["coding"])
+    assert (
+        obs1.dict()["code"]["coding"]
+        == Observation.parse_obj(data).dict()["code"]["coding"]
+    )
+    obs1.status = "final"
+    code = obs1.code.copy()
+    code.text = "changed"
+    assert obs2.code.text != "changed"
+
+    # selected types only, strings are not interned.
+    pool = InternPool(["Reference"], strings=False)
+    obs1 = Observation.parse_obj(data, intern=pool)
+    obs2 = Observation.parse_obj(other, intern=pool)
+    assert obs1.subject is obs2.subject
+    assert obs1.code is not obs2.code
+    assert "strings" not in pool.stats()
+    pool.clear()
+    assert len(pool) == 0
+
+
+def test_intern_pool_lazy_bundle(tmp_path):
+    """ """
+    data = json.loads((STATIC_PATH / "Observation.json").read_bytes())
+    path = tmp_path / "bundle.json"
+    path.write_text(
+        json.dumps(
+            {
+                "resourceType": "Bundle",
+                "type": "collection",
+                "entry": [{"resource": data}, {"resource": data}],
+            }
+        )
+    )
+    pool = InternPool(["Coding"])
+    bundle = LazyBundle.parse_file(path, intern=pool)
+    assert len(bundle.entry) == 2
+    assert bundle.entry[1].resource.id == data["id"]
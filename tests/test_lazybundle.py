@@ -0,0 +1,140 @@
+# _*_ coding: utf-8 _*_
+import copy
+
+import pytest
+from pydantic import ValidationError
+
+from fhir.resources.bundle import Bundle, LazyBundle, LazyBundleEntry
+from fhir.resources.core.utils import RawResource
+from fhir.resources.explanationofbenefit import ExplanationOfBenefit
+from fhir.resources.patient import Patient
+
+from .fixtures import STATIC_PATH
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+def make_bundle() -> Bundle:
+    """ """
+    return Bundle.parse_obj(
+        {
+            "type": "transaction",
+            "entry": [
+                {
+                    "fullUrl": "urn:uuid:61ebe359-bfdc-4613-8bf2-c5e300945f0a",
+                    "resource": Patient.parse_file(
+                        STATIC_PATH / "Patient-with-ext.json"
+                    ),
+                    "request": {"method": "POST", "url": "Patient"},
+                },
+                {
+                    "resource": ExplanationOfBenefit.parse_file(
+                        STATIC_PATH / "ExplanationOfBenefit.json"
+                    ),
+                    "request": {"method": "PUT", "url": "ExplanationOfBenefit/EB3500"},
+                },
+            ],
+        }
+    )
+
+
+def test_lazy_bundle_raw():
+    """ """
+    bundle = make_bundle()
+    raw = bundle.json(return_bytes=True)
+    lazy = LazyBundle.parse_raw(raw)
+    assert lazy.type == "transaction"
+    assert isinstance(lazy.entry[0], LazyBundleEntry)
+    assert lazy.entry[0].request.method == "POST"
+    assert isinstance(lazy.entry[0].__dict__["resource"], RawResource)
+    # raw bytes are passed through, nothing is validated yet
+    assert lazy.json(return_bytes=True) == raw
+    assert isinstance(lazy.entry[1].__dict__["resource"], RawResource)
+
+    resource = lazy.entry[1].resource
+    assert isinstance(resource, ExplanationOfBenefit)
+    # memoised
+    assert lazy.entry[1].resource is resource
+    assert lazy.entry[1].__dict__["resource"] is resource
+    assert lazy.json(return_bytes=True) == raw
+
+    # not yet accessed resource is given as decoded json
+    assert lazy.dict()["entry"][0]["resource"]["resourceType"] == "Patient"
+    # dict() output is not shared with lazy element
+    lazy.dict()["entry"][0]["resource"]["gender"] = "other"
+    assert lazy.dict()["entry"][0]["resource"]["gender"] == "male"
+    assert Bundle.parse_obj(lazy.dict()).json() == bundle.json()
+    assert lazy.json(exclude_comments=True) == bundle.json(exclude_comments=True)
+    assert lazy.xml() == bundle.xml()
+
+
+def test_lazy_bundle_obj():
+    """ """
+    bundle = make_bundle()
+    lazy = LazyBundle.parse_obj(bundle.dict())
+    assert isinstance(lazy.entry[0].__dict__["resource"], RawResource)
+    assert lazy.json() == bundle.json()
+    lazy.dict()["entry"][0]["resource"]["gender"] = "other"
+    assert lazy.dict()["entry"][0]["resource"]["gender"] == "male"
+    assert lazy.entry[0].resource == bundle.entry[0].resource
+
+
+def test_lazy_bundle_clone():
+    """ """
+    raw = make_bundle().json(return_bytes=True)
+    template = LazyBundle.parse_raw(raw)
+    # resolved resource is cloned too
+    template.entry[1].resource
+    cloned = template.clone()
+    assert isinstance(cloned.entry[0].__dict__["resource"], RawResource)
+    assert (
+        cloned.entry[0].__dict__["resource"]
+        is not template.entry[0].__dict__["resource"]
+    )
+    cloned.entry[0].resource.gender = "other"
+    cloned.entry[1].resource.status = "cancelled"
+    assert isinstance(template.entry[0].__dict__["resource"], RawResource)
+    assert template.entry[0].resource.gender == "male"
+    assert template.entry[1].resource.status == "active"
+    assert cloned.entry[0].resource.gender == "other"
+
+    copied = copy.deepcopy(template)
+    copied.entry[0].resource.gender = "unknown"
+    assert template.entry[0].resource.gender == "male"
+    # shared elements stay shared
+    copied = copy.deepcopy([template, template])
+    assert copied[0] is copied[1]
+    assert copied[0] is not template
+
+
+def test_lazy_bundle_errors():
+    """ """
+    raw = (
+        b'{"resourceType": "Bundle", "type": "collection", "entry": ['
+        b'{"resource": {"resourceType": "Patient", "gender": ["wrong"]}}]}'
+    )
+    with pytest.raises(ValidationError):
+        Bundle.parse_raw(raw)
+    # resource is validated on access only
+    lazy = LazyBundle.parse_raw(raw)
+    with pytest.raises(ValidationError) as exc:
+        lazy.entry[0].resource
+    assert exc.value.errors()[0]["loc"] == ("resource", "gender")
+
+    # envelope is still validated
+    with pytest.raises(ValidationError):
+        LazyBundle.parse_raw(b'{"resourceType": "Bundle", "type": ["wrong"]}')
+    with pytest.raises(ValidationError):
+        LazyBundle.parse_raw(b'{"resourceType": "Bundle", "entry": [{')
+
+
+def test_lazy_bundle_stu3():
+    """ """
+    from fhir.resources.STU3.bundle import LazyBundle as STU3LazyBundle
+    from fhir.resources.STU3.patient import Patient as STU3Patient
+
+    lazy = STU3LazyBundle.parse_raw(
+        b'{"resourceType": "Bundle", "type": "collection", "entry": '
+        b'[{"resource": {"resourceType": "Patient", "id": "p1"}}]}'
+    )
+    assert isinstance(lazy.entry[0].resource, STU3Patient)
@@ -0,0 +1,95 @@
+# _*_ coding: utf-8 _*_
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+STRESS_CODE = textwrap.dedent("""
+    import importlib
+    import random
+    import sys
+    import threading
+    from types import MappingProxyType
+
+    from fhir.resources.core.utils.common import get_fhir_root_module
+
+    release = sys.argv[1]
+    size = 32
+    barrier = threading.Barrier(size)
+    results = [None] * size
+    errors = list()
+
+    def resolve(index):
+        try:
+            barrier.wait()
+            module = get_fhir_root_module(release)
+            validators = importlib.import_module(
+                module.__name__ + ".fhirtypesvalidators"
+            )
+            names = sorted(validators.MODEL_NAMES)
+            random.Random(index).shuffle(names)
+            resolved = dict()
+            for name in names:
+                try:
+                    resolved[name] = validators.get_fhir_model_class(name)
+                except AttributeError:
+                    # broken registry entry (DSTU2)
+                    resolved[name] = None
+            results[index] = (module, resolved)
+        except Exception as exc:  # pragma: no cover
+            errors.append(exc)
+
+    threads = [threading.Thread(target=resolve, args=(i,)) for i in range(size)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == [], errors
+    module, expected = results[0]
+    validators = importlib.import_module(module.__name__ + ".fhirtypesvalidators")
+    assert all(result[0] is module for result in results)
+    assert all(result[1] == expected for result in results)
+    assert isinstance(validators.MODEL_CLASSES, MappingProxyType)
+    for name, klass in expected.items():
+        registered, module_name = validators.MODEL_CLASSES[name]
+        assert registered is klass, name
+        if klass is not None:
+            mod = sys.modules[module.__name__ + module_name]
+            assert getattr(mod, name) is klass
+    print(len(expected))
+    """)
+
+
+@pytest.mark.parametrize("release", ["R4", "STU3", "DSTU2"])
+def test_model_registry_threads(release):
+    """All classes are resolved from 32 threads concurrently (fresh interpreter),
+    every thread must get the same class objects."""
+    process = subprocess.run(
+        [sys.executable, "-c", STRESS_CODE, release],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    assert process.returncode == 0, process.stderr.decode()
+    assert int(process.stdout) > 300
+
+
+def test_model_registry_immutable():
+    """ """
+    from fhir.resources import fhirtypesvalidators
+    from fhir.resources.core.utils import common
+
+    with pytest.raises(TypeError):
+        fhirtypesvalidators.MODEL_CLASSES["Patient"] = (None, ".patient")
+    with pytest.raises(TypeError):
+        common.FHIR_ROOT_MODULES["R4"] = None
+
+    klass = fhirtypesvalidators.get_fhir_model_class("Patient")
+    # all models of the module are registered together
+    assert fhirtypesvalidators.MODEL_CLASSES["PatientLink"][0] is not None
+    assert common.get_fhir_root_module("R4").get_fhir_model_class("Patient") is klass
+    with pytest.raises(KeyError):
+        fhirtypesvalidators.get_fhir_model_class("Unknown")
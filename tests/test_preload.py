@@ -0,0 +1,43 @@
+# _*_ coding: utf-8 _*_
+import pytest
+
+from fhir.resources import fhirtypesvalidators, preload
+from fhir.resources.core.utils.preload import PreloadReport
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+def test_preload():
+    """ """
+    report = preload(["Patient"])
+    assert isinstance(report, PreloadReport)
+    assert report.releases == ("R4",)
+    assert report.models > 1
+    assert report.seconds > 0
+    assert report.memory is not None
+    assert "R4" in str(report)
+    # nested elements are loaded and their validators are prepared.
+    for name in ("Patient", "HumanName", "PatientContact", "Reference", "Period"):
+        assert fhirtypesvalidators.MODEL_CLASSES[name][0] is not None
+        assert name in fhirtypesvalidators.FHIR_TYPE_VALIDATORS
+    klass = fhirtypesvalidators.get_fhir_model_class("PatientContact")
+    hits = klass.get_alias_mapping.cache_info().hits
+    klass.get_alias_mapping()
+    assert klass.get_alias_mapping.cache_info().hits == hits + 1
+
+    # already loaded
+    assert preload("Patient", trace_memory=False).memory is None
+
+
+def test_preload_releases():
+    """ """
+    from fhir.resources.DSTU2 import fhirtypesvalidators as dstu2_validators
+    from fhir.resources.STU3 import fhirtypesvalidators as stu3_validators
+
+    report = preload("Observation", releases=("STU3", "DSTU2"))
+    assert report.releases == ("STU3", "DSTU2")
+    assert stu3_validators.MODEL_CLASSES["ObservationComponent"][0] is not None
+    assert dstu2_validators.MODEL_CLASSES["ObservationComponent"][0] is not None
+
+    with pytest.raises(LookupError):
+        preload("Unknown")
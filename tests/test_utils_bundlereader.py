@@ -0,0 +1,210 @@
+# _*_ coding: utf-8 _*_
+import io
+import json
+
+import pytest
+
+from fhir.resources.bundle import Bundle, BundleEntry, iter_entries
+from fhir.resources.core.utils.bundlereader import BundleReader
+from fhir.resources.patient import Patient
+
+from .fixtures import STATIC_PATH
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+def make_bundle_data():
+    """ """
+    patient = Patient.__config__.json_loads(
+        (STATIC_PATH / "Patient-with-ext.json").read_bytes()
+    )
+    eob = Patient.__config__.json_loads(
+        (STATIC_PATH / "ExplanationOfBenefit.json").read_bytes()
+    )
+    # some tricky strings for scanner
+    patient["text"][
+        "div"
+    ] = '<div xmlns="http://www.w3.org/1999/xhtml">{"[\\" \\\\ ]}</div>'
+    entries = list()
+    for index, resource in enumerate((patient, eob, patient, eob)):
+        entries.append(
+            {
+                "fullUrl": f"http://example.org/fhir/{resource['resourceType']}/{index}",
+                "resource": resource,
+            }
+        )
+    return {
+        "resourceType": "Bundle",
+        "id": "searchset-1",
+        "type": "searchset",
+        "total": len(entries),
+        "entry": entries,
+        "link": [{"relation": "self", "url": "http://example.org/fhir/Patient"}],
+    }
+
+
+@pytest.mark.parametrize("chunk_size", [7, 64, 64 * 1024])
+def test_bundle_reader_json(chunk_size):
+    """ """
+    data = make_bundle_data()
+    bundle = Bundle.parse_obj(data)
+    stream = io.BytesIO(json.dumps(data, indent=2).encode())
+    reader = BundleReader(Bundle, BundleEntry, stream, chunk_size=chunk_size)
+    entries = list(reader)
+    assert len(entries) == 4
+    assert all(isinstance(e, BundleEntry) for e in entries)
+    assert [e.json() for e in entries] == [e.json() for e in bundle.entry]
+    # envelope is read too
+    assert "entry" not in reader.envelope
+    assert reader.bundle.total == 4
+    assert reader.bundle.link[0].relation == "self"
+
+
+def test_bundle_reader_large_entry():
+    """Entry of several MB is scanned once (not again after each chunk)."""
+    import base64
+
+    data = base64.b64encode(bytes(range(256)) * 12 * 1024).decode()
+    text = '\\"{[' * 256 * 1024
+    raw = json.dumps(
+        {
+            "resourceType": "Bundle",
+            "type": "collection",
+            "entry": [
+                {"resource": {"resourceType": "Binary", "contentType": "a/b"}},
+                {"resource": {"resourceType": "Patient", "id": "p1"}},
+            ],
+        }
+    ).encode()
+    raw = raw.replace(
+        b'"contentType": "a/b"',
+        f'"contentType": "a/b", "data": "{data}"'.encode()
+        + b', "id": "b1", "meta": {"tag": [{"display": "'
+        + json.dumps(text).encode()[1:-1]
+        + b'"}]}',
+    )
+    assert len(raw) > 5 * 1024 * 1024
+    entries = list(iter_entries(io.BytesIO(raw)))
+    assert len(entries) == 2
+    assert entries[0].resource.data == data.encode()
+    assert entries[0].resource.meta.tag[0].display == text
+    assert entries[1].resource.id == "p1"
+
+
+def test_iter_entries_path(monkeypatch, tmp_path):
+    """ """
+    bundle = Bundle.parse_obj(make_bundle_data())
+    json_file = tmp_path / "bundle.json"
+    json_file.write_bytes(bundle.json(return_bytes=True))
+    xml_file = tmp_path / "bundle.xml"
+    xml_file.write_text(bundle.xml(pretty_print=True))
+
+    expected = [e.json() for e in bundle.entry]
+    assert [e.json() for e in iter_entries(json_file)] == expected
+
+    expected_xml = [
+        e.json() for e in Bundle.parse_file(xml_file, content_type="text/xml").entry
+    ]
+    assert [e.json() for e in iter_entries(str(xml_file))] == expected_xml
+    # content type from stream itself
+    with open(xml_file, "rb") as fp:
+        assert [e.json() for e in iter_entries(fp)] == expected_xml
+    # xml envelope
+    reader = BundleReader(Bundle, BundleEntry, xml_file)
+    assert len(list(reader)) == 4
+    assert reader.bundle.id == "searchset-1"
+    assert reader.bundle.entry is None
+
+    # trusted input
+    trusted = list(iter_entries(json_file, validate=False))
+    assert [e.json() for e in trusted] == expected
+    construct_tree = BundleEntry.construct_tree
+    calls = list()
+
+    def counting_construct_tree(data):
+        calls.append(data)
+        return construct_tree(data)
+
+    monkeypatch.setattr(BundleEntry, "construct_tree", counting_construct_tree)
+    trusted = list(iter_entries(xml_file, validate=False))
+    assert len(calls) == 4
+    assert [e.json() for e in trusted] == expected_xml
+
+
+def test_iter_entries_errors():
+    """ """
+    with pytest.raises(ValueError):
+        list(iter_entries(io.BytesIO(b'{"resourceType": "Patient", "entry": []}')))
+
+    with pytest.raises(ValueError):
+        # truncated document
+        list(iter_entries(io.BytesIO(b'{"resourceType": "Bundle", "entry": [{"a')))
+
+    assert list(iter_entries(io.BytesIO(b"{}"))) == []
+
+
+def test_iter_entries_stu3():
+    """ """
+    from fhir.resources.STU3.bundle import BundleEntry as STU3BundleEntry
+    from fhir.resources.STU3.bundle import iter_entries as stu3_iter_entries
+
+    data = (
+        b'{"resourceType": "Bundle", "type": "collection", "entry": '
+        b'[{"resource": {"resourceType": "Patient", "id": "p1"}}]}'
+    )
+    entries = list(stu3_iter_entries(io.BytesIO(data)))
+    assert isinstance(entries[0], STU3BundleEntry)
+    assert entries[0].resource.id == "p1"
+
+
+def test_xml_loads_bundle(monkeypatch, tmp_path):
+    """Bundle xml is parsed incrementally, result is same as whole tree."""
+    from lxml import etree
+
+    from fhir.resources.bundle import LazyBundle, LazyBundleEntry
+    from fhir.resources.core.utils import RawResource
+    from fhir.resources.core.utils.xml import Node, xml_load_bundle
+
+    bundle = Bundle.parse_obj(make_bundle_data())
+    xml_bytes = bundle.xml(return_bytes=True).replace(
+        b"<entry>", b"<!--first entry--><entry>", 1
+    )
+    expected = Node.from_element(etree.fromstring(xml_bytes)).to_fhir(Bundle)
+
+    parsed = Bundle.parse_raw(xml_bytes, content_type="text/xml")
+    assert parsed == expected
+    assert parsed.entry[0].fhir_comments == "first entry"
+    assert parsed.link[0].relation == "self"
+    assert xml_load_bundle(Bundle, io.BytesIO(xml_bytes)) == expected
+
+    # each entry is validated once, streamed Bundle is not validated again
+    init = BundleEntry.__init__
+    calls = list()
+
+    def counting_init(self, **data):
+        calls.append(data)
+        init(self, **data)
+
+    monkeypatch.setattr(BundleEntry, "__init__", counting_init)
+    assert Bundle.parse_raw(xml_bytes, content_type="text/xml") == expected
+    assert len(calls) == 4
+    monkeypatch.undo()
+
+    lazy = LazyBundle.parse_raw(xml_bytes, content_type="text/xml")
+    assert isinstance(lazy, LazyBundle)
+    assert len(lazy.entry) == 4
+    assert isinstance(lazy.entry[0], LazyBundleEntry)
+    assert isinstance(lazy.entry[0].__dict__["resource"], RawResource)
+    assert Bundle.parse_raw(lazy.json()) == expected
+    path = tmp_path / "bundle.xml"
+    path.write_bytes(xml_bytes)
+    lazy = LazyBundle.parse_file(path)
+    assert isinstance(lazy.entry[0].__dict__["resource"], RawResource)
+    assert lazy.entry[0].resource == expected.entry[0].resource
+
+    empty = Bundle.parse_raw(
+        '<Bundle xmlns="http://hl7.org/fhir"><type value="batch"/></Bundle>',
+        content_type="text/xml",
+    )
+    assert empty.type == "batch"
+    assert empty.entry is None
@@ -0,0 +1,188 @@
+# _*_ coding: utf-8 _*_
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from fhir.resources import construct_fhir_element
+from fhir.resources.bundle import Bundle, BundleEntry, LazyBundle
+from fhir.resources.core.utils import RawResource, frozen
+from fhir.resources.core.utils.cache import (
+    CacheStats,
+    ValidationCache,
+    invalidate_validation_caches,
+)
+from fhir.resources.core.utils.intern import InternPool
+from fhir.resources.DSTU2 import (
+    construct_fhir_element as construct_fhir_element_dstu2,
+)
+from fhir.resources.fhirtypes import Id
+from fhir.resources.observation import Observation
+from fhir.resources.patient import Patient
+from fhir.resources.STU3.patient import Patient as Patient_STU3
+
+from .fixtures import STATIC_PATH
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+def test_validation_cache():
+    """ """
+    raw = (STATIC_PATH / "Patient-with-ext.json").read_bytes()
+    cache = ValidationCache()
+    patient1 = Patient.parse_raw(raw, cache=cache, frozen=True)
+    patient2 = Patient.parse_raw(raw, cache=cache, frozen=True)
+    # frozen=True returns the shared (frozen) model
+    assert patient1 is patient2
+    assert frozen.is_frozen(patient1)
+    stats = cache.stats()
+    assert isinstance(stats, CacheStats)
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+    assert stats.bytes == len(raw)
+    assert stats.hit_rate == 0.5
+    assert "hit rate 50.0%" in str(stats)
+
+    # parse_obj and construct_fhir_element share the same cache
+    data = json.loads(raw)
+    patient3 = Patient.parse_obj(data, cache=cache, frozen=True)
+    assert Patient.parse_obj(data, cache=cache, frozen=True) is patient3
+    # otherwise (construct_fhir_element too) a mutable model is given
+    patient4 = construct_fhir_element("Patient", data, cache=cache)
+    assert patient4 == patient3
+    assert not frozen.is_frozen(patient4)
+    patient4.active = False
+    patient4 = construct_fhir_element("Patient", raw, cache=cache)
+    assert not frozen.is_frozen(patient4)
+    assert patient4 == patient1
+    assert patient3 == patient1
+    assert len(cache) == 2
+
+    # key includes model class (so release) and content type
+    minimal = b'{"resourceType": "Patient", "id": "p1"}'
+    Patient.parse_raw(minimal, cache=cache)
+    patient_stu3 = Patient_STU3.parse_raw(minimal, cache=cache)
+    assert isinstance(patient_stu3, Patient_STU3)
+    assert len(cache) == 4
+    Patient.parse_raw(minimal, cache=cache, content_type="application/fhir+json")
+    assert len(cache) == 4
+    Patient.parse_raw(minimal, cache=cache, content_type="text/yaml")
+    assert len(cache) == 5
+    Patient.parse_raw(minimal, cache=cache)
+    assert len(cache) == 5
+
+    # DSTU2 goes through parse_raw(..., cache=...) as well
+    patient_dstu2 = construct_fhir_element_dstu2("Patient", minimal, cache=cache)
+    assert construct_fhir_element_dstu2("Patient", minimal, cache=cache).id == "p1"
+    assert not frozen.is_frozen(patient_dstu2)
+    assert len(cache) == 6
+
+    # invalid payloads are not cached
+    with pytest.raises(ValidationError):
+        Patient.parse_raw(b'{"resourceType": "Patient", "active": "x"}', cache=cache)
+    assert len(cache) == 6
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.stats().bytes == 0
+
+
+def test_validation_cache_mutable():
+    """ """
+    raw = (STATIC_PATH / "Observation.json").read_bytes()
+    cache = ValidationCache()
+    obs1 = Observation.parse_raw(raw, cache=cache)
+    obs2 = Observation.parse_raw(raw, cache=cache)
+    assert obs1 is not obs2
+    assert not frozen.is_frozen(obs1)
+    assert not frozen.is_frozen(obs2)
+    obs1.status = "amended"
+    obs2.status = "cancelled"
+    obs3 = Observation.parse_raw(raw, cache=cache)
+    assert obs3.status == Observation.parse_raw(raw).status
+    assert cache.stats().hits == 2
+
+
+def test_validation_cache_lazy_bundle():
+    """ """
+    patient = (STATIC_PATH / "Patient-with-ext.json").read_text()
+    raw = (
+        '{"resourceType": "Bundle", "type": "collection", '
+        f'"entry": [{{"resource": {patient}}}]}}'
+    ).encode()
+    cache = ValidationCache()
+    bundle1 = LazyBundle.parse_raw(raw, cache=cache, frozen=True)
+    bundle2 = LazyBundle.parse_raw(raw, cache=cache, frozen=True)
+    assert bundle1 is bundle2
+    assert isinstance(bundle1, LazyBundle)
+    assert cache.stats().hits == 1
+    assert isinstance(bundle1.entry[0].__dict__["resource"], RawResource)
+    # resolved resource of a frozen (shared) bundle is frozen as well
+    with pytest.raises(TypeError):
+        bundle1.entry[0].resource.gender = "other"
+    assert LazyBundle.parse_raw(raw, frozen=True).entry[0].resource.__hash__()
+
+    bundle1 = LazyBundle.parse_raw(raw, cache=cache)
+    bundle2 = LazyBundle.parse_raw(raw, cache=cache)
+    assert bundle1 is not bundle2
+    bundle2.entry[0].resource.gender = "other"
+    assert bundle1.entry[0].resource.gender == "male"
+    assert LazyBundle.parse_raw(raw, cache=cache).entry[0].resource.gender == "male"
+
+    # cached apart from Bundle of the same payload
+    bundle = Bundle.parse_raw(raw, cache=cache)
+    assert bundle.__class__ is Bundle
+    assert bundle.entry[0].__class__ is BundleEntry
+    intern = InternPool()
+    bundle = LazyBundle.parse_raw(raw, cache=cache, intern=intern)
+    assert cache.stats().entries == 3
+
+
+def test_validation_cache_eviction():
+    """ """
+    payloads = [
+        json.dumps({"resourceType": "Patient", "id": f"p{index}"}) for index in range(4)
+    ]
+    cache = ValidationCache(maxsize=2)
+    for payload in payloads:
+        Patient.parse_raw(payload, cache=cache)
+    stats = cache.stats()
+    assert stats.entries == 2
+    assert stats.evictions == 2
+    # least recently used are evicted
+    Patient.parse_raw(payloads[-1], cache=cache)
+    Patient.parse_raw(payloads[0], cache=cache)
+    assert cache.stats().hits == 1
+
+    size = len(payloads[0])
+    cache = ValidationCache(max_bytes=size * 2)
+    for payload in payloads:
+        Patient.parse_raw(payload, cache=cache)
+    assert cache.stats().entries == 2
+    assert cache.stats().bytes <= size * 2
+    # too large payload is never cached
+    cache = ValidationCache(max_bytes=size - 1)
+    Patient.parse_raw(payloads[0], cache=cache)
+    assert len(cache) == 0
+
+
+def test_validation_cache_invalidation():
+    """ """
+    raw = json.dumps({"resourceType": "Patient", "id": "p1"})
+    cache = ValidationCache()
+    Patient.parse_raw(raw, cache=cache)
+    assert len(cache) == 1
+    invalidate_validation_caches()
+    assert len(cache) == 0
+    assert cache.stats().invalidations == 1
+
+    # changed validation rules drop cached models
+    Patient.parse_raw(raw, cache=cache)
+    max_length = Id.max_length
+    try:
+        Id.configure_constraints(max_length=2)
+        assert len(cache) == 0
+        with pytest.raises(ValidationError):
+            Patient.parse_raw(json.dumps({"resourceType": "Patient", "id": "p12"}))
+    finally:
+        Id.configure_constraints(max_length=max_length)
+    assert cache.stats().invalidations == 3
@@ -0,0 +1,41 @@
+# _*_ coding: utf-8 _*_
+from fhir.resources.core.utils import get_cache_info, get_field_properties
+from fhir.resources.patient import Patient
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+def test_field_type_caches_are_unbounded():
+    """ """
+    info = get_cache_info()
+    assert set(info) == {
+        "get_fhir_type_name",
+        "normalize_fhir_type_class",
+        "field_properties",
+        "has_resource_base",
+    } | ({"has_resource_base (DSTU2)"} & set(info))
+    assert all(
+        cache_info.maxsize is None
+        for name, cache_info in info.items()
+        if name != "field_properties"
+    )
+
+    assert Patient.has_resource_base() is True
+    hits = get_cache_info()["has_resource_base"].hits
+    assert Patient.has_resource_base() is True
+    assert get_cache_info()["has_resource_base"].hits == hits + 1
+
+
+def test_field_properties_per_model_class():
+    """ """
+    properties = get_field_properties(Patient)
+    assert properties["birthDate"].is_primitive is True
+    assert properties["birthDate"].is_list is False
+    assert properties["birthDate"].type_name == "date"
+    assert properties["name"].is_primitive is False
+    assert properties["name"].is_list is True
+    assert properties["name"].type_name == "HumanName"
+    # computed once, kept on class
+    assert get_field_properties(Patient) is properties
+    assert Patient.__dict__["__fhir_field_properties__"] is properties
+    assert get_cache_info()["field_properties"] >= 1
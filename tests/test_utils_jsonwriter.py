@@ -0,0 +1,77 @@
+# _*_ coding: utf-8 _*_
+import io
+
+import orjson
+import pytest
+
+from fhir.resources.bundle import Bundle
+from fhir.resources.core.utils import json_dumps_model
+from fhir.resources.explanationofbenefit import ExplanationOfBenefit
+from fhir.resources.observation import Observation
+from fhir.resources.patient import Patient
+
+from .fixtures import STATIC_PATH
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+def get_models():
+    """ """
+    patient = Patient.parse_file(STATIC_PATH / "Patient-with-ext.json")
+    observation = Observation.parse_file(STATIC_PATH / "Observation.json")
+    eob = ExplanationOfBenefit.parse_file(STATIC_PATH / "ExplanationOfBenefit.json")
+    bundle = Bundle.parse_obj(
+        {
+            "resourceType": "Bundle",
+            "type": "collection",
+            "entry": [{"resource": r.dict()} for r in (patient, observation, eob)],
+        }
+    )
+    # special cases: empty list, list with null, empty element, comments
+    special = Patient(
+        active=True,
+        address=[],
+        name=[
+            {
+                "given": ["A", None, "C"],
+                "_given": [
+                    None,
+                    {"extension": [{"url": "http://e.org", "valueCode": "x"}]},
+                    None,
+                ],
+            }
+        ],
+        maritalStatus={},
+        fhir_comments=["comment one", "comment two"],
+    )
+    return [patient, observation, eob, bundle, special]
+
+
+@pytest.mark.parametrize("model", get_models())
+def test_json_dumps_model_identical_output(model):
+    """ """
+    for by_alias in (True, False):
+        for exclude_none in (True, False):
+            for exclude_comments in (True, False):
+                params = {
+                    "by_alias": by_alias,
+                    "exclude_none": exclude_none,
+                    "exclude_comments": exclude_comments,
+                }
+                expected = orjson.dumps(
+                    model.dict(**params), default=model.__json_encoder__
+                )
+                assert json_dumps_model(model, **params) == expected
+                assert model.json(return_bytes=True, **params) == expected
+
+                stream = io.BytesIO()
+                json_dumps_model(model, stream=stream, flush_size=8, **params)
+                assert stream.getvalue() == expected
+
+
+def test_json_dump_stream():
+    """ """
+    patient = Patient.parse_file(STATIC_PATH / "Patient-with-ext.json")
+    stream = io.BytesIO()
+    patient.json_dump(stream, exclude_comments=True)
+    assert stream.getvalue() == patient.json(exclude_comments=True, return_bytes=True)
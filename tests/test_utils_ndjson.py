@@ -0,0 +1,100 @@
+# _*_ coding: utf-8 _*_
+import io
+
+import pytest
+
+from fhir.resources.core.utils.ndjson import (
+    iter_lines,
+    iter_ndjson,
+    iter_ndjson_parallel,
+    write_ndjson,
+)
+from fhir.resources.explanationofbenefit import ExplanationOfBenefit
+from fhir.resources.patient import Patient
+
+from .fixtures import STATIC_PATH
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+def make_ndjson(size: int = 20) -> bytes:
+    """Every fifth line is invalid, a blank line at the end of each ten."""
+    patient = Patient.parse_file(STATIC_PATH / "Patient-with-ext.json")
+    eob = ExplanationOfBenefit.parse_file(STATIC_PATH / "ExplanationOfBenefit.json")
+    lines = list()
+    for idx in range(size):
+        if idx % 5 == 4:
+            lines.append(b'{"resourceType": "Patient", "gender": ["wrong"]}')
+        elif idx % 2 == 0:
+            lines.append(patient.json(return_bytes=True, exclude_comments=True))
+        else:
+            lines.append(eob.json(return_bytes=True, exclude_comments=True))
+        if idx % 10 == 9:
+            lines.append(b"  ")
+    return b"\n".join(lines)
+
+
+def test_iter_lines():
+    """ """
+    source = io.BytesIO(b'{"a": 1}\n\n{"b": 2}\r\n{"c": 3}')
+    assert list(iter_lines(source, read_size=3)) == [
+        (1, b'{"a": 1}'),
+        (3, b'{"b": 2}\r'),
+        (4, b'{"c": 3}'),
+    ]
+
+
+def test_iter_ndjson():
+    """ """
+    records = list(iter_ndjson(io.BytesIO(make_ndjson())))
+    assert len(records) == 20
+    errors = [r for r in records if r.error is not None]
+    assert [r.line_number for r in errors] == [5, 10, 16, 21]
+    assert errors[0].model is None
+    assert errors[0].error.errors[0]["loc"] == ("gender",)
+    assert isinstance(records[0].model, Patient)
+    assert isinstance(records[1].model, ExplanationOfBenefit)
+
+    records = list(iter_ndjson(io.BytesIO(b'{"resourceType": "Unknown"}\n[1]')))
+    assert all(r.error is not None for r in records)
+    assert "Unknown" in records[0].error.message
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_iter_ndjson_parallel(ordered):
+    """ """
+    expected = list(iter_ndjson(io.BytesIO(make_ndjson())))
+    records = list(
+        iter_ndjson_parallel(
+            io.BytesIO(make_ndjson()),
+            chunk_size=3,
+            max_workers=2,
+            ordered=ordered,
+            max_pending=1,
+        )
+    )
+    if not ordered:
+        records = sorted(records, key=lambda r: r.line_number)
+    assert [r.line_number for r in records] == [r.line_number for r in expected]
+    assert [r.model and r.model.json() for r in records] == [
+        r.model and r.model.json() for r in expected
+    ]
+
+
+def test_write_ndjson(tmp_path):
+    """ """
+    models = [r.model for r in iter_ndjson(io.BytesIO(make_ndjson())) if r.model]
+    target = tmp_path / "Patient.ndjson"
+    assert write_ndjson(models, target) == len(models)
+    records = list(iter_ndjson(target))
+    assert [r.line_number for r in records] == list(range(1, len(models) + 1))
+    assert [r.model.json() for r in records] == [m.json() for m in models]
+
+    # comments are kept, same as ``model.json()``
+    patient = Patient.parse_obj(
+        {"resourceType": "Patient", "fhir_comments": ["c1"], "active": True}
+    )
+    write_ndjson([patient], target)
+    assert target.read_bytes() == patient.json(return_bytes=True) + b"\n"
+    write_ndjson([patient], target, exclude_comments=True)
+    assert b"fhir_comments" not in target.read_bytes()
@@ -1,9 +1,15 @@
 import sys
+import threading
+from decimal import Decimal
 from http import client
 
 import lxml.etree  # type: ignore
+import pytest
+from pydantic import ValidationError
 
+from fhir.resources.bundle import Bundle
 from fhir.resources.core import utils
+from fhir.resources.core.utils import xsd
 from fhir.resources.observation import Observation
 from fhir.resources.patient import Patient
 
@@ -108,3 +114,217 @@ def test_model_obj_xml_file():
     patient.contained[1].text = None
     patient3.contained[1].text = None
     assert patient3 == patient
+
+
+def test_xml_dumps_direct():
+    """Single pass writer and ``Node`` tree produce identical output."""
+    data = {
+        "resourceType": "Patient",
+        "id": "p1",
+        "name": [
+            {
+                "fhir_comments": "name comment",
+                "given": ["A", None, "C"],
+                "_given": [
+                    None,
+                    {
+                        "fhir_comments": ["given comment"],
+                        "extension": [{"url": "http://e", "valueString": "v"}],
+                    },
+                    {"id": "e3", "extension": [{"url": "z", "valueInteger": 3}]},
+                ],
+            }
+        ],
+        "_gender": {"extension": [{"url": "u", "id": "i", "valueCode": "x"}]},
+        "birthDate": "2000-01-01",
+        "_birthDate": {
+            "fhir_comments": ["c1", "c2"],
+            "extension": [{"url": "http://e", "valueBoolean": False}],
+        },
+        "active": False,
+        "contained": [{"resourceType": "Organization", "id": "o", "name": "Org"}],
+    }
+    models = [
+        Patient.parse_obj(data),
+        Patient.parse_file(STATIC_PATH / "Patient-with-ext.json"),
+        Patient.parse_file(STATIC_PATH / "patient-example-animal(animal).xml"),
+        Observation.parse_file(STATIC_PATH / "Observation.json"),
+    ]
+    for model in models:
+        for pretty_print in (False, True):
+            expected = utils.xml.Node.from_fhir_obj(model).to_string(
+                pretty_print=pretty_print
+            )
+            assert utils.xml.xml_dumps(model, pretty_print=pretty_print) == expected
+
+    xml_str = models[0].xml()
+    assert "<!--c1--><!--c2--><birthDate" in xml_str
+    assert '<gender><extension id="i" url="u">' in xml_str
+    assert "<contained><Organization><id" in xml_str
+
+
+def test_node_from_element_namespaces():
+    """Only namespaces those are not declared by ancestors are kept."""
+    xml_bytes = (
+        b'<Patient xmlns="http://hl7.org/fhir" xmlns:a="urn:a">'
+        b'<name xmlns:b="urn:b"><given xmlns:a="urn:a" value="A"/>'
+        b'<family xmlns:a="urn:other" value="B"/></name>'
+        b'<gender xmlns="http://hl7.org/fhir" value="male"/></Patient>'
+    )
+    node = utils.xml.Node.from_element(lxml.etree.fromstring(xml_bytes))
+    assert {ns.to_xml() for ns in node.namespaces} == {
+        (None, "http://hl7.org/fhir"),
+        ("a", "urn:a"),
+    }
+    name, gender = node.children
+    assert [ns.to_xml() for ns in name.namespaces] == [("b", "urn:b")]
+    given, family = name.children
+    assert len(given.namespaces) == 0
+    # redefined prefix
+    assert [ns.to_xml() for ns in family.namespaces] == [("a", "urn:other")]
+    assert len(gender.namespaces) == 0
+
+    # already declared namespaces given as list
+    element = lxml.etree.fromstring(xml_bytes)[0]
+    name = utils.xml.Node.from_element(
+        element,
+        exists_ns=[
+            utils.xml.Namespace(None, "http://hl7.org/fhir"),
+            utils.xml.Namespace("a", "urn:a"),
+        ],
+    )
+    assert [ns.to_xml() for ns in name.namespaces] == [("b", "urn:b")]
+    assert Patient.parse_raw(xml_bytes, content_type="text/xml").gender == "male"
+
+
+def test_xsd_schema_registry(monkeypatch):
+    """ """
+    registry = xsd.SchemaRegistry()
+    with pytest.raises(LookupError):
+        registry.get_schema("R4", "Patient")
+    with pytest.raises(ValueError):
+        registry.register_directory("R4", STATIC_PATH / "not-exists")
+    registry.register_directory("R4", FHIR_XSD_DIR)
+    with pytest.raises(LookupError):
+        registry.get_schema("R4", "NotAResource")
+
+    # compiled once, parser per thread
+    schema = registry.get_schema("R4", "Patient")
+    assert registry.get_schema_by_file(FHIR_XSD_DIR / "patient.xsd") is schema
+    parser = registry.get_parser("R4", "Patient")
+    assert registry.get_parser("R4", "Patient") is parser
+    parsers = list()
+    thread = threading.Thread(
+        target=lambda: parsers.append(registry.get_parser("R4", "Patient"))
+    )
+    thread.start()
+    thread.join()
+    assert parsers[0] is not parser
+    assert registry.schemas == {str((FHIR_XSD_DIR / "patient.xsd").resolve()): schema}
+    registry.clear()
+    assert registry.get_parser("R4", "Patient") is not parser
+
+    monkeypatch.setattr(xsd.SCHEMA_REGISTRY, "directories", dict())
+    xml_bytes = (STATIC_PATH / "Patient-with-ext.xml").read_bytes()
+    with pytest.raises(LookupError):
+        Patient.parse_raw(xml_bytes, content_type="text/xml", validate_schema=True)
+    xsd.register_xsd_directory(FHIR_XSD_DIR)
+
+    patient = Patient.parse_raw(
+        xml_bytes, content_type="text/xml", validate_schema=True
+    )
+    assert patient == Patient.parse_raw(xml_bytes, content_type="text/xml")
+    assert (
+        Patient.parse_file(STATIC_PATH / "Patient-with-ext.xml", validate_schema=True)
+        == patient
+    )
+    invalid = xml_bytes.replace(b"<gender", b'<unknown value="x"/><gender', 1)
+    with pytest.raises(ValidationError) as exc_info:
+        Patient.parse_raw(invalid, content_type="text/xml", validate_schema=True)
+    assert "XML schema validation error" in str(exc_info.value)
+    with pytest.raises(ValueError):
+        utils.xml.xml_loads_data(
+            Patient, xml_bytes, lxml.etree.XMLParser(), validate_schema=True
+        )
+
+    # Bundle is validated while parsing incrementally
+    bundle_xml = Bundle(
+        type="collection", entry=[{"resource": patient}, {"resource": patient}]
+    ).xml(return_bytes=True)
+    bundle = Bundle.parse_raw(bundle_xml, content_type="text/xml", validate_schema=True)
+    assert len(bundle.entry) == 2
+    invalid = bundle_xml.replace(b"<resource>", b"<unknown/><resource>", 1)
+    with pytest.raises(ValidationError) as exc_info:
+        Bundle.parse_raw(invalid, content_type="text/xml", validate_schema=True)
+    assert "XML schema validation error" in str(exc_info.value)
+
+
+def test_xml_element_to_dict():
+    """ """
+    xml_bytes = (
+        b'<Patient xmlns="http://hl7.org/fhir"><!--c0--><active value="true"/>'
+        b'<name id="n1"><!--c1--><given id="g"><extension url="u">'
+        b'<valueString value="x"/></extension></given><given value="B"/>'
+        b'<given><extension url="u2"><valueDecimal value="1.50"/></extension>'
+        b'</given></name><multipleBirthInteger value="2"/><!--r1--><contained>'
+        b'<Organization><id value="o"/></Organization></contained></Patient>'
+    )
+    data = utils.xml.xml_element_to_dict(Patient, lxml.etree.fromstring(xml_bytes))
+    # same as json representation
+    assert data == {
+        "resourceType": "Patient",
+        "active": True,
+        "_active": {"fhir_comments": "c0"},
+        "name": [
+            {
+                "id": "n1",
+                "given": [None, "B", None],
+                "_given": [
+                    {
+                        "fhir_comments": "c1",
+                        "id": "g",
+                        "extension": [{"url": "u", "valueString": "x"}],
+                    },
+                    None,
+                    {"extension": [{"url": "u2", "valueDecimal": Decimal("1.50")}]},
+                ],
+            }
+        ],
+        "multipleBirthInteger": 2,
+        "contained": [
+            {"resourceType": "Organization", "fhir_comments": "r1", "id": "o"}
+        ],
+    }
+    patient = Patient.parse_raw(xml_bytes, content_type="text/xml")
+    assert patient == Patient.parse_obj(data)
+    assert patient.name[0].given__ext[2].extension[0].valueDecimal == Decimal("1.5")
+    trusted = utils.xml.xml_loads(Patient, xml_bytes, validate=False)
+    assert trusted.json() == patient.json()
+
+    # xml document is loaded back the same
+    for path in (
+        STATIC_PATH / "Patient-with-ext.xml",
+        STATIC_PATH / "patient-example-animal(animal).xml",
+    ):
+        patient = Patient.parse_file(path)
+        assert (
+            patient.name
+            == utils.xml.Node.from_element(lxml.etree.fromstring(path.read_bytes()))
+            .to_fhir(Patient)
+            .name
+        )
+        assert (
+            Patient.parse_raw(patient.xml(return_bytes=True), content_type="text/xml")
+            == patient
+        )
+
+    with pytest.raises(ValidationError) as exc_info:
+        Patient.parse_raw(
+            b'<Patient xmlns="http://hl7.org/fhir"><unknown value="x"/></Patient>',
+            content_type="text/xml",
+        )
+    assert "'unknown' is not a valid element of ``Patient``" in str(exc_info.value)
+    with pytest.raises(ValidationError):
+        Patient.parse_raw(
+            b'<Observation xmlns="http://hl7.org/fhir"/>', content_type="text/xml"
+        )